@@ -0,0 +1,49 @@
+"""add composite (user_id, firm_id) index to conversations
+
+Revision ID: o4p5q6r7s8t9
+Revises: n3o4p5q6r7s8
+Create Date: 2025-02-14
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "o4p5q6r7s8t9"
+down_revision: Union[str, None] = "n3o4p5q6r7s8"  # Revises: add_phone_number_pool_table
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Add composite index on (user_id, firm_id) to conversations table.
+
+    Used by ConversationsRepository.count_by_user_id(), which filters by user_id
+    and optionally firm_id; the COUNT(*) can then be served by an index-only scan.
+
+    Built CONCURRENTLY (outside the migration transaction) so the conversations
+    table is not write-locked while the index is created.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_conversations_user_id_firm_id",
+            "conversations",
+            ["user_id", "firm_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the composite index."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_conversations_user_id_firm_id",
+            table_name="conversations",
+            postgresql_concurrently=True,
+        )
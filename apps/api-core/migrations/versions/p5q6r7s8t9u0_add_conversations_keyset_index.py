@@ -0,0 +1,47 @@
+"""add (user_id, created_at, id) keyset pagination index to conversations
+
+Revision ID: p5q6r7s8t9u0
+Revises: o4p5q6r7s8t9
+Create Date: 2025-02-14
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "p5q6r7s8t9u0"
+down_revision: Union[str, None] = "o4p5q6r7s8t9"  # Revises: add_conversations_user_firm_index
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Add index on (user_id, created_at DESC, id DESC) to conversations table.
+
+    Used by ConversationsRepository.get_by_user_id(), which lists a user's
+    conversations newest first and pages with a (created_at, id) keyset seek.
+    The index serves both the ordering and the seek without scanning skipped rows.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_conversations_user_id_created_at_id",
+            "conversations",
+            ["user_id", sa.text("created_at DESC"), sa.text("id DESC")],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the keyset pagination index."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_conversations_user_id_created_at_id",
+            table_name="conversations",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,49 @@
+"""add partial index on available phone_number_pool rows
+
+Revision ID: q6r7s8t9u0v1
+Revises: p5q6r7s8t9u0
+Create Date: 2025-02-14
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "q6r7s8t9u0v1"
+down_revision: Union[str, None] = "p5q6r7s8t9u0"  # Revises: add_conversations_keyset_index
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Add partial index on phone_number_pool(id) WHERE status = 'available'.
+
+    Used by PhoneNumberPoolRepository.get_available_for_update(), which claims
+    available numbers in id order with FOR UPDATE SKIP LOCKED. The index only
+    holds claimable rows, so the claim is an index-range pick rather than a scan
+    over assigned numbers.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_phone_number_pool_available",
+            "phone_number_pool",
+            ["id"],
+            unique=False,
+            postgresql_where=sa.text("status = 'available'"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the partial index."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_phone_number_pool_available",
+            table_name="phone_number_pool",
+            postgresql_concurrently=True,
+        )
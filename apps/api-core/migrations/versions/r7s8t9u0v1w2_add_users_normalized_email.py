@@ -0,0 +1,79 @@
+"""add normalized_email column and unique index to users
+
+Revision ID: r7s8t9u0v1w2
+Revises: q6r7s8t9u0v1
+Create Date: 2025-02-17
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "r7s8t9u0v1w2"
+down_revision: Union[str, None] = "q6r7s8t9u0v1"  # Revises: add_phone_number_pool_available_index
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Same normalization as api_core.database.models.normalize_email(): lowercase and
+# strip ASCII whitespace (space, \t, \n, \r, \f, \v); trim() alone only strips spaces
+_NORMALIZED_EMAIL = "lower(btrim(email, E' \\t\\n\\r\\f\\x0b'))"
+
+
+def upgrade() -> None:
+    """
+    Add users.normalized_email (lowercased, whitespace-trimmed email) with a unique index.
+
+    UserRepository.get_by_email() looks users up on this column on every auth
+    request; the unique index makes that a single index seek and rejects
+    case-variant duplicates of the same address. Existing rows are backfilled
+    before the column is made NOT NULL; the index is built concurrently.
+
+    Users whose emails differ only in case or surrounding whitespace can't be
+    merged automatically (each owns its own data), so the migration aborts before
+    changing anything if any exist; resolve them by hand and re-run.
+    """
+    duplicates = op.get_bind().execute(
+        sa.text(
+            f"SELECT {_NORMALIZED_EMAIL} AS normalized, count(*) FROM users "
+            f"GROUP BY {_NORMALIZED_EMAIL} HAVING count(*) > 1 ORDER BY 1"
+        )
+    ).fetchall()
+    if duplicates:
+        listed = ", ".join(f"{email} ({count} users)" for email, count in duplicates)
+        raise RuntimeError(
+            "Cannot add a unique index on users.normalized_email: these emails belong "
+            f"to more than one user once lowercased and trimmed: {listed}. "
+            "Merge or rename the duplicate accounts and re-run the migration."
+        )
+
+    op.add_column(
+        "users",
+        sa.Column("normalized_email", sa.String(length=255), nullable=True),
+    )
+    op.execute(f"UPDATE users SET normalized_email = {_NORMALIZED_EMAIL}")
+    op.alter_column("users", "normalized_email", nullable=False)
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_normalized_email",
+            "users",
+            ["normalized_email"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the index and column."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_users_normalized_email",
+            table_name="users",
+            postgresql_concurrently=True,
+        )
+    op.drop_column("users", "normalized_email")
@@ -0,0 +1,73 @@
+"""add unique indexes on agent_configs user/firm
+
+Revision ID: s8t9u0v1w2x3
+Revises: r7s8t9u0v1w2
+Create Date: 2025-02-18
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "s8t9u0v1w2x3"
+down_revision: Union[str, None] = "r7s8t9u0v1w2"  # Revises: add_users_normalized_email
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Add partial unique indexes on agent_configs(user_id, firm_id) and (user_id).
+
+    AgentRepository.create_or_update() upserts with INSERT ... ON CONFLICT, which
+    needs a unique index per conflict target: one for firm-specific configs and one
+    for the user's firm-less default (NULL firm_ids never conflict in a composite
+    index). Duplicate rows left by the old read-then-insert path are removed first,
+    keeping the most recently updated config per key.
+    """
+    op.execute(
+        """
+        DELETE FROM agent_configs a
+        USING agent_configs b
+        WHERE a.user_id = b.user_id
+          AND a.firm_id IS NOT DISTINCT FROM b.firm_id
+          AND (a.updated_at, a.id) < (b.updated_at, b.id)
+        """
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_agent_configs_user_id_firm_id",
+            "agent_configs",
+            ["user_id", "firm_id"],
+            unique=True,
+            postgresql_where=sa.text("firm_id IS NOT NULL"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "uq_agent_configs_user_id_default",
+            "agent_configs",
+            ["user_id"],
+            unique=True,
+            postgresql_where=sa.text("firm_id IS NULL"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the unique indexes (removed duplicate rows are not restored)."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "uq_agent_configs_user_id_default",
+            table_name="agent_configs",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "uq_agent_configs_user_id_firm_id",
+            table_name="agent_configs",
+            postgresql_concurrently=True,
+        )
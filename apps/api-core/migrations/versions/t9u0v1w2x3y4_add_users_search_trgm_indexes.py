@@ -0,0 +1,65 @@
+"""add pg_trgm GIN indexes on users email and name
+
+Revision ID: t9u0v1w2x3y4
+Revises: s8t9u0v1w2x3
+Create Date: 2025-02-18
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "t9u0v1w2x3y4"
+down_revision: Union[str, None] = "s8t9u0v1w2x3"  # Revises: add_agent_configs_unique_indexes
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Add trigram GIN indexes on users(email) and users(name).
+
+    UserRepository.search_users() matches ``email ILIKE '%q%' OR name ILIKE '%q%'``.
+    Unanchored patterns can't use a btree index, so without these every admin
+    search scans the whole users table; with them Postgres answers each side of
+    the OR from a trigram index and combines the results with a BitmapOr.
+    """
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_email_trgm",
+            "users",
+            ["email"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_users_name_trgm",
+            "users",
+            ["name"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the trigram indexes (the pg_trgm extension is left installed)."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_users_name_trgm",
+            table_name="users",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_users_email_trgm",
+            table_name="users",
+            postgresql_concurrently=True,
+        )
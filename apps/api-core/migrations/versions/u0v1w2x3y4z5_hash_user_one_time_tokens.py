@@ -0,0 +1,63 @@
+"""store hashed password reset and email verification tokens, with unique indexes
+
+Revision ID: u0v1w2x3y4z5
+Revises: t9u0v1w2x3y4
+Create Date: 2025-02-19
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "u0v1w2x3y4z5"
+down_revision: Union[str, None] = "t9u0v1w2x3y4"  # Revises: add_users_search_trgm_indexes
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TOKEN_COLUMNS = ("password_reset_token", "email_verification_token")
+
+
+def upgrade() -> None:
+    """
+    Hash outstanding one-time tokens in place and index both token columns.
+
+    UserRepository now stores sha256(token) as hex (hash_token()) and looks tokens
+    up by that digest, so the users table no longer holds the raw tokens (the
+    emailed link itself is still queued in notifications.message). Existing
+    plaintext tokens are converted with the same digest so links already sent
+    keep working. The unique indexes turn the per-click token lookups, which
+    were sequential scans, into index seeks.
+    """
+    for column in _TOKEN_COLUMNS:
+        op.execute(
+            f"UPDATE users SET {column} = encode(sha256(convert_to({column}, 'UTF8')), 'hex') "
+            f"WHERE {column} IS NOT NULL"
+        )
+
+    with op.get_context().autocommit_block():
+        for column in _TOKEN_COLUMNS:
+            op.create_index(
+                f"ix_users_{column}",
+                "users",
+                [column],
+                unique=True,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    """Drop the indexes and clear outstanding tokens (digests can't be reversed)."""
+    with op.get_context().autocommit_block():
+        for column in reversed(_TOKEN_COLUMNS):
+            op.drop_index(
+                f"ix_users_{column}",
+                table_name="users",
+                postgresql_concurrently=True,
+            )
+    op.execute(
+        "UPDATE users SET password_reset_token = NULL, password_reset_expires_at = NULL, "
+        "email_verification_token = NULL"
+    )
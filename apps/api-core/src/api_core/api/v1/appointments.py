@@ -10,9 +10,10 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from api_core.auth.dependencies import get_current_active_user
@@ -26,7 +27,7 @@ from api_core.models.appointments import (
     AvailabilityRequest,
     AvailabilityResponse,
 )
-from api_core.services.appointments_service import get_appointments_service, get_appointments_service_for_session
+from api_core.services.appointments_service import get_appointments_service_for_session
 from api_core.services.calendar_integration_service import CalendarIntegrationService
 
 logger = logging.getLogger(__name__)
@@ -34,6 +35,20 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/appointments", tags=["appointments"])
 
 
+def _json_response(model: BaseModel, status_code: int = status.HTTP_200_OK) -> Response:
+    """
+    Serialize a response model straight to JSON with pydantic-core.
+
+    Returning a Response skips FastAPI's re-validation of the model and its
+    jsonable_encoder + json.dumps pass; ``response_model`` still documents the shape.
+    """
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
 @router.post(
     "/availability",
     response_model=AvailabilityResponse,
@@ -46,19 +61,21 @@ router = APIRouter(prefix="/appointments", tags=["appointments"])
     dependencies=[InternalAuthDep],
     include_in_schema=False,
 )
-async def check_availability(request: AvailabilityRequest) -> AvailabilityResponse:
+async def check_availability(request: AvailabilityRequest) -> Response:
     """
     Return candidate slots in the requested window.
 
-    This MVP implementation applies simple business-hour rules (Mon–Fri, 9–5 local time).
+    This MVP implementation applies simple business-hour rules (Mon–Fri, 9–5 local time)
+    and leaves out slots overlapping the firm's existing bookings.
     
     **Authentication**: Internal API key only (via InternalAuthDep)
     **Used by**: Cognitive Orchestrator (tool: check_availability)
     **Note**: This endpoint is not accessible to users. It requires the X-Internal-API-Key header.
     """
-    service = get_appointments_service()
     try:
-        return service.get_availability(request)
+        async with get_session_context() as session:
+            service = get_appointments_service_for_session(session)
+            return _json_response(await service.get_open_availability(request))
     except Exception as e:
         logger.error(f"Availability check failed: {e}", exc_info=True)
         # Avoid leaking details; Orchestrator will surface a friendly message
@@ -77,7 +94,7 @@ async def check_availability(request: AvailabilityRequest) -> AvailabilityRespon
     dependencies=[InternalAuthDep],
     include_in_schema=False,
 )
-async def book_appointment(request: AppointmentCreateRequest) -> AppointmentResponse:
+async def book_appointment(request: AppointmentCreateRequest) -> Response:
     """
     Book an appointment (idempotent via idempotency_key).
     
@@ -87,7 +104,8 @@ async def book_appointment(request: AppointmentCreateRequest) -> AppointmentResp
     """
     async with get_session_context() as session:
         service = get_appointments_service_for_session(session)
-        return await service.book_appointment(request)
+        appointment = await service.book_appointment(request)
+    return _json_response(appointment, status_code=status.HTTP_201_CREATED)
 
 
 # User-facing endpoints for Phase 5
@@ -261,6 +279,54 @@ async def list_appointments(
         ) from e
 
 
+@router.get(
+    "/stream",
+    status_code=status.HTTP_200_OK,
+    summary="Stream appointments",
+    description="Stream appointments for the authenticated user as NDJSON (one appointment per line).",
+)
+async def stream_appointments(
+    startDate: Optional[datetime] = Query(None, description="Start date filter (ISO8601)"),
+    endDate: Optional[datetime] = Query(None, description="End date filter (ISO8601)"),
+    clientsOnly: bool = Query(
+        True,
+        description="If true, only return appointments created through LexiqAI (exclude calendar events). Defaults to true.",
+    ),
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    current_user: TokenValidationResult = Depends(get_current_active_user),
+):
+    """
+    Stream appointments for the authenticated user.
+
+    Same filters as ``GET /appointments``, but each appointment is written as one
+    ``FrontendAppointment`` JSON line as soon as it is read from the database.
+    """
+    firm_id = getattr(current_user, "firm_id", None) or None
+
+    async def appointment_lines() -> AsyncIterator[str]:
+        # The body is produced after this handler returns, so the session has to
+        # be opened inside the generator rather than around it.
+        try:
+            async with get_session_context() as session:
+                service = get_appointments_service_for_session(session)
+                async for apt in service.iter_user_appointments(
+                    user_id=current_user.user_id,
+                    firm_id=firm_id,
+                    start_date=startDate,
+                    end_date=endDate,
+                    clients_only=clientsOnly,
+                    skip=skip,
+                    limit=limit,
+                ):
+                    yield _appointment_to_frontend(apt).model_dump_json() + "\n"
+        except Exception as e:
+            # Headers are already sent; all we can do is end the stream early
+            logger.error(f"Error streaming appointments: {e}", exc_info=True)
+
+    return StreamingResponse(appointment_lines(), media_type="application/x-ndjson")
+
+
 @router.get(
     "/integrations",
     response_model=IntegrationStatusResponse,
@@ -30,6 +30,9 @@ async def list_conversations(
     firm_id: Optional[str] = Query(None, description="Filter by firm ID"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from a previous page's next_cursor (overrides skip)"
+    ),
     current_user: TokenValidationResult = Depends(get_current_active_user),
 ) -> ConversationListResponse:
     """List conversations for the authenticated user."""
@@ -37,7 +40,11 @@ async def list_conversations(
         async with get_session_context() as session:
             service = get_conversations_service(session)
             return await service.list_conversations(
-                user_id=current_user.user_id, firm_id=firm_id, skip=skip, limit=limit
+                user_id=current_user.user_id,
+                firm_id=firm_id,
+                skip=skip,
+                limit=limit,
+                cursor=cursor,
             )
     except ValidationError as e:
         raise HTTPException(
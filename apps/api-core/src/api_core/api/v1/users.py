@@ -1,9 +1,10 @@
 """User management endpoints."""
 
 import logging
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 
 from api_core.auth.dependencies import get_current_active_user, require_permissions
 from api_core.auth.token_validator import TokenValidationResult
@@ -229,6 +230,45 @@ async def terminate_current_user_account(
         )
 
 
+@router.get("/stream", status_code=status.HTTP_200_OK)
+async def stream_users(
+    query: Optional[str] = Query(None, description="Search query (name or email)"),
+    is_active: Optional[bool] = Query(None, description="Filter by active status"),
+    is_verified: Optional[bool] = Query(None, description="Filter by verified status"),
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    current_user: TokenValidationResult = Depends(require_permissions(["admin:read"])),
+):
+    """
+    Stream users matching the filters as NDJSON (admin only).
+
+    Same filters as ``GET /users``, but each user is written as one
+    ``UserResponse`` JSON line as soon as it is read from the database, so large
+    pages are never buffered. No total is included.
+    Requires admin permissions.
+    """
+
+    async def user_lines() -> AsyncIterator[str]:
+        # The body is produced after this handler returns, so the session has to
+        # be opened inside the generator rather than around it.
+        try:
+            async with get_session_context() as session:
+                user_service = get_user_service(session)
+                async for user in user_service.iter_search_users(
+                    query=query,
+                    is_active=is_active,
+                    is_verified=is_verified,
+                    skip=skip,
+                    limit=limit,
+                ):
+                    yield user.model_dump_json() + "\n"
+        except Exception as e:
+            # Headers are already sent; all we can do is end the stream early
+            logger.error(f"Error streaming users: {e}", exc_info=True)
+
+    return StreamingResponse(user_lines(), media_type="application/x-ndjson")
+
+
 @router.get(
     "/{user_id}",
     response_model=UserResponse,
@@ -293,8 +333,8 @@ async def list_users(
         async with get_session_context() as session:
             user_service = get_user_service(session)
 
-            # Search users
-            users = await user_service.search_users(
+            # Search users (page and total come from the same query)
+            users, total = await user_service.search_users(
                 query=query,
                 is_active=is_active,
                 is_verified=is_verified,
@@ -302,22 +342,6 @@ async def list_users(
                 limit=limit,
             )
 
-            # Get total count (simplified - count all if no filters)
-            # Note: For query-based search, we'd need a more complex count query
-            # For now, we'll use the length of results as an approximation
-            if query:
-                # If there's a query, we can't easily count without running the search
-                # So we'll approximate with the result count
-                total = len(users)
-            else:
-                # Count with filters
-                filters = {}
-                if is_active is not None:
-                    filters["is_active"] = is_active
-                if is_verified is not None:
-                    filters["is_verified"] = is_verified
-                total = await user_service.repository.count(filters if filters else None)
-
             # Get full user models for UserResponse
             db_users = []
             for user_profile in users:
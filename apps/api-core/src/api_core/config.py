@@ -26,8 +26,12 @@ class DatabaseSettings(BaseSettings):
     pool_size: int = Field(default=10, description="Connection pool size")
     max_overflow: int = Field(default=20, description="Maximum pool overflow")
     pool_timeout: int = Field(default=30, description="Pool timeout in seconds")
-    pool_recycle: int = Field(default=3600, description="Pool recycle time in seconds")
+    pool_recycle: int = Field(default=1800, description="Pool recycle time in seconds")
     echo: bool = Field(default=False, description="Echo SQL queries (for debugging)")
+    query_cache_size: int = Field(
+        default=1200,
+        description="Size of the engine's compiled-statement LRU cache (0 disables caching)",
+    )
 
     @field_validator("url")
     @classmethod
@@ -260,6 +264,18 @@ class JWTSettings(BaseSettings):
         return v
 
 
+class PasswordHashSettings(BaseSettings):
+    """Argon2id password hashing cost configuration."""
+
+    model_config = SettingsConfigDict(env_prefix="PASSWORD_HASH_", case_sensitive=False)
+
+    time_cost: int = Field(default=2, ge=1, description="Argon2id iterations")
+    memory_cost_kib: int = Field(
+        default=19 * 1024, ge=8, description="Argon2id memory cost in KiB"
+    )
+    parallelism: int = Field(default=1, ge=1, description="Argon2id lanes")
+
+
 class CorsSettings(BaseSettings):
     """CORS configuration."""
 
@@ -477,6 +493,7 @@ class Settings(BaseSettings):
     storage: StorageSettings = Field(default_factory=StorageSettings)
     qdrant: QdrantSettings = Field(default_factory=QdrantSettings)
     jwt: JWTSettings = Field(default_factory=JWTSettings)
+    password_hash: PasswordHashSettings = Field(default_factory=PasswordHashSettings)
     cors: CorsSettings = Field(default_factory=CorsSettings)
     server: ServerSettings = Field(default_factory=ServerSettings)
     google: GoogleSettings = Field(default_factory=GoogleSettings)
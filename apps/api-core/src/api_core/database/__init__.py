@@ -33,6 +33,7 @@ from api_core.database.session import (
     get_session_context,
     get_session_factory,
     init_db,
+    warm_up_db,
 )
 
 __all__ = [
@@ -66,5 +67,6 @@ __all__ = [
     "get_session_context",
     "get_session_factory",
     "init_db",
+    "warm_up_db",
     "close_db",
 ]
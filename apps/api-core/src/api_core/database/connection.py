@@ -5,6 +5,7 @@ from typing import Optional
 
 from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from api_core.config import get_settings
 
@@ -34,16 +35,17 @@ def create_engine() -> AsyncEngine:
     db_url = get_database_url()
 
     # Connection pool configuration for async engines
-    # For async engines, we use NullPool or AsyncAdaptedQueuePool
-    # AsyncAdaptedQueuePool is the default for asyncpg, so we don't need to specify it
     pool_config = {
+        "poolclass": AsyncAdaptedQueuePool,
         "pool_size": settings.database.pool_size,
         "max_overflow": settings.database.max_overflow,
         "pool_timeout": settings.database.pool_timeout,
         "pool_recycle": settings.database.pool_recycle,
         "pool_pre_ping": True,  # Verify connections before using them
-        # Don't specify poolclass - asyncpg uses AsyncAdaptedQueuePool by default
         "echo": settings.database.echo,  # Log SQL queries in debug mode
+        # Compiled-statement cache: repository statements are fixed-shape selects with
+        # bound parameters, so each one compiles once and is reused from this LRU cache
+        "query_cache_size": settings.database.query_cache_size,
     }
 
     # For Azure PostgreSQL, asyncpg automatically uses AsyncAdaptedQueuePool
@@ -54,8 +56,6 @@ def create_engine() -> AsyncEngine:
         logger.info("Using async connection pooling for production")
 
     # Create async engine
-    # Note: For async engines, SQLAlchemy automatically uses AsyncAdaptedQueuePool
-    # when using asyncpg, so we don't need to specify poolclass
     engine = create_async_engine(
         db_url,
         **pool_config,
@@ -68,7 +68,9 @@ def create_engine() -> AsyncEngine:
 
     logger.info(
         f"Database engine created: pool_size={pool_config['pool_size']}, "
-        f"max_overflow={pool_config['max_overflow']}"
+        f"max_overflow={pool_config['max_overflow']}, "
+        f"pool_recycle={pool_config['pool_recycle']}s, "
+        f"query_cache_size={pool_config['query_cache_size']}"
     )
 
     return engine
@@ -1,5 +1,6 @@
 """SQLAlchemy database models."""
 
+import hashlib
 import uuid
 from datetime import datetime
 from typing import Optional
@@ -8,12 +9,28 @@ from sqlalchemy import (
     Boolean,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
     Text,
+    text,
 )
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship, validates
+
+# Characters trimmed from emails; kept to the ASCII set so the SQL backfill in
+# migration r7s8t9u0v1w2 (btrim) produces the same normalized_email values
+_EMAIL_WHITESPACE = " \t\n\r\f\v"
+
+
+def normalize_email(email: str) -> str:
+    """Return the canonical form of an email address used for lookups."""
+    return email.lower().strip(_EMAIL_WHITESPACE)
+
+
+def hash_token(token: str) -> str:
+    """Return the SHA-256 hex digest stored (and looked up) in place of a one-time token."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
 
 
 class Base(DeclarativeBase):
@@ -37,6 +54,10 @@ class User(Base):
 
     # Authentication fields
     email: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
+    # lower(trim(email)); unique so case variants of one address can't both exist
+    normalized_email: Mapped[str] = mapped_column(
+        String(255), unique=True, index=True, nullable=False
+    )
     hashed_password: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
 
     # User profile fields
@@ -70,12 +91,16 @@ class User(Base):
     failed_login_attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     locked_until: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
-    # Email verification
-    email_verification_token: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    # Email verification (token columns hold hash_token() digests, never the raw token)
+    email_verification_token: Mapped[Optional[str]] = mapped_column(
+        String(255), unique=True, index=True, nullable=True
+    )
     email_verified_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
     # Password reset
-    password_reset_token: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    password_reset_token: Mapped[Optional[str]] = mapped_column(
+        String(255), unique=True, index=True, nullable=True
+    )
     password_reset_expires_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
@@ -127,6 +152,12 @@ class User(Base):
         "CalendarIntegration", back_populates="user", cascade="all, delete-orphan"
     )
 
+    @validates("email")
+    def _sync_normalized_email(self, key: str, email: str) -> str:
+        """Keep normalized_email in step with every assignment to email."""
+        self.normalized_email = normalize_email(email)
+        return email
+
     def __repr__(self) -> str:
         """String representation of User."""
         return f"<User(id={self.id}, email={self.email}, name={self.name})>"
@@ -724,6 +755,27 @@ class AgentConfig(Base):
     user: Mapped["User"] = relationship("User", back_populates="agent_configs")
     firm: Mapped[Optional["Firm"]] = relationship("Firm")
 
+    # One config per (user, firm) and one firm-less default per user. NULL firm_ids
+    # never conflict in a plain composite unique index, hence two partial indexes;
+    # both are the conflict targets of AgentRepository.create_or_update().
+    __table_args__ = (
+        Index(
+            "uq_agent_configs_user_id_firm_id",
+            "user_id",
+            "firm_id",
+            unique=True,
+            postgresql_where=text("firm_id IS NOT NULL"),
+            sqlite_where=text("firm_id IS NOT NULL"),
+        ),
+        Index(
+            "uq_agent_configs_user_id_default",
+            "user_id",
+            unique=True,
+            postgresql_where=text("firm_id IS NULL"),
+            sqlite_where=text("firm_id IS NULL"),
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<AgentConfig(id={self.id}, user_id={self.user_id}, firm_id={self.firm_id})>"
 
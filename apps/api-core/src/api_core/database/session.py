@@ -6,6 +6,7 @@ from typing import AsyncGenerator, Optional
 
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import configure_mappers
 
 from api_core.database.connection import get_engine
 
@@ -100,6 +101,31 @@ async def init_db() -> None:
         raise
 
 
+async def warm_up_db() -> None:
+    """
+    Do first-request database work at startup instead of inside the first request.
+
+    Configures the ORM mappers and runs the per-request user lookups once with a
+    value that matches no row, which opens a pooled connection (running the
+    dialect's first-connect initialization) and puts the compiled SQL for those
+    statements in the engine's statement cache. Failures are logged, not raised:
+    warm-up is an optimization and must not block startup.
+    """
+    from api_core.repositories.user_repository import UserRepository
+
+    try:
+        configure_mappers()
+        async with get_session_factory()() as session:
+            users = UserRepository(session)
+            await users.get_by_email("")
+            await users.get_by_azure_ad_object_id("")
+            await users.get_by_google_id("")
+            await session.rollback()
+        logger.info("Database warm-up complete")
+    except Exception as e:
+        logger.warning(f"Database warm-up failed: {e}")
+
+
 async def close_db() -> None:
     """Close database connections."""
     try:
@@ -17,7 +17,7 @@ from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from api_core.config import get_settings
-from api_core.database import close_db, init_db
+from api_core.database import close_db, init_db, warm_up_db
 from api_core.exceptions import APIException
 from api_core.middleware import setup_middleware
 from api_core.services.ingestion_queue import publisher as ingestion_publisher
@@ -48,6 +48,8 @@ async def lifespan(app: FastAPI):
         logger.info("Initializing database connection...")
         await init_db()
         logger.info("Database connection initialized successfully")
+        # Compile hot statements and open a pooled connection before traffic arrives
+        await warm_up_db()
 
         # Redis connection initialization
         # Note: Redis is currently used lazily (on-demand connections)
@@ -44,4 +44,7 @@ class ConversationListResponse(BaseModel):
 
     conversations: List[ConversationResponse]
     total: int
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque cursor for the next page (absent on the last page)"
+    )
 
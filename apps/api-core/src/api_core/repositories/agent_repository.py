@@ -1,18 +1,31 @@
 """Agent configuration repository."""
 
 import logging
+from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import select, text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api_core.database.models import AgentConfig
 from api_core.exceptions import DatabaseError
-from api_core.repositories.base import BaseRepository
+from api_core.repositories.base import BaseRepository, upsert_insert
 
 logger = logging.getLogger(__name__)
 
+# Settings copied from a user's default config when a firm config is first created
+_CONFIG_SETTING_FIELDS = (
+    "voice_id",
+    "greeting_script",
+    "closing_script",
+    "transfer_script",
+    "auto_respond",
+    "record_calls",
+    "auto_transcribe",
+    "enable_voicemail",
+)
+
 
 class AgentRepository(BaseRepository[AgentConfig]):
     """Repository for agent configuration operations."""
@@ -66,8 +79,11 @@ class AgentRepository(BaseRepository[AgentConfig]):
         """
         Create or update agent configuration.
         
-        If a config exists for the user/firm combination, update it.
-        Otherwise, create a new one.
+        Issues a single ``INSERT ... ON CONFLICT DO UPDATE ... RETURNING`` against the
+        config for exactly this user/firm combination (``firm_id=None`` is the user's
+        default config). A new firm config starts from the user's default config, the
+        one ``get_by_user_id`` resolved until now, so a partial update doesn't reset
+        the other settings; otherwise a new row gets column defaults for fields not given.
         
         Args:
             user_id: User ID
@@ -78,27 +94,41 @@ class AgentRepository(BaseRepository[AgentConfig]):
             AgentConfig instance
         """
         try:
-            # Try to get existing config
-            existing = await self.get_by_user_id(user_id, firm_id)
-            
-            if existing:
-                # Update existing config
-                for key, value in kwargs.items():
-                    if hasattr(existing, key):
-                        setattr(existing, key, value)
-                await self.session.commit()
-                await self.session.refresh(existing)
-                return existing
+            values = {key: value for key, value in kwargs.items() if hasattr(AgentConfig, key)}
+            insert_values = values
+            if firm_id is not None:
+                resolved = await self.get_by_user_id(user_id, firm_id)
+                if resolved is not None and resolved.firm_id is None:
+                    insert_values = {
+                        **{field: getattr(resolved, field) for field in _CONFIG_SETTING_FIELDS},
+                        **values,
+                    }
+            stmt = upsert_insert(self.session, AgentConfig).values(
+                user_id=user_id, firm_id=firm_id, **insert_values
+            )
+            # Conflict target is the partial unique index matching this firm_id
+            if firm_id is not None:
+                conflict_target = {
+                    "index_elements": [AgentConfig.user_id, AgentConfig.firm_id],
+                    "index_where": text("firm_id IS NOT NULL"),
+                }
             else:
-                # Create new config
-                config_data = {
-                    "user_id": user_id,
-                    "firm_id": firm_id,
-                    **kwargs
+                conflict_target = {
+                    "index_elements": [AgentConfig.user_id],
+                    "index_where": text("firm_id IS NULL"),
                 }
-                return await self.create(**config_data)
+            # ON CONFLICT updates skip Python-side onupdate, so set updated_at here.
+            # With no fields to change this still returns the existing row.
+            stmt = stmt.on_conflict_do_update(
+                **conflict_target,
+                set_={**values, "updated_at": datetime.utcnow()},
+            ).returning(AgentConfig)
+
+            result = await self.session.execute(
+                stmt, execution_options={"populate_existing": True}
+            )
+            return result.scalar_one()
         except SQLAlchemyError as e:
             logger.error(f"Error creating/updating agent config for user {user_id}, firm {firm_id}: {e}")
             await self.session.rollback()
             raise DatabaseError("Failed to save agent configuration") from e
-
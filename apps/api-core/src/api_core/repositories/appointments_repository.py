@@ -4,9 +4,9 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import Select, bindparam, or_, select, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -16,6 +16,23 @@ from api_core.repositories.base import BaseRepository
 
 logger = logging.getLogger(__name__)
 
+_APPOINTMENT_BY_IDEMPOTENCY_KEY = select(Appointment).where(
+    Appointment.idempotency_key == bindparam("idempotency_key")
+)
+_BUSY_INTERVALS_FOR_FIRM = (
+    select(Appointment.start_at, Appointment.end_at)
+    .where(
+        Appointment.firm_id == bindparam("firm_id"),
+        Appointment.status != "cancelled",
+        Appointment.start_at < bindparam("window_end"),
+        Appointment.end_at > bindparam("window_start"),
+    )
+    .order_by(Appointment.start_at.asc())
+)
+
+# Rows fetched per round trip when streaming a user's appointments
+_APPOINTMENT_STREAM_BATCH_SIZE = 100
+
 
 class AppointmentsRepository(BaseRepository[Appointment]):
     """Repository for appointment data access operations."""
@@ -27,13 +44,115 @@ class AppointmentsRepository(BaseRepository[Appointment]):
         """Return an appointment by idempotency key (if exists)."""
         try:
             result = await self.session.execute(
-                select(Appointment).where(Appointment.idempotency_key == idempotency_key)
+                _APPOINTMENT_BY_IDEMPOTENCY_KEY, {"idempotency_key": idempotency_key}
             )
             return result.scalar_one_or_none()
         except SQLAlchemyError as e:
             logger.error(f"Error getting appointment by idempotency_key: {e}")
             raise DatabaseError("Failed to retrieve appointment") from e
 
+    async def get_busy_between(
+        self, firm_id: str, window_start: datetime, window_end: datetime
+    ) -> Sequence[Tuple[datetime, datetime]]:
+        """
+        Get the (start_at, end_at) of a firm's non-cancelled appointments overlapping a window.
+
+        Args:
+            firm_id: Firm ID
+            window_start: Start of the window
+            window_end: End of the window
+
+        Returns:
+            Busy intervals ordered by start_at
+        """
+        try:
+            result = await self.session.execute(
+                _BUSY_INTERVALS_FOR_FIRM,
+                {"firm_id": firm_id, "window_start": window_start, "window_end": window_end},
+            )
+            return result.tuples().all()
+        except SQLAlchemyError as e:
+            logger.error("Error getting busy intervals for firm %s: %s", firm_id, e)
+            raise DatabaseError("Failed to retrieve appointments") from e
+
+    async def update_authorized(
+        self, appointment_id: str, user_id: str, **values
+    ) -> Optional[Appointment]:
+        """
+        Update an appointment the user may modify, in one ``UPDATE ... RETURNING``.
+
+        The access rule (the user created it, or it belongs to a firm) is part of the
+        WHERE clause, so no separate read is needed. Any Appointment already in the
+        session is refreshed from the returned row.
+
+        Args:
+            appointment_id: Appointment ID
+            user_id: User ID requesting the change
+            **values: Column values to set
+
+        Returns:
+            Updated appointment, or None if it doesn't exist or the user may not modify it
+        """
+        try:
+            result = await self.session.execute(
+                update(Appointment)
+                .where(
+                    Appointment.id == appointment_id,
+                    or_(
+                        Appointment.created_by_user_id == user_id,
+                        Appointment.firm_id.is_not(None),
+                    ),
+                )
+                .values(**values)
+                .returning(Appointment),
+                execution_options={"populate_existing": True},
+            )
+            return result.scalar_one_or_none()
+        except SQLAlchemyError as e:
+            logger.error("Error updating appointment %s: %s", appointment_id, e)
+            await self.session.rollback()
+            raise DatabaseError("Failed to update appointment") from e
+
+    @staticmethod
+    def _user_appointments_query(
+        user_id: str,
+        firm_id: Optional[str],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        clients_only: bool,
+    ) -> Select:
+        """Build the filtered, start-ordered SELECT behind the user appointment listings."""
+        query = select(Appointment)
+
+        # Filter by user (created_by_user_id) or firm
+        # Include appointments that match either firm_id OR created_by_user_id
+        conditions = []
+        if firm_id:
+            conditions.append(Appointment.firm_id == firm_id)
+        if user_id:
+            conditions.append(Appointment.created_by_user_id == user_id)
+
+        if conditions:
+            # Use OR logic if both conditions exist, otherwise use the single condition
+            if len(conditions) > 1:
+                query = query.where(or_(*conditions))
+            else:
+                query = query.where(conditions[0])
+
+        # Filter by source: if clients_only=True, only show LexiqAI-created appointments
+        # (appointments where source_calendar_id IS NULL)
+        if clients_only:
+            query = query.where(Appointment.source_calendar_id.is_(None))
+
+        # Date range filters
+        if start_date:
+            query = query.where(Appointment.start_at >= start_date)
+        if end_date:
+            query = query.where(Appointment.start_at <= end_date)
+
+        # Order by start_at ascending
+        return query.order_by(Appointment.start_at.asc())
+
     async def get_by_user_id(
         self,
         user_id: str,
@@ -60,38 +179,9 @@ class AppointmentsRepository(BaseRepository[Appointment]):
             List of appointments
         """
         try:
-            from sqlalchemy import or_
-            
-            query = select(Appointment)
-            
-            # Filter by user (created_by_user_id) or firm
-            # Include appointments that match either firm_id OR created_by_user_id
-            conditions = []
-            if firm_id:
-                conditions.append(Appointment.firm_id == firm_id)
-            if user_id:
-                conditions.append(Appointment.created_by_user_id == user_id)
-            
-            if conditions:
-                # Use OR logic if both conditions exist, otherwise use the single condition
-                if len(conditions) > 1:
-                    query = query.where(or_(*conditions))
-                else:
-                    query = query.where(conditions[0])
-            
-            # Filter by source: if clients_only=True, only show LexiqAI-created appointments
-            # (appointments where source_calendar_id IS NULL)
-            if clients_only:
-                query = query.where(Appointment.source_calendar_id.is_(None))
-            
-            # Date range filters
-            if start_date:
-                query = query.where(Appointment.start_at >= start_date)
-            if end_date:
-                query = query.where(Appointment.start_at <= end_date)
-            
-            # Order by start_at ascending
-            query = query.order_by(Appointment.start_at.asc())
+            query = self._user_appointments_query(
+                user_id, firm_id, start_date, end_date, clients_only
+            )
             
             # Pagination
             query = query.offset(skip).limit(limit)
@@ -102,4 +192,34 @@ class AppointmentsRepository(BaseRepository[Appointment]):
             logger.error(f"Error getting appointments for user {user_id}: {e}")
             raise DatabaseError("Failed to retrieve appointments") from e
 
+    async def iter_by_user_id(
+        self,
+        user_id: str,
+        firm_id: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        clients_only: bool = False,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> AsyncIterator[Appointment]:
+        """
+        Stream appointments for a user, oldest start first.
+
+        Same filters as get_by_user_id(), but rows are fetched through a server-side
+        cursor in batches and yielded as they arrive.
 
+        Yields:
+            Appointment instances
+        """
+        try:
+            result = await self.session.stream_scalars(
+                self._user_appointments_query(user_id, firm_id, start_date, end_date, clients_only)
+                .offset(skip)
+                .limit(limit)
+                .execution_options(yield_per=_APPOINTMENT_STREAM_BATCH_SIZE)
+            )
+            async for appointment in result:
+                yield appointment
+        except SQLAlchemyError as e:
+            logger.error("Error streaming appointments for user %s: %s", user_id, e)
+            raise DatabaseError("Failed to retrieve appointments") from e
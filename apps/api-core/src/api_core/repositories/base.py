@@ -1,9 +1,11 @@
 """Base repository class with common CRUD operations."""
 
 import logging
-from typing import Generic, List, Optional, Type, TypeVar
+from typing import Any, Generic, List, Optional, Sequence, Tuple, Type, TypeVar
 
-from sqlalchemy import select, update
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -15,6 +17,29 @@ logger = logging.getLogger(__name__)
 # Type variable for the model type
 ModelType = TypeVar("ModelType", bound=Base)
 
+# Hot lookups in the concrete repositories are module-level ``select`` statements
+# built once at import; per-call values are supplied as ``bindparam`` parameters.
+
+
+def upsert_insert(session: AsyncSession, model: Type[Base]):
+    """
+    Build a dialect-specific INSERT that supports ``ON CONFLICT`` clauses.
+
+    PostgreSQL is the production database; SQLite is used by the unit tests. Both
+    dialects expose the same ``on_conflict_do_update`` / ``on_conflict_do_nothing``
+    and ``excluded`` API.
+
+    Args:
+        session: Async database session (used to detect the dialect)
+        model: SQLAlchemy model class to insert into
+
+    Returns:
+        Dialect-specific Insert construct
+    """
+    if session.get_bind().dialect.name == "sqlite":
+        return sqlite_insert(model)
+    return pg_insert(model)
+
 
 class BaseRepository(Generic[ModelType]):
     """Base repository with common CRUD operations."""
@@ -39,12 +64,15 @@ class BaseRepository(Generic[ModelType]):
 
         Returns:
             Model instance or None if not found
+
+        Note:
+            Uses ``Session.get``, so a record already loaded in this session is
+            returned from the identity map without a round-trip.
         """
         try:
-            result = await self.session.execute(select(self.model).where(self.model.id == id))
-            return result.scalar_one_or_none()
+            return await self.session.get(self.model, id)
         except SQLAlchemyError as e:
-            logger.error(f"Error getting {self.model.__name__} by ID {id}: {e}")
+            logger.error("Error getting %s by ID %s: %s", self.model.__name__, id, e)
             raise DatabaseError(f"Failed to retrieve {self.model.__name__}") from e
 
     async def get_all(
@@ -74,7 +102,7 @@ class BaseRepository(Generic[ModelType]):
             result = await self.session.execute(query)
             return list(result.scalars().all())
         except SQLAlchemyError as e:
-            logger.error(f"Error getting all {self.model.__name__}: {e}")
+            logger.error("Error getting all %s: %s", self.model.__name__, e)
             raise DatabaseError(f"Failed to retrieve {self.model.__name__} records") from e
 
     async def create(self, **kwargs) -> ModelType:
@@ -93,19 +121,82 @@ class BaseRepository(Generic[ModelType]):
             await self.session.flush()  # Flush to get the ID and trigger any defaults
             # Don't refresh - it can cause async issues with relationships
             # The instance already has the ID after flush
-            logger.debug(f"Created {self.model.__name__} with ID: {instance.id}")
+            logger.debug("Created %s with ID: %s", self.model.__name__, instance.id)
             return instance
         except SQLAlchemyError as e:
-            logger.error(f"Error creating {self.model.__name__}: {e}")
+            logger.error("Error creating %s: %s", self.model.__name__, e)
             await self.session.rollback()
             raise DatabaseError(f"Failed to create {self.model.__name__}") from e
 
-    async def update(self, id: str, **kwargs) -> Optional[ModelType]:
+    async def insert_ignore_conflict(
+        self, index_elements: Optional[Sequence[Any]], **kwargs
+    ) -> Optional[ModelType]:
+        """
+        Insert a record unless it conflicts on a unique key, in one round-trip.
+
+        Issues ``INSERT ... ON CONFLICT (index_elements) DO NOTHING RETURNING``.
+
+        Args:
+            index_elements: Unique column(s) that define a conflict, or None to
+                skip the insert on a conflict with any unique index
+            **kwargs: Model field values
+
+        Returns:
+            Created model instance, or None if a conflicting row already exists
+        """
+        try:
+            stmt = (
+                upsert_insert(self.session, self.model)
+                .values(**kwargs)
+                .on_conflict_do_nothing(
+                    index_elements=list(index_elements) if index_elements else None
+                )
+                .returning(self.model)
+            )
+            result = await self.session.execute(stmt)
+            return result.scalar_one_or_none()
+        except SQLAlchemyError as e:
+            logger.error("Error creating %s: %s", self.model.__name__, e)
+            await self.session.rollback()
+            raise DatabaseError(f"Failed to create {self.model.__name__}") from e
+
+    async def create_idempotent(self, key_column: Any, **kwargs) -> Tuple[ModelType, bool]:
+        """
+        Create a record, or return the existing one with the same idempotency key.
+
+        The common (new key) path is a single ``INSERT ... ON CONFLICT DO NOTHING
+        RETURNING``; the existing row is only read when the insert conflicted.
+
+        Args:
+            key_column: Unique idempotency key column (e.g. ``Lead.idempotency_key``)
+            **kwargs: Model field values (must include the key column's value)
+
+        Returns:
+            Tuple of (instance, created) where created is False for a replayed key
+        """
+        created = await self.insert_ignore_conflict([key_column], **kwargs)
+        if created:
+            return created, True
+        try:
+            result = await self.session.execute(
+                select(self.model).where(key_column == kwargs[key_column.key])
+            )
+            existing = result.scalar_one_or_none()
+        except SQLAlchemyError as e:
+            logger.error("Error getting %s by %s: %s", self.model.__name__, key_column.key, e)
+            raise DatabaseError(f"Failed to retrieve {self.model.__name__}") from e
+        if existing is None:
+            raise DatabaseError(f"Failed to retrieve {self.model.__name__}")
+        return existing, False
+
+    async def update(self, id: str, flush: bool = True, **kwargs) -> Optional[ModelType]:
         """
         Update a record by ID.
 
         Args:
             id: Record ID
+            flush: Flush the UPDATE immediately. Pass False when the change is only
+                needed at commit, so several writes share one flush.
             **kwargs: Fields to update
 
         Returns:
@@ -122,12 +213,14 @@ class BaseRepository(Generic[ModelType]):
                 if hasattr(instance, field):
                     setattr(instance, field, value)
 
-            await self.session.flush()
-            await self.session.refresh(instance)
-            logger.debug(f"Updated {self.model.__name__} with ID: {id}")
+            # Python-side onupdate values are written back to the instance on flush,
+            # so no refresh round-trip is needed afterwards
+            if flush:
+                await self.session.flush()
+            logger.debug("Updated %s with ID: %s", self.model.__name__, id)
             return instance
         except SQLAlchemyError as e:
-            logger.error(f"Error updating {self.model.__name__} with ID {id}: {e}")
+            logger.error("Error updating %s with ID %s: %s", self.model.__name__, id, e)
             await self.session.rollback()
             raise DatabaseError(f"Failed to update {self.model.__name__}") from e
 
@@ -148,10 +241,10 @@ class BaseRepository(Generic[ModelType]):
 
             await self.session.delete(instance)
             await self.session.flush()
-            logger.debug(f"Deleted {self.model.__name__} with ID: {id}")
+            logger.debug("Deleted %s with ID: %s", self.model.__name__, id)
             return True
         except SQLAlchemyError as e:
-            logger.error(f"Error deleting {self.model.__name__} with ID {id}: {e}")
+            logger.error("Error deleting %s with ID %s: %s", self.model.__name__, id, e)
             await self.session.rollback()
             raise DatabaseError(f"Failed to delete {self.model.__name__}") from e
 
@@ -166,8 +259,6 @@ class BaseRepository(Generic[ModelType]):
             Number of records
         """
         try:
-            from sqlalchemy import func
-
             query = select(func.count()).select_from(self.model)
 
             if filters:
@@ -178,7 +269,7 @@ class BaseRepository(Generic[ModelType]):
             result = await self.session.execute(query)
             return result.scalar() or 0
         except SQLAlchemyError as e:
-            logger.error(f"Error counting {self.model.__name__}: {e}")
+            logger.error("Error counting %s: %s", self.model.__name__, e)
             raise DatabaseError(f"Failed to count {self.model.__name__} records") from e
 
     async def exists(self, id: str) -> bool:
@@ -3,18 +3,22 @@
 import logging
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, exists, select
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, selectinload
 
-from api_core.database.models import Invoice, Plan, Subscription, UsageRecord
+from api_core.database.models import Invoice, Plan, Subscription, UsageRecord, User
 from api_core.exceptions import ConflictError, DatabaseError, NotFoundError
 from api_core.repositories.base import BaseRepository
 
 logger = logging.getLogger(__name__)
 
+# Subscription statuses that count as a user's current subscription
+_CURRENT_SUBSCRIPTION_STATUSES = ("active", "trialing")
+
 
 class PlanRepository(BaseRepository[Plan]):
     """Repository for subscription plan data access operations."""
@@ -64,6 +68,31 @@ class SubscriptionRepository(BaseRepository[Subscription]):
         """Initialize subscription repository."""
         super().__init__(Subscription, session)
 
+    async def get_with_plan(self, subscription_id: str) -> Optional[Subscription]:
+        """
+        Get a subscription by ID with its plan eagerly loaded.
+
+        Args:
+            subscription_id: Subscription ID
+
+        Returns:
+            Subscription instance (with ``plan`` loaded) or None if not found
+
+        Note:
+            Other relationships are ``raiseload``: touching one raises instead of
+            silently issuing a lazy query.
+        """
+        try:
+            result = await self.session.execute(
+                select(Subscription)
+                .options(selectinload(Subscription.plan), raiseload("*"))
+                .where(Subscription.id == subscription_id)
+            )
+            return result.scalar_one_or_none()
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting subscription {subscription_id}: {e}")
+            raise DatabaseError("Failed to retrieve subscription") from e
+
     async def get_by_user_id(self, user_id: str) -> Optional[Subscription]:
         """
         Get active or trialing subscription for a user.
@@ -75,17 +104,12 @@ class SubscriptionRepository(BaseRepository[Subscription]):
             Subscription instance or None if not found
         """
         try:
-            from sqlalchemy.orm import selectinload
-            from sqlalchemy import or_
-            
             result = await self.session.execute(
                 select(Subscription)
-                .options(selectinload(Subscription.plan))  # Eagerly load plan relationship
+                # Eagerly load plan; any other relationship access raises rather than lazy-loads
+                .options(selectinload(Subscription.plan), raiseload("*"))
                 .where(Subscription.user_id == user_id)
-                .where(or_(
-                    Subscription.status == "active",
-                    Subscription.status == "trialing"
-                ))
+                .where(Subscription.status.in_(_CURRENT_SUBSCRIPTION_STATUSES))
                 .order_by(Subscription.created_at.desc())
             )
             return result.scalar_one_or_none()
@@ -93,6 +117,67 @@ class SubscriptionRepository(BaseRepository[Subscription]):
             logger.error(f"Error getting subscription for user {user_id}: {e}")
             raise DatabaseError("Failed to retrieve subscription") from e
 
+    async def get_status_by_user_id(self, user_id: str) -> Optional[str]:
+        """
+        Get the status of a user's active or trialing subscription.
+
+        Selects only the status column, for checks that don't need the subscription
+        row or its plan.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Subscription status or None if the user has no current subscription
+        """
+        try:
+            result = await self.session.execute(
+                select(Subscription.status)
+                .where(Subscription.user_id == user_id)
+                .where(Subscription.status.in_(_CURRENT_SUBSCRIPTION_STATUSES))
+                .order_by(Subscription.created_at.desc())
+                .limit(1)
+            )
+            return result.scalar_one_or_none()
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting subscription status for user {user_id}: {e}")
+            raise DatabaseError("Failed to retrieve subscription status") from e
+
+    async def get_creation_context(
+        self, user_id: str, plan_id: str
+    ) -> Tuple[Optional[Plan], Optional[User], bool]:
+        """
+        Load what subscription creation checks in a single query.
+
+        Args:
+            user_id: User ID
+            plan_id: Plan ID
+
+        Returns:
+            Tuple of (plan, user, has_current_subscription); plan or user is None
+            if not found
+        """
+        has_current = (
+            exists()
+            .where(Subscription.user_id == user_id)
+            .where(Subscription.status.in_(_CURRENT_SUBSCRIPTION_STATUSES))
+        )
+        try:
+            result = await self.session.execute(
+                # Plan drives the row; the user is joined on its id alone so a
+                # missing user still returns the plan
+                select(Plan, User, has_current.label("has_current"))
+                .outerjoin(User, User.id == user_id)
+                .where(Plan.id == plan_id)
+            )
+            row = result.first()
+            if row is None:
+                return None, None, False
+            return row[0], row[1], bool(row[2])
+        except SQLAlchemyError as e:
+            logger.error(f"Error loading subscription context for user {user_id}: {e}")
+            raise DatabaseError("Failed to retrieve subscription") from e
+
     async def get_all_by_user_id(self, user_id: str) -> List[Subscription]:
         """
         Get all subscriptions for a user.
@@ -284,17 +369,14 @@ class SubscriptionRepository(BaseRepository[Subscription]):
 
         Returns:
             Updated subscription instance or None if not found
+
+        Note:
+            Loads the subscription with ``get_by_id``, so a subscription the caller
+            already loaded via ``get_with_plan`` is reused (plan included) without
+            another query.
         """
         try:
-            from sqlalchemy.orm import selectinload
-            
-            # Eagerly load plan relationship to avoid greenlet_spawn error
-            result = await self.session.execute(
-                select(Subscription)
-                .options(selectinload(Subscription.plan))
-                .where(Subscription.id == subscription_id)
-            )
-            subscription = result.scalar_one_or_none()
+            subscription = await self.get_by_id(subscription_id)
             if not subscription:
                 return None
 
@@ -315,8 +397,8 @@ class SubscriptionRepository(BaseRepository[Subscription]):
                     f"Status: {subscription.status}, canceled_at: {subscription.canceled_at}"
                 )
 
+            # Python-side onupdate values are written back on flush; no refresh needed
             await self.session.flush()
-            await self.session.refresh(subscription)
             logger.info(
                 f"Canceled subscription: {subscription_id}. "
                 f"Final status: {subscription.status}, cancel_at_period_end: {subscription.cancel_at_period_end}"
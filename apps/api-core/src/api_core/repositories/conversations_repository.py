@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import logging
-from typing import List, Optional
+from datetime import datetime
+from typing import AsyncIterator, Optional, Sequence, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, select, tuple_
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -16,6 +17,15 @@ from api_core.repositories.base import BaseRepository
 
 logger = logging.getLogger(__name__)
 
+_CONVERSATION_WITH_MESSAGES_BY_ID = (
+    select(Conversation)
+    .where(Conversation.id == bindparam("conversation_id"))
+    .options(selectinload(Conversation.messages))
+)
+
+# Rows fetched per round-trip when streaming a conversation's messages
+_MESSAGE_STREAM_BATCH_SIZE = 200
+
 
 class ConversationsRepository(BaseRepository[Conversation]):
     """Repository for conversation data access operations."""
@@ -28,44 +38,83 @@ class ConversationsRepository(BaseRepository[Conversation]):
         """Get a conversation by ID with messages loaded."""
         try:
             result = await self.session.execute(
-                select(Conversation)
-                .where(Conversation.id == conversation_id)
-                .options(selectinload(Conversation.messages))
+                _CONVERSATION_WITH_MESSAGES_BY_ID, {"conversation_id": conversation_id}
             )
             return result.scalar_one_or_none()
         except SQLAlchemyError as e:
-            logger.error(f"Error getting conversation {conversation_id}: {e}")
+            logger.error("Error getting conversation %s: %s", conversation_id, e)
             raise DatabaseError("Failed to retrieve conversation") from e
 
     async def get_by_user_id(
-        self, user_id: str, firm_id: Optional[str] = None, skip: int = 0, limit: int = 100
-    ) -> List[Conversation]:
-        """Get conversations for a user, optionally filtered by firm."""
+        self,
+        user_id: str,
+        firm_id: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        include_messages: bool = False,
+        cursor: Optional[Tuple[datetime, str]] = None,
+    ) -> Sequence[Conversation]:
+        """
+        Get conversations for a user, optionally filtered by firm.
+
+        Results are ordered newest first by ``(created_at, id)``. Pass the
+        ``(created_at, id)`` of the last row of a page as ``cursor`` to fetch the next
+        page with a keyset seek instead of an OFFSET scan; ``skip`` is ignored when a
+        cursor is given. The seek is served by ``ix_conversations_user_id_created_at_id``.
+
+        Args:
+            user_id: User ID
+            firm_id: Optional firm ID to filter by
+            skip: Number of records to skip (offset pagination)
+            limit: Maximum number of records to return
+            include_messages: Eager-load ``Conversation.messages``. This issues one
+                additional ``SELECT ... FROM conversation_messages WHERE conversation_id
+                IN (...)`` for the whole page instead of one lazy load per conversation.
+            cursor: Optional ``(created_at, id)`` of the last row already returned
+
+        Returns:
+            List of Conversation instances
+        """
         try:
             query = select(Conversation).where(Conversation.user_id == user_id)
             if firm_id:
                 query = query.where(Conversation.firm_id == firm_id)
-            query = query.order_by(Conversation.created_at.desc()).offset(skip).limit(limit)
+            if cursor is not None:
+                query = query.where(
+                    tuple_(Conversation.created_at, Conversation.id) < tuple_(*cursor)
+                )
+            else:
+                query = query.offset(skip)
+            query = query.order_by(
+                Conversation.created_at.desc(), Conversation.id.desc()
+            ).limit(limit)
+            if include_messages:
+                query = query.options(selectinload(Conversation.messages))
 
             result = await self.session.execute(query)
-            return list(result.scalars().all())
+            return result.scalars().all()
         except SQLAlchemyError as e:
-            logger.error(f"Error getting conversations for user {user_id}: {e}")
+            logger.error("Error getting conversations for user %s: %s", user_id, e)
             raise DatabaseError("Failed to retrieve conversations") from e
 
     async def count_by_user_id(self, user_id: str, firm_id: Optional[str] = None) -> int:
-        """Count conversations for a user."""
-        try:
-            from sqlalchemy import func
+        """
+        Count conversations for a user.
 
-            query = select(func.count(Conversation.id)).where(Conversation.user_id == user_id)
+        Uses ``COUNT(*)`` so PostgreSQL can answer from an index-only scan over
+        ``ix_conversations_user_id_firm_id`` (migration ``o4p5q6r7s8t9``).
+        """
+        try:
+            query = select(func.count()).select_from(Conversation).where(
+                Conversation.user_id == user_id
+            )
             if firm_id:
                 query = query.where(Conversation.firm_id == firm_id)
 
             result = await self.session.execute(query)
             return result.scalar_one() or 0
         except SQLAlchemyError as e:
-            logger.error(f"Error counting conversations for user {user_id}: {e}")
+            logger.error("Error counting conversations for user %s: %s", user_id, e)
             raise DatabaseError("Failed to count conversations") from e
 
 
@@ -78,7 +127,7 @@ class ConversationMessagesRepository(BaseRepository[ConversationMessage]):
 
     async def get_by_conversation_id(
         self, conversation_id: str
-    ) -> List[ConversationMessage]:
+    ) -> Sequence[ConversationMessage]:
         """Get all messages for a conversation."""
         try:
             result = await self.session.execute(
@@ -86,8 +135,36 @@ class ConversationMessagesRepository(BaseRepository[ConversationMessage]):
                 .where(ConversationMessage.conversation_id == conversation_id)
                 .order_by(ConversationMessage.created_at.asc())
             )
-            return list(result.scalars().all())
+            return result.scalars().all()
         except SQLAlchemyError as e:
-            logger.error(f"Error getting messages for conversation {conversation_id}: {e}")
+            logger.error("Error getting messages for conversation %s: %s", conversation_id, e)
             raise DatabaseError("Failed to retrieve conversation messages") from e
 
+    async def iter_by_conversation_id(
+        self, conversation_id: str
+    ) -> AsyncIterator[ConversationMessage]:
+        """
+        Stream messages for a conversation in creation order.
+
+        Rows are fetched through a server-side cursor in batches, so long
+        conversations are never materialized as one list. Use
+        get_by_conversation_id() when the full list is needed anyway.
+
+        Args:
+            conversation_id: Conversation ID
+
+        Yields:
+            ConversationMessage instances, oldest first
+        """
+        try:
+            result = await self.session.stream_scalars(
+                select(ConversationMessage)
+                .where(ConversationMessage.conversation_id == conversation_id)
+                .order_by(ConversationMessage.created_at.asc())
+                .execution_options(yield_per=_MESSAGE_STREAM_BATCH_SIZE)
+            )
+            async for message in result:
+                yield message
+        except SQLAlchemyError as e:
+            logger.error("Error streaming messages for conversation %s: %s", conversation_id, e)
+            raise DatabaseError("Failed to retrieve conversation messages") from e
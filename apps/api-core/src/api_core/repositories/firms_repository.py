@@ -3,17 +3,22 @@
 from __future__ import annotations
 
 import logging
+from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, insert, select, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api_core.database.models import Firm, FirmPersona
 from api_core.exceptions import ConflictError, DatabaseError, NotFoundError
+from api_core.repositories.base import upsert_insert
 
 logger = logging.getLogger(__name__)
 
+_FIRM_BY_PHONE_NUMBER = select(Firm).where(Firm.twilio_phone_number == bindparam("phone_number"))
+_PERSONA_BY_FIRM_ID = select(FirmPersona).where(FirmPersona.firm_id == bindparam("firm_id"))
+
 
 class FirmsRepository:
     """Repository for firm persona records."""
@@ -21,6 +26,21 @@ class FirmsRepository:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
+    async def _update_returning(self, firm_id: str, **values) -> Optional[Firm]:
+        """
+        Update firm columns with a single ``UPDATE ... RETURNING`` round-trip.
+
+        Any Firm already in the session is refreshed from the returned row.
+
+        Returns:
+            Updated Firm instance or None if no firm has this ID
+        """
+        result = await self.session.execute(
+            update(Firm).where(Firm.id == firm_id).values(**values).returning(Firm),
+            execution_options={"populate_existing": True},
+        )
+        return result.scalar_one_or_none()
+
     async def get_by_id(self, firm_id: str) -> Optional[Firm]:
         """
         Get firm by ID.
@@ -30,14 +50,14 @@ class FirmsRepository:
             
         Returns:
             Firm instance or None if not found
+
+        Note:
+            A firm already loaded in this session is returned without any SQL.
         """
         try:
-            result = await self.session.execute(
-                select(Firm).where(Firm.id == firm_id)
-            )
-            return result.scalar_one_or_none()
+            return await self.session.get(Firm, firm_id)
         except SQLAlchemyError as e:
-            logger.error(f"Error getting firm by ID: {e}")
+            logger.error("Error getting firm by ID: %s", e)
             raise DatabaseError("Failed to retrieve firm") from e
 
     async def get_firm_by_phone_number(
@@ -54,11 +74,11 @@ class FirmsRepository:
         """
         try:
             result = await self.session.execute(
-                select(Firm).where(Firm.twilio_phone_number == phone_number)
+                _FIRM_BY_PHONE_NUMBER, {"phone_number": phone_number}
             )
             return result.scalar_one_or_none()
         except SQLAlchemyError as e:
-            logger.error(f"Error getting firm by phone number: {e}")
+            logger.error("Error getting firm by phone number: %s", e)
             raise DatabaseError("Failed to retrieve firm by phone number") from e
 
     async def set_phone_number(
@@ -85,10 +105,6 @@ class FirmsRepository:
             ConflictError: If phone number already assigned to another firm
         """
         try:
-            firm = await self.get_by_id(firm_id)
-            if not firm:
-                raise NotFoundError(resource="Firm", resource_id=firm_id)
-
             # Check if phone number is already assigned to another firm
             existing = await self.get_firm_by_phone_number(phone_number)
             if existing and existing.id != firm_id:
@@ -96,18 +112,20 @@ class FirmsRepository:
                     f"Phone number {phone_number} is already assigned to firm {existing.id}"
                 )
 
-            firm.twilio_phone_number = phone_number
-            firm.twilio_phone_number_sid = twilio_phone_number_sid
-            firm.twilio_subaccount_sid = twilio_subaccount_sid
-
-            await self.session.flush()
-            await self.session.refresh(firm)
+            firm = await self._update_returning(
+                firm_id,
+                twilio_phone_number=phone_number,
+                twilio_phone_number_sid=twilio_phone_number_sid,
+                twilio_subaccount_sid=twilio_subaccount_sid,
+            )
+            if not firm:
+                raise NotFoundError(resource="Firm", resource_id=firm_id)
 
             return firm
         except (NotFoundError, ConflictError):
             raise
         except SQLAlchemyError as e:
-            logger.error(f"Error setting phone number: {e}")
+            logger.error("Error setting phone number: %s", e)
             raise DatabaseError("Failed to set phone number") from e
 
     async def update_firm_subaccount_sid(
@@ -127,20 +145,17 @@ class FirmsRepository:
             NotFoundError: If firm not found
         """
         try:
-            firm = await self.get_by_id(firm_id)
+            firm = await self._update_returning(
+                firm_id, twilio_subaccount_sid=twilio_subaccount_sid
+            )
             if not firm:
                 raise NotFoundError(resource="Firm", resource_id=firm_id)
 
-            firm.twilio_subaccount_sid = twilio_subaccount_sid
-
-            await self.session.flush()
-            await self.session.refresh(firm)
-
             return firm
         except NotFoundError:
             raise
         except SQLAlchemyError as e:
-            logger.error(f"Error updating firm subaccount SID: {e}")
+            logger.error("Error updating firm subaccount SID: %s", e)
             raise DatabaseError("Failed to update firm subaccount SID") from e
 
     async def clear_phone_number(self, firm_id: str) -> Firm:
@@ -161,35 +176,29 @@ class FirmsRepository:
             NotFoundError: If firm not found
         """
         try:
-            firm = await self.get_by_id(firm_id)
-            if not firm:
-                raise NotFoundError(resource="Firm", resource_id=firm_id)
-
             # Clear phone number fields
-            firm.twilio_phone_number = None
-            firm.twilio_phone_number_sid = None
             # Note: We keep twilio_subaccount_sid in case the firm wants to provision
             # a new number later using the same subaccount
+            firm = await self._update_returning(
+                firm_id, twilio_phone_number=None, twilio_phone_number_sid=None
+            )
+            if not firm:
+                raise NotFoundError(resource="Firm", resource_id=firm_id)
 
-            await self.session.flush()
-            await self.session.refresh(firm)
-
-            logger.info(f"Cleared phone number for firm: {firm_id}")
+            logger.info("Cleared phone number for firm: %s", firm_id)
             return firm
         except NotFoundError:
             raise
         except SQLAlchemyError as e:
-            logger.error(f"Error clearing phone number: {e}")
+            logger.error("Error clearing phone number: %s", e)
             raise DatabaseError("Failed to clear phone number") from e
 
     async def get_persona(self, firm_id: str) -> Optional[FirmPersona]:
         try:
-            result = await self.session.execute(
-                select(FirmPersona).where(FirmPersona.firm_id == firm_id)
-            )
+            result = await self.session.execute(_PERSONA_BY_FIRM_ID, {"firm_id": firm_id})
             return result.scalar_one_or_none()
         except SQLAlchemyError as e:
-            logger.error(f"Error getting firm persona: {e}")
+            logger.error("Error getting firm persona: %s", e)
             raise DatabaseError("Failed to retrieve firm persona") from e
 
     async def create(self, name: str, **kwargs) -> Firm:
@@ -204,35 +213,47 @@ class FirmsRepository:
             Created Firm instance
         """
         try:
-            firm = Firm(name=name, **kwargs)
-            self.session.add(firm)
-            await self.session.flush()
-            await self.session.refresh(firm)
-            logger.info(f"Created firm: {firm.id} ({firm.name})")
+            result = await self.session.execute(
+                insert(Firm).values(name=name, **kwargs).returning(Firm)
+            )
+            firm = result.scalar_one()
+            logger.info("Created firm: %s (%s)", firm.id, firm.name)
             return firm
         except SQLAlchemyError as e:
-            logger.error(f"Error creating firm: {e}")
+            logger.error("Error creating firm: %s", e)
             await self.session.rollback()
             raise DatabaseError("Failed to create firm") from e
 
     async def upsert_persona(self, firm_id: str, system_prompt: str) -> FirmPersona:
+        """
+        Create or update a firm's persona in one round-trip.
+
+        Issues ``INSERT ... ON CONFLICT (firm_id) DO UPDATE ... RETURNING``, which is
+        atomic under concurrent writers and returns the stored row directly.
+
+        Args:
+            firm_id: Firm ID
+            system_prompt: Persona system prompt
+
+        Returns:
+            Created or updated FirmPersona instance
+        """
         try:
-            existing = await self.get_persona(firm_id)
-            if existing:
-                existing.system_prompt = system_prompt
-                await self.session.flush()
-                await self.session.refresh(existing)
-                return existing
-
-            persona = FirmPersona(firm_id=firm_id, system_prompt=system_prompt)
-            self.session.add(persona)
-            await self.session.flush()
-            await self.session.refresh(persona)
-            return persona
-        except DatabaseError:
-            raise
+            now = datetime.utcnow()
+            stmt = upsert_insert(self.session, FirmPersona).values(
+                firm_id=firm_id, system_prompt=system_prompt, created_at=now, updated_at=now
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[FirmPersona.firm_id],
+                set_={
+                    "system_prompt": stmt.excluded.system_prompt,
+                    "updated_at": stmt.excluded.updated_at,
+                },
+            ).returning(FirmPersona)
+            result = await self.session.execute(
+                stmt, execution_options={"populate_existing": True}
+            )
+            return result.scalar_one()
         except SQLAlchemyError as e:
-            logger.error(f"Error upserting firm persona: {e}")
+            logger.error("Error upserting firm persona: %s", e)
             raise DatabaseError("Failed to upsert firm persona") from e
-
-
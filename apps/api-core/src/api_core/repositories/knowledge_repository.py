@@ -1,11 +1,12 @@
 """Knowledge base repository for data access operations."""
 
 import logging
-from typing import List, Optional
+from typing import Any, Optional, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from api_core.database.models import KnowledgeBaseFile
 from api_core.exceptions import DatabaseError, NotFoundError
@@ -21,15 +22,31 @@ class KnowledgeRepository(BaseRepository[KnowledgeBaseFile]):
         """Initialize knowledge repository."""
         super().__init__(KnowledgeBaseFile, session)
 
+    @staticmethod
+    def _with_columns(query: Select, columns: Optional[Sequence[Any]]) -> Select:
+        """
+        Restrict loaded columns when the caller only needs a subset.
+
+        Unlisted columns are not fetched, and accessing one raises instead of
+        emitting a lazy load (which is not possible on an async session).
+        """
+        if columns:
+            query = query.options(load_only(*columns, raiseload=True))
+        return query
+
     async def get_by_user_id(
-        self, user_id: str, firm_id: Optional[str] = None
-    ) -> List[KnowledgeBaseFile]:
+        self,
+        user_id: str,
+        firm_id: Optional[str] = None,
+        columns: Optional[Sequence[Any]] = None,
+    ) -> Sequence[KnowledgeBaseFile]:
         """
         Get all knowledge base files for a user.
 
         Args:
             user_id: User ID
             firm_id: Optional firm ID to filter by
+            columns: Optional KnowledgeBaseFile columns to load (default: all)
 
         Returns:
             List of KnowledgeBaseFile instances
@@ -38,42 +55,52 @@ class KnowledgeRepository(BaseRepository[KnowledgeBaseFile]):
             query = select(KnowledgeBaseFile).where(KnowledgeBaseFile.user_id == user_id)
             if firm_id:
                 query = query.where(KnowledgeBaseFile.firm_id == firm_id)
-            query = query.order_by(KnowledgeBaseFile.created_at.desc())
+            query = self._with_columns(query.order_by(KnowledgeBaseFile.created_at.desc()), columns)
 
             result = await self.session.execute(query)
-            return list(result.scalars().all())
+            return result.scalars().all()
         except SQLAlchemyError as e:
-            logger.error(f"Error getting knowledge base files for user {user_id}: {e}")
+            logger.error("Error getting knowledge base files for user %s: %s", user_id, e)
             raise DatabaseError("Failed to retrieve knowledge base files") from e
 
-    async def get_by_firm_id(self, firm_id: str) -> List[KnowledgeBaseFile]:
+    async def get_by_firm_id(
+        self, firm_id: str, columns: Optional[Sequence[Any]] = None
+    ) -> Sequence[KnowledgeBaseFile]:
         """
         Get all knowledge base files for a firm.
 
         Args:
             firm_id: Firm ID
+            columns: Optional KnowledgeBaseFile columns to load (default: all)
 
         Returns:
             List of KnowledgeBaseFile instances
         """
         try:
-            result = await self.session.execute(
+            query = (
                 select(KnowledgeBaseFile)
                 .where(KnowledgeBaseFile.firm_id == firm_id)
                 .order_by(KnowledgeBaseFile.created_at.desc())
             )
-            return list(result.scalars().all())
+            result = await self.session.execute(self._with_columns(query, columns))
+            return result.scalars().all()
         except SQLAlchemyError as e:
-            logger.error(f"Error getting knowledge base files for firm {firm_id}: {e}")
+            logger.error("Error getting knowledge base files for firm %s: %s", firm_id, e)
             raise DatabaseError("Failed to retrieve knowledge base files") from e
 
-    async def get_by_status(self, status: str, firm_id: Optional[str] = None) -> List[KnowledgeBaseFile]:
+    async def get_by_status(
+        self,
+        status: str,
+        firm_id: Optional[str] = None,
+        columns: Optional[Sequence[Any]] = None,
+    ) -> Sequence[KnowledgeBaseFile]:
         """
         Get knowledge base files by status.
 
         Args:
             status: File status (pending, processing, indexed, failed)
             firm_id: Optional firm ID to filter by
+            columns: Optional KnowledgeBaseFile columns to load (default: all)
 
         Returns:
             List of KnowledgeBaseFile instances
@@ -82,11 +109,11 @@ class KnowledgeRepository(BaseRepository[KnowledgeBaseFile]):
             query = select(KnowledgeBaseFile).where(KnowledgeBaseFile.status == status)
             if firm_id:
                 query = query.where(KnowledgeBaseFile.firm_id == firm_id)
-            query = query.order_by(KnowledgeBaseFile.created_at.desc())
+            query = self._with_columns(query.order_by(KnowledgeBaseFile.created_at.desc()), columns)
 
             result = await self.session.execute(query)
-            return list(result.scalars().all())
+            return result.scalars().all()
         except SQLAlchemyError as e:
-            logger.error(f"Error getting knowledge base files by status {status}: {e}")
+            logger.error("Error getting knowledge base files by status %s: %s", status, e)
             raise DatabaseError("Failed to retrieve knowledge base files") from e
 
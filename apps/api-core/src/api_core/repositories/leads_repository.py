@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -15,6 +15,10 @@ from api_core.repositories.base import BaseRepository
 
 logger = logging.getLogger(__name__)
 
+_LEAD_BY_IDEMPOTENCY_KEY = select(Lead).where(
+    Lead.idempotency_key == bindparam("idempotency_key")
+)
+
 
 class LeadsRepository(BaseRepository[Lead]):
     """Repository for lead data access operations."""
@@ -25,10 +29,10 @@ class LeadsRepository(BaseRepository[Lead]):
     async def get_by_idempotency_key(self, idempotency_key: str) -> Optional[Lead]:
         """Return a lead by idempotency key (if exists)."""
         try:
-            result = await self.session.execute(select(Lead).where(Lead.idempotency_key == idempotency_key))
+            result = await self.session.execute(
+                _LEAD_BY_IDEMPOTENCY_KEY, {"idempotency_key": idempotency_key}
+            )
             return result.scalar_one_or_none()
         except SQLAlchemyError as e:
-            logger.error(f"Error getting lead by idempotency_key: {e}")
+            logger.error("Error getting lead by idempotency_key: %s", e)
             raise DatabaseError("Failed to retrieve lead") from e
-
-
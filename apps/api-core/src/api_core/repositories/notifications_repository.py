@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -15,6 +15,10 @@ from api_core.repositories.base import BaseRepository
 
 logger = logging.getLogger(__name__)
 
+_NOTIFICATION_BY_IDEMPOTENCY_KEY = select(Notification).where(
+    Notification.idempotency_key == bindparam("idempotency_key")
+)
+
 
 class NotificationsRepository(BaseRepository[Notification]):
     """Repository for notification data access operations."""
@@ -26,11 +30,9 @@ class NotificationsRepository(BaseRepository[Notification]):
         """Return a notification by idempotency key (if exists)."""
         try:
             result = await self.session.execute(
-                select(Notification).where(Notification.idempotency_key == idempotency_key)
+                _NOTIFICATION_BY_IDEMPOTENCY_KEY, {"idempotency_key": idempotency_key}
             )
             return result.scalar_one_or_none()
         except SQLAlchemyError as e:
-            logger.error(f"Error getting notification by idempotency_key: {e}")
+            logger.error("Error getting notification by idempotency_key: %s", e)
             raise DatabaseError("Failed to retrieve notification") from e
-
-
@@ -3,10 +3,9 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
-from typing import Optional
+from typing import Optional, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, insert, select, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -15,6 +14,10 @@ from api_core.exceptions import ConflictError, DatabaseError, NotFoundError
 
 logger = logging.getLogger(__name__)
 
+_POOL_BY_SID = select(PhoneNumberPool).where(
+    PhoneNumberPool.twilio_phone_number_sid == bindparam("twilio_phone_number_sid")
+)
+
 
 class PhoneNumberPoolRepository:
     """Repository for phone number pool records."""
@@ -25,12 +28,16 @@ class PhoneNumberPoolRepository:
     async def get_available_for_update(
         self,
         limit: int = 1,
-    ) -> list[PhoneNumberPool]:
+    ) -> Sequence[PhoneNumberPool]:
         """
         Claim an available number from the pool (FOR UPDATE SKIP LOCKED).
 
         Use in a transaction; call mark_assigned after transferring in Twilio.
 
+        Only the returned phone_number_pool rows are locked (``FOR UPDATE OF``), and
+        rows are picked in id order from the partial index ``ix_phone_number_pool_available``
+        so concurrent claimers skip past each other's locks instead of scanning.
+
         Args:
             limit: Max number of rows to return (default 1).
 
@@ -41,12 +48,13 @@ class PhoneNumberPoolRepository:
             result = await self.session.execute(
                 select(PhoneNumberPool)
                 .where(PhoneNumberPool.status == "available")
-                .with_for_update(skip_locked=True)
+                .order_by(PhoneNumberPool.id)
+                .with_for_update(skip_locked=True, of=PhoneNumberPool)
                 .limit(limit)
             )
-            return list(result.scalars().all())
+            return result.scalars().all()
         except SQLAlchemyError as e:
-            logger.error(f"Error getting available pool number: {e}")
+            logger.error("Error getting available pool number: %s", e)
             raise DatabaseError("Failed to get available pool number") from e
 
     async def add_to_pool(
@@ -75,29 +83,37 @@ class PhoneNumberPoolRepository:
                 if existing.status == "available":
                     return existing
                 # Was assigned; return to pool
-                existing.status = "available"
-                existing.firm_id = None
-                existing.assigned_at = None
-                existing.pool_account_sid = pool_account_sid
-                await self.session.flush()
-                await self.session.refresh(existing)
+                result = await self.session.execute(
+                    update(PhoneNumberPool)
+                    .where(PhoneNumberPool.id == existing.id)
+                    .values(
+                        status="available",
+                        firm_id=None,
+                        assigned_at=None,
+                        pool_account_sid=pool_account_sid,
+                    )
+                    .returning(PhoneNumberPool),
+                    execution_options={"populate_existing": True},
+                )
                 logger.info(
-                    f"Returned number {phone_number} to pool (sid={twilio_phone_number_sid})"
+                    "Returned number %s to pool (sid=%s)", phone_number, twilio_phone_number_sid
+                )
+                return result.scalar_one()
+            result = await self.session.execute(
+                insert(PhoneNumberPool)
+                .values(
+                    phone_number=phone_number,
+                    twilio_phone_number_sid=twilio_phone_number_sid,
+                    pool_account_sid=pool_account_sid,
+                    status="available",
                 )
-                return existing
-            row = PhoneNumberPool(
-                phone_number=phone_number,
-                twilio_phone_number_sid=twilio_phone_number_sid,
-                pool_account_sid=pool_account_sid,
-                status="available",
+                .returning(PhoneNumberPool)
             )
-            self.session.add(row)
-            await self.session.flush()
-            await self.session.refresh(row)
-            logger.info(f"Added number {phone_number} to pool (sid={twilio_phone_number_sid})")
+            row = result.scalar_one()
+            logger.info("Added number %s to pool (sid=%s)", phone_number, twilio_phone_number_sid)
             return row
         except SQLAlchemyError as e:
-            logger.error(f"Error adding to pool: {e}")
+            logger.error("Error adding to pool: %s", e)
             raise DatabaseError("Failed to add number to pool") from e
 
     async def mark_assigned(
@@ -105,39 +121,50 @@ class PhoneNumberPoolRepository:
         pool_row_id: str,
         firm_id: str,
     ) -> PhoneNumberPool:
-        """Mark a pool row as assigned to a firm."""
+        """
+        Mark a pool row as assigned to a firm.
+
+        The happy path is a single conditional ``UPDATE ... WHERE status = 'available'
+        RETURNING``; the row is only re-read to explain why nothing was updated.
+        ``assigned_at`` is stamped by the database clock and returned with the row.
+        """
         try:
+            result = await self.session.execute(
+                update(PhoneNumberPool)
+                .where(
+                    PhoneNumberPool.id == pool_row_id,
+                    PhoneNumberPool.status == "available",
+                )
+                .values(status="assigned", firm_id=firm_id, assigned_at=func.now())
+                .returning(PhoneNumberPool),
+                execution_options={"populate_existing": True},
+            )
+            row = result.scalar_one_or_none()
+            if row:
+                return row
+
             result = await self.session.execute(
                 select(PhoneNumberPool).where(PhoneNumberPool.id == pool_row_id)
             )
             row = result.scalar_one_or_none()
             if not row:
                 raise NotFoundError(resource="PhoneNumberPool", resource_id=pool_row_id)
-            if row.status != "available":
-                raise ConflictError(
-                    f"Pool number {row.phone_number} is not available (status={row.status})"
-                )
-            row.status = "assigned"
-            row.firm_id = firm_id
-            row.assigned_at = datetime.utcnow()
-            await self.session.flush()
-            await self.session.refresh(row)
-            return row
+            raise ConflictError(
+                f"Pool number {row.phone_number} is not available (status={row.status})"
+            )
         except (NotFoundError, ConflictError):
             raise
         except SQLAlchemyError as e:
-            logger.error(f"Error marking pool number assigned: {e}")
+            logger.error("Error marking pool number assigned: %s", e)
             raise DatabaseError("Failed to mark pool number assigned") from e
 
     async def _get_by_sid(self, twilio_phone_number_sid: str) -> Optional[PhoneNumberPool]:
         """Get pool row by Twilio Phone Number SID."""
         try:
             result = await self.session.execute(
-                select(PhoneNumberPool).where(
-                    PhoneNumberPool.twilio_phone_number_sid == twilio_phone_number_sid
-                )
+                _POOL_BY_SID, {"twilio_phone_number_sid": twilio_phone_number_sid}
             )
             return result.scalar_one_or_none()
         except SQLAlchemyError as e:
-            logger.error(f"Error getting pool by SID: {e}")
+            logger.error("Error getting pool by SID: %s", e)
             raise DatabaseError("Failed to get pool by SID") from e
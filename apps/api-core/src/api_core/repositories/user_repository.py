@@ -1,19 +1,118 @@
 """User repository for data access operations."""
 
 import logging
+import time
 from datetime import datetime
-from typing import List, Optional
-
-from sqlalchemy import select
+from functools import wraps
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    NoReturn,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from sqlalchemy import Select, bindparam, case, event, func, inspect, or_, select, update
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api_core.database.models import User
+from api_core.database.models import User, hash_token, normalize_email
 from api_core.exceptions import ConflictError, DatabaseError, NotFoundError
 from api_core.repositories.base import BaseRepository
 
 logger = logging.getLogger(__name__)
 
+_USER_BY_NORMALIZED_EMAIL = select(User).where(User.normalized_email == bindparam("value"))
+_USER_BY_AZURE_AD_OBJECT_ID = select(User).where(User.azure_ad_object_id == bindparam("value"))
+_USER_BY_GOOGLE_ID = select(User).where(User.google_id == bindparam("value"))
+_USER_BY_RESET_TOKEN = select(User).where(User.password_reset_token == bindparam("token"))
+_USER_BY_VERIFICATION_TOKEN = select(User).where(
+    User.email_verification_token == bindparam("token")
+)
+
+# Rows fetched per round trip when streaming search results
+_SEARCH_STREAM_BATCH_SIZE = 100
+
+_T = TypeVar("_T")
+
+# Process-wide negative cache for token lookups: (column key, token digest) ->
+# monotonic expiry. Once a link is consumed its token is cleared, so client retries of the
+# same link all miss; remembering the miss briefly keeps those retries off the
+# database. Hits are never cached (they are ORM instances bound to one session),
+# and issuing a token evicts it, so a cached miss can't hide a live token.
+_TOKEN_MISS_TTL_SECONDS = 60.0
+_TOKEN_MISS_MAX_ENTRIES = 10_000
+_token_misses: Dict[Tuple[str, str], float] = {}
+
+
+def _token_recently_missed(column: str, token: str) -> bool:
+    """Return True if ``token`` was looked up on ``column`` and not found within the TTL."""
+    expires_at = _token_misses.get((column, token))
+    if expires_at is None:
+        return False
+    if expires_at <= time.monotonic():
+        _token_misses.pop((column, token), None)
+        return False
+    return True
+
+
+def _remember_token_miss(column: str, token: str) -> None:
+    """Record a token lookup miss on ``column``."""
+    if len(_token_misses) >= _TOKEN_MISS_MAX_ENTRIES:
+        _token_misses.clear()
+    _token_misses[(column, token)] = time.monotonic() + _TOKEN_MISS_TTL_SECONDS
+
+
+def _forget_token_miss(column: str, token: Optional[str]) -> None:
+    """Evict ``token`` from the miss cache when it is assigned on ``column``."""
+    if token is not None:
+        _token_misses.pop((column, token), None)
+
+
+@event.listens_for(User.password_reset_token, "set")
+def _on_password_reset_token_set(
+    target: User, value: Optional[str], oldvalue: Any, initiator: Any
+) -> None:
+    """Evict a password reset token assigned directly on a User instance."""
+    _forget_token_miss("password_reset_token", value)
+
+
+@event.listens_for(User.email_verification_token, "set")
+def _on_email_verification_token_set(
+    target: User, value: Optional[str], oldvalue: Any, initiator: Any
+) -> None:
+    """Evict a verification token assigned directly on a User instance."""
+    _forget_token_miss("email_verification_token", value)
+
+
+def _wrap_db_errors(
+    message: str,
+) -> Callable[[Callable[..., Awaitable[_T]]], Callable[..., Awaitable[_T]]]:
+    """
+    Decorate a repository read so SQLAlchemy errors surface as DatabaseError.
+
+    Args:
+        message: DatabaseError message raised to callers
+    """
+
+    def decorator(fn: Callable[..., Awaitable[_T]]) -> Callable[..., Awaitable[_T]]:
+        @wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> _T:
+            try:
+                return await fn(*args, **kwargs)
+            except SQLAlchemyError as e:
+                logger.error("Error in UserRepository.%s: %s", fn.__name__, e)
+                raise DatabaseError(message) from e
+
+        return wrapper
+
+    return decorator
+
 
 class UserRepository(BaseRepository[User]):
     """Repository for user data access operations."""
@@ -21,26 +120,46 @@ class UserRepository(BaseRepository[User]):
     def __init__(self, session: AsyncSession):
         """Initialize user repository."""
         super().__init__(User, session)
+        # (statement, value) -> User or None for the identity lookups below. The
+        # repository lives as long as its request-scoped session, and any write
+        # through it clears the cache.
+        self._ident_cache: Dict[Tuple[Select, str], Optional[User]] = {}
+
+    async def _get_by_unique(self, statement: Select, value: str) -> Optional[User]:
+        """
+        Run a single-user lookup ``statement`` for ``value``, memoized per repository.
 
+        A cached user is only reused while it is still attached to the session and
+        unexpired (e.g. not after a rollback), since async sessions can't lazy-refresh.
+        """
+        key = (statement, value)
+        if key in self._ident_cache:
+            user = self._ident_cache[key]
+            if user is None or (user in self.session and not inspect(user).expired_attributes):
+                return user
+
+        result = await self.session.execute(statement, {"value": value})
+        user = result.scalar_one_or_none()
+        self._ident_cache[key] = user
+        return user
+
+    @_wrap_db_errors("Failed to retrieve user by email")
     async def get_by_email(self, email: str) -> Optional[User]:
         """
         Get user by email address.
 
         Args:
-            email: User email address
+            email: User email address (any case; surrounding whitespace ignored)
 
         Returns:
             User instance or None if not found
+
+        Note:
+            Matches on the unique ``ix_users_normalized_email`` index.
         """
-        try:
-            result = await self.session.execute(
-                select(User).where(User.email == email.lower().strip())
-            )
-            return result.scalar_one_or_none()
-        except SQLAlchemyError as e:
-            logger.error(f"Error getting user by email {email}: {e}")
-            raise DatabaseError("Failed to retrieve user by email") from e
+        return await self._get_by_unique(_USER_BY_NORMALIZED_EMAIL, normalize_email(email))
 
+    @_wrap_db_errors("Failed to retrieve user by Azure AD object ID")
     async def get_by_azure_ad_object_id(self, object_id: str) -> Optional[User]:
         """
         Get user by Azure AD B2C object ID.
@@ -51,15 +170,9 @@ class UserRepository(BaseRepository[User]):
         Returns:
             User instance or None if not found
         """
-        try:
-            result = await self.session.execute(
-                select(User).where(User.azure_ad_object_id == object_id)
-            )
-            return result.scalar_one_or_none()
-        except SQLAlchemyError as e:
-            logger.error(f"Error getting user by Azure AD object ID {object_id}: {e}")
-            raise DatabaseError("Failed to retrieve user by Azure AD object ID") from e
+        return await self._get_by_unique(_USER_BY_AZURE_AD_OBJECT_ID, object_id)
 
+    @_wrap_db_errors("Failed to retrieve user by Google ID")
     async def get_by_google_id(self, google_id: str) -> Optional[User]:
         """
         Get user by Google ID.
@@ -70,14 +183,7 @@ class UserRepository(BaseRepository[User]):
         Returns:
             User instance or None if not found
         """
-        try:
-            result = await self.session.execute(
-                select(User).where(User.google_id == google_id)
-            )
-            return result.scalar_one_or_none()
-        except SQLAlchemyError as e:
-            logger.error(f"Error getting user by Google ID {google_id}: {e}")
-            raise DatabaseError("Failed to retrieve user by Google ID") from e
+        return await self._get_by_unique(_USER_BY_GOOGLE_ID, google_id)
 
     async def create_user(
         self,
@@ -105,35 +211,18 @@ class UserRepository(BaseRepository[User]):
             Created user instance
 
         Raises:
-            ConflictError: If user with email or Azure AD object ID already exists
+            ConflictError: If user with email, Azure AD object ID or Google ID
+                already exists
             DatabaseError: If database operation fails
         """
+        self._ident_cache.clear()
         try:
-            # Check if user with email already exists
-            existing = await self.get_by_email(email)
-            if existing:
-                raise ConflictError(f"User with email {email} already exists")
-
-            # Check if user with Azure AD object ID already exists
-            if azure_ad_object_id:
-                existing = await self.get_by_azure_ad_object_id(azure_ad_object_id)
-                if existing:
-                    raise ConflictError(
-                        f"User with Azure AD object ID {azure_ad_object_id} already exists"
-                    )
-
-            # Check if user with Google ID already exists
-            google_id = kwargs.get("google_id")
-            if google_id:
-                existing = await self.get_by_google_id(google_id)
-                if existing:
-                    raise ConflictError(
-                        f"User with Google ID {google_id} already exists"
-                    )
-
-            # Create user
-            user = await self.create(
-                email=email.lower().strip(),
+            # Atomic, single round-trip insert; a row is returned unless the user
+            # collides with an existing one on any unique index
+            user = await self.insert_ignore_conflict(
+                None,
+                email=normalize_email(email),
+                normalized_email=normalize_email(email),
                 name=name,
                 hashed_password=hashed_password,
                 azure_ad_object_id=azure_ad_object_id,
@@ -141,21 +230,54 @@ class UserRepository(BaseRepository[User]):
                 is_verified=is_verified,
                 **kwargs,
             )
+            if user is None:
+                await self._raise_create_conflict(
+                    email, azure_ad_object_id, kwargs.get("google_id")
+                )
 
             logger.info(f"Created user: {user.id} ({user.email})")
             return user
 
         except ConflictError:
             raise
-        except IntegrityError as e:
-            logger.error(f"Integrity error creating user: {e}")
-            await self.session.rollback()
-            raise ConflictError("User with this email or Azure AD object ID already exists") from e
         except SQLAlchemyError as e:
             logger.error(f"Error creating user: {e}")
             await self.session.rollback()
             raise DatabaseError("Failed to create user") from e
 
+    async def _raise_create_conflict(
+        self,
+        email: str,
+        azure_ad_object_id: Optional[str],
+        google_id: Optional[str],
+    ) -> NoReturn:
+        """
+        Identify the existing user a create collided with and raise ConflictError.
+
+        All identifying columns are checked in one ``SELECT ... WHERE a OR b OR c``.
+        """
+        conditions = [User.normalized_email == normalize_email(email)]
+        if azure_ad_object_id:
+            conditions.append(User.azure_ad_object_id == azure_ad_object_id)
+        if google_id:
+            conditions.append(User.google_id == google_id)
+        result = await self.session.execute(
+            select(User.normalized_email, User.azure_ad_object_id, User.google_id)
+            .where(or_(*conditions))
+            .limit(1)
+        )
+        existing = result.first()
+        if existing is None:
+            # Conflict on another unique column, or the row was deleted since
+            raise ConflictError("User with this email or external ID already exists")
+        if existing.normalized_email == normalize_email(email):
+            raise ConflictError(f"User with email {email} already exists")
+        if azure_ad_object_id and existing.azure_ad_object_id == azure_ad_object_id:
+            raise ConflictError(
+                f"User with Azure AD object ID {azure_ad_object_id} already exists"
+            )
+        raise ConflictError(f"User with Google ID {google_id} already exists")
+
     async def update_user(self, user_id: str, **kwargs) -> Optional[User]:
         """
         Update user by ID.
@@ -167,10 +289,12 @@ class UserRepository(BaseRepository[User]):
         Returns:
             Updated user instance or None if not found
         """
+        self._ident_cache.clear()
         try:
             # Normalize email if provided
             if "email" in kwargs:
-                kwargs["email"] = kwargs["email"].lower().strip()
+                kwargs["email"] = normalize_email(kwargs["email"])
+                kwargs["normalized_email"] = kwargs["email"]
 
             user = await self.update(user_id, **kwargs)
             if user:
@@ -185,6 +309,40 @@ class UserRepository(BaseRepository[User]):
             await self.session.rollback()
             raise DatabaseError("Failed to update user") from e
 
+    async def _update_returning(self, user_id: str, **values) -> Optional[User]:
+        """
+        Update user columns with a single ``UPDATE ... RETURNING`` round-trip.
+
+        Used by the fixed-field setters below instead of load-then-modify. Any User
+        already in the session is refreshed from the returned row.
+
+        Returns:
+            Updated user instance or None if not found
+        """
+        self._ident_cache.clear()
+        try:
+            result = await self.session.execute(
+                update(User).where(User.id == user_id).values(**values).returning(User),
+                execution_options={"populate_existing": True},
+            )
+            user = result.scalar_one_or_none()
+            if user:
+                logger.debug(f"Updated user: {user_id}")
+            return user
+        except IntegrityError as e:
+            logger.error(f"Integrity error updating user {user_id}: {e}")
+            await self.session.rollback()
+            raise ConflictError("Update would violate unique constraint") from e
+        except SQLAlchemyError as e:
+            logger.error(f"Error updating user {user_id}: {e}")
+            await self.session.rollback()
+            raise DatabaseError("Failed to update user") from e
+
+    async def delete(self, id: str) -> bool:
+        """Delete a user by ID (see BaseRepository.delete)."""
+        self._ident_cache.clear()
+        return await super().delete(id)
+
     async def verify_email(self, user_id: str) -> Optional[User]:
         """
         Mark user email as verified.
@@ -195,7 +353,7 @@ class UserRepository(BaseRepository[User]):
         Returns:
             Updated user instance or None if not found
         """
-        return await self.update_user(
+        return await self._update_returning(
             user_id, is_verified=True, email_verified_at=datetime.utcnow()
         )
 
@@ -207,14 +365,16 @@ class UserRepository(BaseRepository[User]):
 
         Args:
             user_id: User ID
-            token: Reset token
+            token: Reset token (only its hash_token() digest is stored)
             expires_at: Token expiration time
 
         Returns:
             Updated user instance or None if not found
         """
-        return await self.update_user(
-            user_id, password_reset_token=token, password_reset_expires_at=expires_at
+        token_hash = hash_token(token)
+        _forget_token_miss("password_reset_token", token_hash)
+        return await self._update_returning(
+            user_id, password_reset_token=token_hash, password_reset_expires_at=expires_at
         )
 
     async def clear_password_reset_token(self, user_id: str) -> Optional[User]:
@@ -227,10 +387,11 @@ class UserRepository(BaseRepository[User]):
         Returns:
             Updated user instance or None if not found
         """
-        return await self.update_user(
+        return await self._update_returning(
             user_id, password_reset_token=None, password_reset_expires_at=None
         )
 
+    @_wrap_db_errors("Failed to retrieve user by reset token")
     async def get_by_reset_token(self, token: str) -> Optional[User]:
         """
         Get user by password reset token.
@@ -240,28 +401,69 @@ class UserRepository(BaseRepository[User]):
 
         Returns:
             User instance or None if not found
+
+        Note:
+            Misses are remembered for a short TTL so retried links skip the database.
         """
-        try:
-            result = await self.session.execute(
-                select(User).where(User.password_reset_token == token)
-            )
-            return result.scalar_one_or_none()
-        except SQLAlchemyError as e:
-            logger.error(f"Error getting user by reset token: {e}")
-            raise DatabaseError("Failed to retrieve user by reset token") from e
+        token_hash = hash_token(token)
+        if _token_recently_missed("password_reset_token", token_hash):
+            return None
+        result = await self.session.execute(_USER_BY_RESET_TOKEN, {"token": token_hash})
+        user = result.scalar_one_or_none()
+        if user is None:
+            _remember_token_miss("password_reset_token", token_hash)
+        return user
 
-    async def update_last_login(self, user_id: str) -> Optional[User]:
+    async def update_last_login(
+        self,
+        user_id: str,
+        reset_lockout: bool = False,
+        hashed_password: Optional[str] = None,
+    ) -> Optional[User]:
         """
         Update user's last login timestamp.
 
         Args:
             user_id: User ID
+            reset_lockout: Also clear failed login attempts and any lock, in the same UPDATE
+            hashed_password: Replacement password hash to store in the same UPDATE
 
         Returns:
             Updated user instance or None if not found
         """
-        return await self.update_user(user_id, last_login_at=datetime.utcnow())
+        values: Dict[str, Any] = {"last_login_at": datetime.utcnow()}
+        if reset_lockout:
+            values.update(failed_login_attempts=0, locked_until=None)
+        if hashed_password is not None:
+            values["hashed_password"] = hashed_password
+        return await self._update_returning(user_id, **values)
+
+    async def record_failed_login(
+        self, user_id: str, max_attempts: int, locked_until: datetime
+    ) -> Optional[User]:
+        """
+        Count a failed login, locking the account once it reaches ``max_attempts``.
+
+        The increment and the lock decision happen in the database in a single
+        ``UPDATE ... RETURNING``, so concurrent failures can't overwrite each other's
+        count.
+
+        Args:
+            user_id: User ID
+            max_attempts: Failed attempt count at which the account is locked
+            locked_until: Lock expiry to set when the limit is reached
+
+        Returns:
+            Updated user instance or None if not found
+        """
+        attempts = User.failed_login_attempts + 1
+        return await self._update_returning(
+            user_id,
+            failed_login_attempts=attempts,
+            locked_until=case((attempts >= max_attempts, locked_until), else_=User.locked_until),
+        )
 
+    @_wrap_db_errors("Failed to retrieve user by verification token")
     async def get_by_verification_token(self, token: str) -> Optional[User]:
         """
         Get user by email verification token.
@@ -271,15 +473,18 @@ class UserRepository(BaseRepository[User]):
 
         Returns:
             User instance or None if not found
+
+        Note:
+            Misses are remembered for a short TTL so retried links skip the database.
         """
-        try:
-            result = await self.session.execute(
-                select(User).where(User.email_verification_token == token)
-            )
-            return result.scalar_one_or_none()
-        except SQLAlchemyError as e:
-            logger.error(f"Error getting user by verification token: {e}")
-            raise DatabaseError("Failed to retrieve user by verification token") from e
+        token_hash = hash_token(token)
+        if _token_recently_missed("email_verification_token", token_hash):
+            return None
+        result = await self.session.execute(_USER_BY_VERIFICATION_TOKEN, {"token": token_hash})
+        user = result.scalar_one_or_none()
+        if user is None:
+            _remember_token_miss("email_verification_token", token_hash)
+        return user
 
     async def set_email_verification_token(
         self, user_id: str, token: str
@@ -289,12 +494,14 @@ class UserRepository(BaseRepository[User]):
 
         Args:
             user_id: User ID
-            token: Verification token
+            token: Verification token (only its hash_token() digest is stored)
 
         Returns:
             Updated user instance or None if not found
         """
-        return await self.update_user(user_id, email_verification_token=token)
+        token_hash = hash_token(token)
+        _forget_token_miss("email_verification_token", token_hash)
+        return await self._update_returning(user_id, email_verification_token=token_hash)
 
     async def clear_email_verification_token(self, user_id: str) -> Optional[User]:
         """
@@ -306,7 +513,7 @@ class UserRepository(BaseRepository[User]):
         Returns:
             Updated user instance or None if not found
         """
-        return await self.update_user(user_id, email_verification_token=None)
+        return await self._update_returning(user_id, email_verification_token=None)
 
     async def deactivate_user(self, user_id: str) -> Optional[User]:
         """
@@ -318,7 +525,7 @@ class UserRepository(BaseRepository[User]):
         Returns:
             Updated user instance or None if not found
         """
-        return await self.update_user(user_id, is_active=False)
+        return await self._update_returning(user_id, is_active=False)
 
     async def activate_user(self, user_id: str) -> Optional[User]:
         """
@@ -330,7 +537,7 @@ class UserRepository(BaseRepository[User]):
         Returns:
             Updated user instance or None if not found
         """
-        return await self.update_user(user_id, is_active=True)
+        return await self._update_returning(user_id, is_active=True)
 
     async def search_users(
         self,
@@ -339,10 +546,14 @@ class UserRepository(BaseRepository[User]):
         is_verified: Optional[bool] = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> List[User]:
+    ) -> Tuple[List[User], int]:
         """
         Search users with filters.
 
+        The page and the total number of matches come from one query: the total is
+        computed with ``COUNT(*) OVER ()`` over the filtered rows, so the filters are
+        only evaluated once.
+
         Args:
             query: Search query (searches name and email)
             is_active: Filter by active status
@@ -351,28 +562,84 @@ class UserRepository(BaseRepository[User]):
             limit: Maximum number of records to return
 
         Returns:
-            List of user instances
+            Tuple of (list of user instances, total number of matching users)
         """
         try:
-            stmt = select(User)
+            conditions = self._search_conditions(query, is_active, is_verified)
+            stmt = (
+                select(User, func.count().over().label("total"))
+                .where(*conditions)
+                .order_by(User.created_at.desc())
+                .offset(skip)
+                .limit(limit)
+            )
+
+            rows = (await self.session.execute(stmt)).all()
+            if rows:
+                return [row.User for row in rows], rows[0].total
 
-            # Apply filters
-            if query:
-                search_term = f"%{query.lower()}%"
-                stmt = stmt.where(
-                    (User.email.ilike(search_term)) | (User.name.ilike(search_term))
+            if skip:
+                # Page past the end: no row carries the window total, so count directly
+                result = await self.session.execute(
+                    select(func.count()).select_from(User).where(*conditions)
                 )
+                return [], result.scalar_one()
+            return [], 0
+        except SQLAlchemyError as e:
+            logger.error(f"Error searching users: {e}")
+            raise DatabaseError("Failed to search users") from e
 
-            if is_active is not None:
-                stmt = stmt.where(User.is_active == is_active)
+    async def iter_search_users(
+        self,
+        query: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        is_verified: Optional[bool] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> AsyncIterator[User]:
+        """
+        Stream users matching the search filters, newest first.
 
-            if is_verified is not None:
-                stmt = stmt.where(User.is_verified == is_verified)
+        Same filters and ordering as search_users(), but rows are fetched through a
+        server-side cursor in batches and yielded as they arrive, and no total is
+        computed.
 
-            stmt = stmt.offset(skip).limit(limit).order_by(User.created_at.desc())
+        Args:
+            query: Search query (searches name and email)
+            is_active: Filter by active status
+            is_verified: Filter by verified status
+            skip: Number of records to skip
+            limit: Maximum number of records to return
 
-            result = await self.session.execute(stmt)
-            return list(result.scalars().all())
+        Yields:
+            User instances
+        """
+        try:
+            result = await self.session.stream_scalars(
+                select(User)
+                .where(*self._search_conditions(query, is_active, is_verified))
+                .order_by(User.created_at.desc())
+                .offset(skip)
+                .limit(limit)
+                .execution_options(yield_per=_SEARCH_STREAM_BATCH_SIZE)
+            )
+            async for user in result:
+                yield user
         except SQLAlchemyError as e:
-            logger.error(f"Error searching users: {e}")
+            logger.error("Error streaming user search: %s", e)
             raise DatabaseError("Failed to search users") from e
+
+    @staticmethod
+    def _search_conditions(
+        query: Optional[str], is_active: Optional[bool], is_verified: Optional[bool]
+    ) -> List[Any]:
+        """Build the WHERE conditions shared by search_users() and iter_search_users()."""
+        conditions = []
+        if query:
+            search_term = f"%{query.lower()}%"
+            conditions.append((User.email.ilike(search_term)) | (User.name.ilike(search_term)))
+        if is_active is not None:
+            conditions.append(User.is_active == is_active)
+        if is_verified is not None:
+            conditions.append(User.is_verified == is_verified)
+        return conditions
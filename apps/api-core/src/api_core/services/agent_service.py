@@ -78,24 +78,21 @@ class AgentService:
             Updated AgentConfig instance
         """
         # Build update dict (only include non-None values)
-        update_data = {}
-        if voice_id is not None:
-            update_data["voice_id"] = voice_id
-        if greeting_script is not None:
-            update_data["greeting_script"] = greeting_script
-        if closing_script is not None:
-            update_data["closing_script"] = closing_script
-        if transfer_script is not None:
-            update_data["transfer_script"] = transfer_script
-        if auto_respond is not None:
-            update_data["auto_respond"] = auto_respond
-        if record_calls is not None:
-            update_data["record_calls"] = record_calls
-        if auto_transcribe is not None:
-            update_data["auto_transcribe"] = auto_transcribe
-        if enable_voicemail is not None:
-            update_data["enable_voicemail"] = enable_voicemail
-        
+        update_data = {
+            key: value
+            for key, value in (
+                ("voice_id", voice_id),
+                ("greeting_script", greeting_script),
+                ("closing_script", closing_script),
+                ("transfer_script", transfer_script),
+                ("auto_respond", auto_respond),
+                ("record_calls", record_calls),
+                ("auto_transcribe", auto_transcribe),
+                ("enable_voicemail", enable_voicemail),
+            )
+            if value is not None
+        }
+
         if not update_data:
             # No updates provided, just return existing config
             return await self.get_config(user_id, firm_id)
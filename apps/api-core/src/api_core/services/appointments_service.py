@@ -1,9 +1,9 @@
 """Appointments and scheduling service.
 
 NOTE: This initial implementation returns *candidate* slots using simple business-hour rules.
-It does not yet account for:
+AppointmentsService.get_open_availability() also excludes existing LexiqAI bookings. It does
+not yet account for:
 - Staff calendars / external calendars
-- Existing bookings
 - Firm-specific scheduling rules
 
 Those can be layered in later with persistent appointment models and integrations.
@@ -13,12 +13,16 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, time, timedelta
-from typing import List, Optional
+from functools import lru_cache
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
 from zoneinfo import ZoneInfo
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from api_core.database.models import Appointment
 from api_core.exceptions import AuthorizationError, NotFoundError, ValidationError
 from api_core.models.appointments import (
+    AppointmentContact,
     AppointmentCreateRequest,
     AppointmentResponse,
     AvailabilityRequest,
@@ -28,6 +32,12 @@ from api_core.models.appointments import (
 from api_core.repositories.appointments_repository import AppointmentsRepository
 
 
+@lru_cache(maxsize=128)
+def _zone_info(name: str) -> ZoneInfo:
+    """Return the ZoneInfo for an IANA timezone name, loaded once per process."""
+    return ZoneInfo(name)
+
+
 @dataclass(frozen=True)
 class BusinessHours:
     """Simple business hours window for a day."""
@@ -36,35 +46,41 @@ class BusinessHours:
     end: time
 
 
-class AppointmentsService:
-    """Service for LexiqAI-native scheduling operations."""
+# Default hours for MVP: Mon–Fri, 9am–5pm local time (shared, immutable)
+DEFAULT_BUSINESS_HOURS = BusinessHours(start=time(9, 0), end=time(17, 0))
 
-    def __init__(self, session=None) -> None:
-        # Session is optional: availability doesn't require DB; booking does.
-        self._session = session
-        self._repo = AppointmentsRepository(session) if session is not None else None
-        # Default hours for MVP: Mon–Fri, 9am–5pm local time
-        self._business_hours = BusinessHours(start=time(9, 0), end=time(17, 0))
 
-    def get_availability(self, request: AvailabilityRequest) -> AvailabilityResponse:
+class AvailabilityService:
+    """Candidate slot computation for LexiqAI-native scheduling (no database)."""
+
+    def __init__(self, business_hours: BusinessHours = DEFAULT_BUSINESS_HOURS) -> None:
+        self._business_hours = business_hours
+
+    @staticmethod
+    def _localize(value: datetime, tz: ZoneInfo) -> datetime:
+        """Express ``value`` in ``tz``; naive datetimes are taken as already local."""
+        if value.tzinfo is None:
+            return value.replace(tzinfo=tz)
+        return value.astimezone(tz)
+
+    def get_availability(
+        self,
+        request: AvailabilityRequest,
+        busy: Sequence[Tuple[datetime, datetime]] = (),
+    ) -> AvailabilityResponse:
         """Compute candidate slots inside the requested window.
 
         This is intentionally deterministic and conservative for MVP.
-        """
-        tz = ZoneInfo(request.timezone)
-
-        window_start = request.window_start
-        window_end = request.window_end
 
-        if window_start.tzinfo is None:
-            window_start = window_start.replace(tzinfo=tz)
-        else:
-            window_start = window_start.astimezone(tz)
+        Args:
+            request: Availability request
+            busy: (start, end) intervals to keep clear, sorted by start
+        """
+        tz = _zone_info(request.timezone)
 
-        if window_end.tzinfo is None:
-            window_end = window_end.replace(tzinfo=tz)
-        else:
-            window_end = window_end.astimezone(tz)
+        window_start = self._localize(request.window_start, tz)
+        window_end = self._localize(request.window_end, tz)
+        busy = [(self._localize(start, tz), self._localize(end, tz)) for start, end in busy]
 
         if window_end <= window_start:
             return AvailabilityResponse(
@@ -81,26 +97,47 @@ class AppointmentsService:
         max_slots = 50
         slots: List[AvailabilitySlot] = []
 
-        cursor = window_start
-        while cursor + duration <= window_end and len(slots) < max_slots:
-            # Weekday only (Mon=0..Sun=6)
-            if cursor.weekday() < 5:
-                day_start = datetime.combine(cursor.date(), self._business_hours.start, tzinfo=tz)
-                day_end = datetime.combine(cursor.date(), self._business_hours.end, tzinfo=tz)
-
-                candidate_start = cursor
-                candidate_end = candidate_start + duration
-
-                if candidate_start >= day_start and candidate_end <= day_end:
+        # Candidate starts are window_start + k * step (wall-clock arithmetic, as all
+        # datetimes share ``tz``). Rather than stepping through nights and weekends,
+        # compute the range of k that fits each weekday's business hours directly.
+        # Candidates come out in start order, so one pointer sweeps the sorted busy
+        # intervals: anything ending before the candidate can't block a later one.
+        j = 0
+        day = window_start.date()
+        last_day = (window_end - duration).date()
+        while day <= last_day and len(slots) < max_slots:
+            # Weekday only (Mon=0..Sun=6): jump straight from Saturday/Sunday to Monday
+            if day.weekday() >= 5:
+                day += timedelta(days=7 - day.weekday())
+                continue
+
+            day_start = datetime.combine(day, self._business_hours.start, tzinfo=tz)
+            day_end = datetime.combine(day, self._business_hours.end, tzinfo=tz)
+
+            first_start = max(day_start, window_start)
+            last_start = min(day_end, window_end) - duration
+            if first_start <= last_start:
+                k = -((window_start - first_start) // step)  # ceil division
+                k_last = (last_start - window_start) // step
+                while k <= k_last and len(slots) < max_slots:
+                    candidate_start = window_start + k * step
+                    candidate_end = candidate_start + duration
+                    k += 1
+                    while j < len(busy) and busy[j][1] <= candidate_start:
+                        j += 1
+                    if j < len(busy) and busy[j][0] < candidate_end:
+                        continue
+                    # Fields are already-validated datetimes from the request; skip
+                    # re-running pydantic validation for every slot
                     slots.append(
-                        AvailabilitySlot(
+                        AvailabilitySlot.model_construct(
                             start=candidate_start,
                             end=candidate_end,
                             timezone=request.timezone,
                         )
                     )
 
-            cursor = cursor + step
+            day += timedelta(days=1)
 
         return AvailabilityResponse(
             firm_id=request.firm_id,
@@ -109,42 +146,55 @@ class AppointmentsService:
             slots=slots,
         )
 
-    async def book_appointment(self, request: AppointmentCreateRequest) -> AppointmentResponse:
-        """Book an appointment (idempotent).
 
-        Requires DB session.
+class AppointmentsService(AvailabilityService):
+    """Service for LexiqAI-native scheduling operations backed by the database."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        super().__init__()
+        self._session = session
+        self._repo = AppointmentsRepository(session)
+
+    @staticmethod
+    def _to_response(appointment: Appointment) -> AppointmentResponse:
+        """Build the booking response for an appointment row.
+
+        Values come from a persisted row that was validated on the way in, so the
+        models are constructed without re-running validation.
         """
-        if self._repo is None or self._session is None:
-            raise RuntimeError("AppointmentsService requires a database session for booking")
-
-        # Idempotency check
-        existing = await self._repo.get_by_idempotency_key(request.idempotency_key)
-        if existing:
-            return AppointmentResponse(
-                appointment_id=existing.id,
-                firm_id=existing.firm_id,
-                timezone=existing.timezone,
-                start=existing.start_at,
-                end=existing.end_at,
-                duration_minutes=existing.duration_minutes,
-                status=existing.status,
-                title=existing.title,
-                contact={
-                    "full_name": existing.contact_full_name,
-                    "email": existing.contact_email,
-                    "phone": existing.contact_phone,
-                },  # pydantic will coerce
-                notes=existing.notes,
-                created_at=existing.created_at,
-            )
+        return AppointmentResponse.model_construct(
+            appointment_id=appointment.id,
+            firm_id=appointment.firm_id,
+            timezone=appointment.timezone,
+            start=appointment.start_at,
+            end=appointment.end_at,
+            duration_minutes=appointment.duration_minutes,
+            status=appointment.status,
+            title=appointment.title,
+            contact=AppointmentContact.model_construct(
+                full_name=appointment.contact_full_name,
+                email=appointment.contact_email,
+                phone=appointment.contact_phone,
+            ),
+            notes=appointment.notes,
+            created_at=appointment.created_at,
+        )
 
-        tz = ZoneInfo(request.timezone)
+    async def get_open_availability(self, request: AvailabilityRequest) -> AvailabilityResponse:
+        """Compute candidate slots, excluding the firm's existing bookings."""
+        tz = _zone_info(request.timezone)
+        busy = await self._repo.get_busy_between(
+            request.firm_id,
+            self._localize(request.window_start, tz),
+            self._localize(request.window_end, tz),
+        )
+        return self.get_availability(request, busy=busy)
+
+    async def book_appointment(self, request: AppointmentCreateRequest) -> AppointmentResponse:
+        """Book an appointment (idempotent)."""
+        tz = _zone_info(request.timezone)
 
-        start = request.start
-        if start.tzinfo is None:
-            start = start.replace(tzinfo=tz)
-        else:
-            start = start.astimezone(tz)
+        start = self._localize(request.start, tz)
 
         duration = timedelta(minutes=request.duration_minutes)
         end = start + duration
@@ -158,7 +208,9 @@ class AppointmentsService:
         if start < day_start or end > day_end:
             raise ValidationError("Requested time is outside business hours (9am–5pm).")
 
-        created = await self._repo.create(
+        # Idempotent insert: a replayed key returns the originally booked appointment
+        created, _ = await self._repo.create_idempotent(
+            Appointment.idempotency_key,
             firm_id=request.firm_id,
             timezone=request.timezone,
             start_at=start,
@@ -173,23 +225,7 @@ class AppointmentsService:
             idempotency_key=request.idempotency_key,
         )
 
-        return AppointmentResponse(
-            appointment_id=created.id,
-            firm_id=created.firm_id,
-            timezone=created.timezone,
-            start=created.start_at,
-            end=created.end_at,
-            duration_minutes=created.duration_minutes,
-            status=created.status,
-            title=created.title,
-            contact={
-                "full_name": created.contact_full_name,
-                "email": created.contact_email,
-                "phone": created.contact_phone,
-            },
-            notes=created.notes,
-            created_at=created.created_at,
-        )
+        return self._to_response(created)
 
     async def get_user_appointments(
         self,
@@ -216,9 +252,6 @@ class AppointmentsService:
         Returns:
             List of Appointment models
         """
-        if self._repo is None:
-            raise RuntimeError("AppointmentsService requires a database session for user operations")
-        
         return await self._repo.get_by_user_id(
             user_id=user_id,
             firm_id=firm_id,
@@ -229,6 +262,35 @@ class AppointmentsService:
             limit=limit,
         )
 
+    async def iter_user_appointments(
+        self,
+        user_id: str,
+        firm_id: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        clients_only: bool = False,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> AsyncIterator[Appointment]:
+        """
+        Stream appointments for a user as they are read from the database.
+
+        Same arguments as get_user_appointments().
+
+        Yields:
+            Appointment models, oldest start first
+        """
+        async for appointment in self._repo.iter_by_user_id(
+            user_id=user_id,
+            firm_id=firm_id,
+            start_date=start_date,
+            end_date=end_date,
+            clients_only=clients_only,
+            skip=skip,
+            limit=limit,
+        ):
+            yield appointment
+
     async def update_appointment(
         self,
         appointment_id: str,
@@ -254,20 +316,6 @@ class AppointmentsService:
         Returns:
             Updated Appointment model
         """
-        if self._repo is None:
-            raise RuntimeError("AppointmentsService requires a database session for update operations")
-        
-        appointment = await self._repo.get_by_id(appointment_id)
-        if not appointment:
-            raise NotFoundError(resource="Appointment", resource_id=appointment_id)
-        
-        # Check authorization - user must have created it or belong to the firm
-        if appointment.created_by_user_id != user_id:
-            # Check if user belongs to the firm
-            if not appointment.firm_id:
-                raise AuthorizationError(f"User {user_id} does not have access to appointment {appointment_id}")
-            # TODO: Add firm membership check if needed
-        
         # Update fields
         update_data = {}
         if title is not None:
@@ -280,11 +328,28 @@ class AppointmentsService:
             update_data["start_at"] = start_at
         if end_at is not None:
             update_data["end_at"] = end_at
+
+        if update_data:
+            # Authorization is part of the UPDATE's WHERE clause; only a miss needs the
+            # extra read below to report the right error
+            appointment = await self._repo.update_authorized(
+                appointment_id, user_id, **update_data
+            )
+            if appointment is not None:
+                return appointment
+
+        appointment = await self._repo.get_by_id(appointment_id)
+        if not appointment:
+            raise NotFoundError(resource="Appointment", resource_id=appointment_id)
         
-        if not update_data:
-            return appointment
+        # Check authorization - user must have created it or belong to the firm
+        if appointment.created_by_user_id != user_id:
+            # Check if user belongs to the firm
+            if not appointment.firm_id:
+                raise AuthorizationError(f"User {user_id} does not have access to appointment {appointment_id}")
+            # TODO: Add firm membership check if needed
         
-        return await self._repo.update(appointment_id, **update_data)
+        return appointment
 
     async def cancel_appointment(
         self,
@@ -311,19 +376,6 @@ class AppointmentsService:
         )
 
 
-_appointments_service: AppointmentsService | None = None
-
-
-def get_appointments_service() -> AppointmentsService:
-    """Get a process-global AppointmentsService instance."""
-    global _appointments_service
-    if _appointments_service is None:
-        _appointments_service = AppointmentsService()
-    return _appointments_service
-
-
-def get_appointments_service_for_session(session) -> AppointmentsService:
-    """Create an AppointmentsService bound to a DB session (for booking)."""
+def get_appointments_service_for_session(session: AsyncSession) -> AppointmentsService:
+    """Create an AppointmentsService bound to a DB session."""
     return AppointmentsService(session=session)
-
-
@@ -1,16 +1,23 @@
 """Authentication service for user operations."""
 
+import asyncio
+import hashlib
 import logging
+import os
+import secrets
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Callable, Optional, TypeVar
 from uuid import uuid4
 
-from passlib.context import CryptContext
+import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from sqlalchemy.ext.asyncio import AsyncSession
-import warnings
 
 from api_core.auth.jwt import create_access_token, create_refresh_token
 from api_core.config import get_settings
+from api_core.database.models import hash_token
 from api_core.exceptions import AuthenticationError, NotFoundError, ValidationError
 from api_core.models.auth import UserProfile
 from api_core.repositories.user_repository import UserRepository
@@ -19,17 +26,103 @@ from api_core.services.user_service import UserService
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
-# Password hashing context
-# Suppress bcrypt version detection warning/error (known issue with bcrypt 4.3.0 and passlib)
-# The error occurs because passlib tries to read bcrypt.__about__.__version__
-# which doesn't exist in bcrypt 4.3.0, but passlib handles this gracefully and continues
-# We suppress both warnings and the passlib logger to prevent the error from appearing in logs
-with warnings.catch_warnings():
-    warnings.filterwarnings("ignore", message=".*bcrypt.*", category=UserWarning)
-    # Suppress passlib's bcrypt handler logger to prevent "(trapped) error reading bcrypt version"
-    passlib_logger = logging.getLogger("passlib.handlers.bcrypt")
-    passlib_logger.setLevel(logging.CRITICAL)  # Only show critical errors, suppress AttributeError
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Argon2id parameters come from settings.password_hash; the defaults are the OWASP
+# password storage cheat sheet's lower-memory option (19 MiB, t=2, p=1), which keeps
+# concurrent verifications on the thread pool from pinning hundreds of MiB. Stored
+# hashes with other parameters are re-hashed on the next successful login.
+_password_hasher = PasswordHasher(
+    time_cost=settings.password_hash.time_cost,
+    memory_cost=settings.password_hash.memory_cost_kib,
+    parallelism=settings.password_hash.parallelism,
+)
+
+# Hashing runs on its own pool, one worker per core: Argon2id is CPU-bound and
+# allocates memory_cost per hash in flight, so this caps both under a burst of
+# logins or signups and keeps them from starving the default executor.
+_password_hash_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 4, thread_name_prefix="password-hash"
+)
+
+# Hash of a random, discarded password with _password_hasher's parameters. Verified
+# against when a login names no password user, so that path costs one real check and
+# response time doesn't reveal whether the account exists.
+_DUMMY_PASSWORD_HASH = _password_hasher.hash(secrets.token_urlsafe(32))
+
+# Characters that satisfy the "special character" password requirement
+_PASSWORD_SPECIAL_CHARACTERS = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
+
+# Prefix of hashes written by _password_hasher; anything else is a legacy bcrypt hash
+_ARGON2_PREFIX = "$argon2"
+
+# Email templates for reset and verification links; {link} is filled in per message
+_PASSWORD_RESET_EMAIL_SUBJECT = "Reset your password"
+_PASSWORD_RESET_EMAIL_TEMPLATE = """\
+Hello,
+
+You requested to reset your password. Click the link below to reset it:
+
+{link}
+
+This link will expire in 24 hours.
+
+If you didn't request a password reset, please ignore this email. Your password will remain unchanged.
+
+Best regards,
+LexiqAI Team"""
+
+_VERIFICATION_EMAIL_SUBJECT = "Verify your email address"
+_VERIFICATION_EMAIL_TEMPLATE = """\
+Hello,
+
+Thank you for signing up! Please verify your email address by clicking the link below:
+
+{link}
+
+This link will expire in 24 hours.
+
+If you didn't create an account, please ignore this email.
+
+Best regards,
+LexiqAI Team"""
+
+_T = TypeVar("_T")
+
+
+def run_password_hashing(func: Callable[..., _T], *args: object) -> "asyncio.Future[_T]":
+    """Run a blocking hash or verify call on the password hashing pool."""
+    return asyncio.get_running_loop().run_in_executor(_password_hash_executor, func, *args)
+
+
+def _legacy_prehash(password: str) -> bytes:
+    """
+    SHA256-hex a password the way legacy bcrypt hashes were written.
+
+    bcrypt hashes stored before Argon2id were made over this pre-hash (to get past
+    bcrypt's 72-byte input limit), so it is only needed to verify those.
+    """
+    return hashlib.sha256(password.encode("utf-8")).hexdigest().encode("ascii")
+
+
+def hash_password(password: str) -> str:
+    """Hash a password with Argon2id."""
+    return _password_hasher.hash(password)
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Check a password against an Argon2id hash, or a legacy SHA256+bcrypt hash."""
+    if not hashed_password.startswith(_ARGON2_PREFIX):
+        return bcrypt.checkpw(_legacy_prehash(plain_password), hashed_password.encode("ascii"))
+    try:
+        return _password_hasher.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Return True for legacy bcrypt hashes and Argon2 hashes with outdated parameters."""
+    return not hashed_password.startswith(
+        _ARGON2_PREFIX
+    ) or _password_hasher.check_needs_rehash(hashed_password)
 
 
 class AuthService:
@@ -68,10 +161,17 @@ class AuthService:
         if len(password) < 8:
             raise ValidationError("Password must be at least 8 characters long")
         
-        has_upper = any(c.isupper() for c in password)
-        has_lower = any(c.islower() for c in password)
-        has_digit = any(c.isdigit() for c in password)
-        has_special = any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in password)
+        # One pass over the password, classifying each character
+        has_upper = has_lower = has_digit = has_special = False
+        for c in password:
+            if c.isupper():
+                has_upper = True
+            elif c.islower():
+                has_lower = True
+            elif c.isdigit():
+                has_digit = True
+            elif c in _PASSWORD_SPECIAL_CHARACTERS:
+                has_special = True
         
         errors = []
         if not has_upper:
@@ -90,29 +190,19 @@ class AuthService:
 
     def hash_password(self, password: str) -> str:
         """
-        Hash a password using bcrypt.
-        
-        Always pre-hashes with SHA256 to avoid bcrypt's 72-byte limit.
-        This ensures we can handle passwords of any length securely.
+        Hash a password using Argon2id.
+
+        Argon2 takes input of any length, so no pre-hash is needed.
         """
-        import hashlib
-        
-        # Always pre-hash with SHA256 to avoid bcrypt's 72-byte limit
-        # This is a common and secure pattern for handling passwords of any length
-        password_hash = hashlib.sha256(password.encode('utf-8')).hexdigest()
-        return pwd_context.hash(password_hash)
+        return hash_password(password)
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """
         Verify a password against a hash.
         
-        Always pre-hashes with SHA256 before bcrypt verification to match our hashing strategy.
+        Accepts Argon2id hashes and legacy SHA256-pre-hashed bcrypt hashes.
         """
-        import hashlib
-        
-        # Pre-hash with SHA256 to match our hashing strategy
-        password_hash = hashlib.sha256(plain_password.encode('utf-8')).hexdigest()
-        return pwd_context.verify(password_hash, hashed_password)
+        return verify_password(plain_password, hashed_password)
 
     async def authenticate_user(self, email: str, password: str) -> Optional[UserProfile]:
         """
@@ -128,69 +218,70 @@ class AuthService:
         Raises:
             AuthenticationError: If authentication fails
         """
-        from datetime import datetime, timedelta
-        
         # Get user by email
         user = await self.repository.get_by_email(email)
-        if not user:
-            raise AuthenticationError("Invalid email or password")
 
-        # Check if user has a password (email/password user)
-        if not user.hashed_password:
+        # Unknown user or no password (OAuth-only): still do the hashing work, so the
+        # failure takes as long as a wrong password would
+        if not user or not user.hashed_password:
+            await run_password_hashing(self.verify_password, password, _DUMMY_PASSWORD_HASH)
             raise AuthenticationError("Invalid email or password")
 
         # Check if account is locked
-        if user.locked_until and user.locked_until > datetime.utcnow():
-            remaining_minutes = int((user.locked_until - datetime.utcnow()).total_seconds() / 60)
+        now = datetime.utcnow()
+        if user.locked_until and user.locked_until > now:
+            remaining_minutes = int((user.locked_until - now).total_seconds() / 60)
             raise AuthenticationError(
                 f"Account is locked due to too many failed login attempts. "
                 f"Please try again in {remaining_minutes} minute(s)."
             )
 
-        # Verify password
-        password_valid = self.verify_password(password, user.hashed_password)
+        # Verify password (the hash libraries release the GIL; run it off the event loop)
+        password_valid = await run_password_hashing(
+            self.verify_password, password, user.hashed_password
+        )
         
         if not password_valid:
-            # Increment failed login attempts
-            failed_attempts = (user.failed_login_attempts or 0) + 1
             max_attempts = 5  # Lock after 5 failed attempts
             lockout_minutes = 30  # Lock for 30 minutes
-            
-            if failed_attempts >= max_attempts:
-                # Lock the account
-                locked_until = datetime.utcnow() + timedelta(minutes=lockout_minutes)
-                await self.repository.update_user(
-                    user.id,
-                    failed_login_attempts=failed_attempts,
-                    locked_until=locked_until,
-                )
+
+            # Increment failed login attempts (and lock at the limit) in one UPDATE
+            updated = await self.repository.record_failed_login(
+                user.id,
+                max_attempts=max_attempts,
+                locked_until=now + timedelta(minutes=lockout_minutes),
+            )
+            if updated and updated.failed_login_attempts >= max_attempts:
                 raise AuthenticationError(
                     f"Account has been locked due to too many failed login attempts. "
                     f"Please try again in {lockout_minutes} minutes."
                 )
-            else:
-                # Update failed attempts count
-                await self.repository.update_user(
-                    user.id,
-                    failed_login_attempts=failed_attempts,
-                )
-            
+
             raise AuthenticationError("Invalid email or password")
 
         # Successful login - reset failed attempts and unlock if locked
-        if user.failed_login_attempts > 0 or user.locked_until:
-            await self.repository.update_user(
-                user.id,
-                failed_login_attempts=0,
-                locked_until=None,
-            )
+        reset_lockout = bool(user.failed_login_attempts > 0 or user.locked_until)
 
         # Check if user is active
         if not user.is_active:
+            if reset_lockout:
+                await self.repository.update_user(
+                    user.id,
+                    failed_login_attempts=0,
+                    locked_until=None,
+                )
             raise AuthenticationError("User account is not active")
 
-        # Update last login
-        await self.repository.update_last_login(user.id)
+        # Upgrade legacy bcrypt (or outdated Argon2) hashes now that we have the password
+        new_hash = None
+        if password_needs_rehash(user.hashed_password):
+            new_hash = await run_password_hashing(self.hash_password, password)
+
+        # Update last login, the lockout reset and any upgraded hash in one
+        # UPDATE ... RETURNING, which also refreshes the loaded user
+        user = await self.repository.update_last_login(
+            user.id, reset_lockout=reset_lockout, hashed_password=new_hash
+        ) or user
 
         # Convert to UserProfile
         return self.user_service._user_to_profile(user)
@@ -247,8 +338,6 @@ class AuthService:
         Raises:
             NotFoundError: If user not found
         """
-        import secrets
-        from datetime import datetime, timedelta
         from api_core.services.notifications_service import get_notifications_service
         from api_core.models.notifications import NotificationCreateRequest
         
@@ -278,22 +367,9 @@ class AuthService:
         reset_link = f"{frontend_url}/auth/reset-password/confirm?token={reset_token}"
         
         # Create email content
-        subject = "Reset your password"
-        message = f"""
-Hello,
+        subject = _PASSWORD_RESET_EMAIL_SUBJECT
+        message = _PASSWORD_RESET_EMAIL_TEMPLATE.format(link=reset_link)
 
-You requested to reset your password. Click the link below to reset it:
-
-{reset_link}
-
-This link will expire in 24 hours.
-
-If you didn't request a password reset, please ignore this email. Your password will remain unchanged.
-
-Best regards,
-LexiqAI Team
-        """.strip()
-        
         # Send email via notifications service
         if user.firm_id:
             notifications_service = get_notifications_service(self.repository.session)
@@ -304,7 +380,7 @@ LexiqAI Team
                     to=user.email,
                     subject=subject,
                     message=message,
-                    idempotency_key=f"password_reset_{user.id}_{reset_token[:16]}",
+                    idempotency_key=f"password_reset_{user.id}_{hash_token(reset_token)}",
                 )
             )
             logger.info(f"Password reset email sent to {email} for user {user.id}")
@@ -323,8 +399,6 @@ LexiqAI Team
             ValidationError: If token is invalid or expired
             NotFoundError: If user not found
         """
-        from datetime import datetime
-        
         # Find user by reset token
         user = await self.repository.get_by_reset_token(token)
         if not user:
@@ -339,8 +413,8 @@ LexiqAI Team
         # Validate password strength
         self.validate_password_strength(new_password)
         
-        # Hash new password
-        hashed_password = self.hash_password(new_password)
+        # Hash new password (off the event loop, like verification)
+        hashed_password = await run_password_hashing(self.hash_password, new_password)
         
         # Update password and clear reset token
         await self.repository.update_user(
@@ -365,7 +439,6 @@ LexiqAI Team
         Raises:
             NotFoundError: If user not found
         """
-        import secrets
         from api_core.services.notifications_service import get_notifications_service
         from api_core.models.notifications import NotificationCreateRequest
         
@@ -379,22 +452,9 @@ LexiqAI Team
         verification_link = f"{frontend_url}/auth/verify-email?token={verification_token}"
         
         # Create email content
-        subject = "Verify your email address"
-        message = f"""
-Hello,
-
-Thank you for signing up! Please verify your email address by clicking the link below:
-
-{verification_link}
-
-This link will expire in 24 hours.
-
-If you didn't create an account, please ignore this email.
+        subject = _VERIFICATION_EMAIL_SUBJECT
+        message = _VERIFICATION_EMAIL_TEMPLATE.format(link=verification_link)
 
-Best regards,
-LexiqAI Team
-        """.strip()
-        
         # Send email via notifications service
         notifications_service = get_notifications_service(self.repository.session)
         await notifications_service.create_notification(
@@ -404,7 +464,7 @@ LexiqAI Team
                 to=email,
                 subject=subject,
                 message=message,
-                idempotency_key=f"email_verification_{user_id}_{verification_token[:16]}",
+                idempotency_key=f"email_verification_{user_id}_{hash_token(verification_token)}",
             )
         )
         
@@ -1,14 +1,14 @@
 """Billing and subscription service with business logic."""
 
+import copy
 import json
 import logging
 from datetime import datetime, timedelta
 from decimal import Decimal
+from functools import cached_property, lru_cache
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from api_core.database.models import Invoice, Plan, Subscription, UsageRecord, User
 from api_core.exceptions import ConflictError, NotFoundError, ValidationError
@@ -27,6 +27,84 @@ from api_core.services.stripe_service import StripeService, get_stripe_service
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=512)
+def _parse_plan_features(features_json: str) -> Dict[str, Any]:
+    """
+    Parse a plan's features_json, once per distinct string.
+
+    Plans rarely change, so every plan listing and subscription response would
+    otherwise re-parse the same JSON. The returned dict is shared between callers
+    and must not be mutated.
+    """
+    return json.loads(features_json)
+
+
+def _iso(value: Optional[datetime]) -> str:
+    """Return a timestamp as an ISO 8601 string, or "" when it is unset."""
+    return value.isoformat() if value else ""
+
+
+def _iso_or_none(value: Optional[datetime]) -> Optional[str]:
+    """Return a timestamp as an ISO 8601 string, or None when it is unset."""
+    return value.isoformat() if value else None
+
+
+def _stripe_timestamp(data: Dict[str, Any], key: str) -> datetime:
+    """Convert a Stripe epoch-seconds field to a naive datetime (the epoch when missing)."""
+    return datetime.fromtimestamp(data.get(key, 0), tz=None)
+
+
+def _optional_stripe_timestamp(data: Dict[str, Any], key: str) -> Optional[datetime]:
+    """Convert an optional Stripe epoch-seconds field, or return None when it is unset."""
+    value = data.get(key)
+    return datetime.fromtimestamp(value, tz=None) if value else None
+
+
+# Stripe subscription status -> local subscription status
+_STRIPE_STATUS_MAP: Dict[str, str] = {
+    "trialing": "trialing",
+    "active": "active",
+    "canceled": "canceled",
+    "past_due": "past_due",
+    "unpaid": "past_due",
+}
+
+# Stripe price recurring interval -> local billing cycle
+_STRIPE_INTERVAL_TO_BILLING_CYCLE: Dict[str, str] = {"year": "yearly", "month": "monthly"}
+
+
+def _stripe_billing_cycle(data: Dict[str, Any], default: str) -> str:
+    """
+    Derive the billing cycle from a Stripe subscription's first item price.
+
+    Returns ``default`` when there are no items or the interval has no local cycle.
+    """
+    items = data.get("items", {}).get("data", [])
+    if not items:
+        return default
+    interval = items[0].get("price", {}).get("recurring", {}).get("interval", "month")
+    return _STRIPE_INTERVAL_TO_BILLING_CYCLE.get(interval, default)
+
+
+# How recently a subscription must have been created for a 30-day period to be taken
+# as locally defaulted dates that should be re-synced from Stripe
+_DEFAULT_PERIOD_SYNC_WINDOW = timedelta(minutes=5)
+
+# Shared zero for amount/rate defaults and comparisons (Decimal is immutable)
+_ZERO_AMOUNT = Decimal("0.00")
+
+
+def _response_decimal(value) -> Decimal:
+    """
+    Return ``value`` as the Decimal a validated response would hold.
+
+    Response amounts have always been passed through float() and then validated,
+    which yields ``Decimal(str(float(value)))``; model_construct skips validation,
+    so do the same conversion explicitly to keep the serialized values unchanged.
+    """
+    return Decimal(str(float(value)))
+
+
 def _get_plan_minutes_data(plan) -> tuple[int, Decimal]:
     """
     Get included_minutes and overage_rate_per_minute from Plan.
@@ -40,27 +118,38 @@ def _get_plan_minutes_data(plan) -> tuple[int, Decimal]:
         Tuple of (included_minutes: int, overage_rate_per_minute: Decimal)
     """
     included_minutes = 0
-    overage_rate = Decimal("0.00")
+    overage_rate = _ZERO_AMOUNT
     
     # Try new columns first
-    if hasattr(plan, "included_minutes") and plan.included_minutes is not None:
-        included_minutes = plan.included_minutes
-    if hasattr(plan, "overage_rate_per_minute") and plan.overage_rate_per_minute is not None:
-        overage_rate = Decimal(str(plan.overage_rate_per_minute))
-    
+    minutes = getattr(plan, "included_minutes", None)
+    if minutes is not None:
+        included_minutes = minutes
+    rate = getattr(plan, "overage_rate_per_minute", None)
+    if rate is not None:
+        # Numeric columns already load as Decimal; only other types need the str() hop
+        overage_rate = rate if isinstance(rate, Decimal) else Decimal(str(rate))
+
+    # Columns populated (the common case): no features_json fallback needed
+    if included_minutes or overage_rate != _ZERO_AMOUNT:
+        return included_minutes, overage_rate
+
     # Fallback to features_json if columns are NULL
-    if (included_minutes == 0 and overage_rate == Decimal("0.00")) and plan.features_json:
+    if plan.features_json:
         try:
-            features = json.loads(plan.features_json) if isinstance(plan.features_json, str) else plan.features_json
+            features = (
+                _parse_plan_features(plan.features_json)
+                if isinstance(plan.features_json, str)
+                else plan.features_json
+            )
             if features:
                 if included_minutes == 0 and "included_minutes" in features:
                     included_minutes = features.get("included_minutes") or 0
-                if overage_rate == Decimal("0.00") and "overage_rate_per_minute" in features:
+                if overage_rate == _ZERO_AMOUNT and "overage_rate_per_minute" in features:
                     overage_rate_val = features.get("overage_rate_per_minute")
                     if overage_rate_val is not None:
                         overage_rate = Decimal(str(overage_rate_val))
         except (json.JSONDecodeError, TypeError, ValueError) as e:
-            logger.warning(f"Failed to parse features_json for plan {plan.id}: {e}")
+            logger.warning("Failed to parse features_json for plan %s: %s", plan.id, e)
     
     return included_minutes, overage_rate
 
@@ -77,6 +166,11 @@ class BillingService:
         """
         self.repository = BillingRepository(session)
 
+    @cached_property
+    def stripe_service(self) -> StripeService:
+        """Stripe service for this billing service's session, created on first use."""
+        return get_stripe_service(self.repository.session)
+
     # ==================== Plan Methods ====================
 
     def _plan_to_response(self, plan: Plan) -> PlanResponse:
@@ -92,31 +186,35 @@ class BillingService:
         features = None
         if plan.features_json:
             try:
-                features = json.loads(plan.features_json)
+                features = _parse_plan_features(plan.features_json)
             except (json.JSONDecodeError, TypeError):
-                logger.warning(f"Invalid JSON in plan features for plan {plan.id}")
+                logger.warning("Invalid JSON in plan features for plan %s", plan.id)
 
         # Get minutes data (with fallback to features_json)
         included_minutes, overage_rate = _get_plan_minutes_data(plan)
-        
-        return PlanResponse(
+
+        # Values come from the plan row, so skip validation; the cached features dict
+        # (and anything nested in it) is deep-copied so responses never share it
+        return PlanResponse.model_construct(
             id=plan.id,
             name=plan.name,
             display_name=plan.display_name,
             description=plan.description,
-            price_monthly=float(plan.price_monthly) if plan.price_monthly else None,
-            price_yearly=float(plan.price_yearly) if plan.price_yearly else None,
+            price_monthly=_response_decimal(plan.price_monthly) if plan.price_monthly else None,
+            price_yearly=_response_decimal(plan.price_yearly) if plan.price_yearly else None,
             currency=plan.currency,
-            features=features,
+            features=copy.deepcopy(features) if features is not None else None,
             max_calls_per_month=plan.max_calls_per_month,
             max_users=plan.max_users,
             max_storage_gb=plan.max_storage_gb,
             included_minutes=included_minutes if included_minutes > 0 else None,
-            overage_rate_per_minute=float(overage_rate) if overage_rate > Decimal("0.00") else None,
+            overage_rate_per_minute=(
+                _response_decimal(overage_rate) if overage_rate > _ZERO_AMOUNT else None
+            ),
             is_active=plan.is_active,
             is_public=plan.is_public,
-            created_at=plan.created_at.isoformat() if plan.created_at else "",
-            updated_at=plan.updated_at.isoformat() if plan.updated_at else "",
+            created_at=_iso(plan.created_at),
+            updated_at=_iso(plan.updated_at),
         )
 
     async def get_plan_by_id(self, plan_id: str) -> PlanResponse:
@@ -173,33 +271,32 @@ class BillingService:
                 # Note: This is a sync operation, but we're in a sync context
                 # In practice, the plan should be eagerly loaded, but this is a safety net
                 logger.warning(
-                    f"Plan relationship not loaded for subscription {subscription.id}, "
-                    f"plan_id={subscription.plan_id}. This should not happen with eager loading."
+                    "Plan relationship not loaded for subscription %s, plan_id=%s. "
+                    "This should not happen with eager loading.",
+                    subscription.id,
+                    subscription.plan_id,
                 )
                 # We can't load it here synchronously, so plan_response will be None
                 # The caller should ensure plan is eagerly loaded
 
-        return SubscriptionResponse(
+        # Values come from the subscription row, so skip validation
+        return SubscriptionResponse.model_construct(
             id=subscription.id,
             user_id=subscription.user_id,
             plan_id=subscription.plan_id,
             plan=plan_response,
             status=subscription.status,
             billing_cycle=subscription.billing_cycle,
-            current_period_start=subscription.current_period_start.isoformat()
-            if subscription.current_period_start
-            else "",
-            current_period_end=subscription.current_period_end.isoformat()
-            if subscription.current_period_end
-            else "",
+            current_period_start=_iso(subscription.current_period_start),
+            current_period_end=_iso(subscription.current_period_end),
             payment_provider=subscription.payment_provider,
             payment_method_id=subscription.payment_method_id,
-            canceled_at=subscription.canceled_at.isoformat() if subscription.canceled_at else None,
+            canceled_at=_iso_or_none(subscription.canceled_at),
             cancel_at_period_end=subscription.cancel_at_period_end,
-            trial_start=subscription.trial_start.isoformat() if subscription.trial_start else None,
-            trial_end=subscription.trial_end.isoformat() if subscription.trial_end else None,
-            created_at=subscription.created_at.isoformat() if subscription.created_at else "",
-            updated_at=subscription.updated_at.isoformat() if subscription.updated_at else "",
+            trial_start=_iso_or_none(subscription.trial_start),
+            trial_end=_iso_or_none(subscription.trial_end),
+            created_at=_iso(subscription.created_at),
+            updated_at=_iso(subscription.updated_at),
         )
 
     async def sync_subscription_from_stripe(
@@ -217,13 +314,8 @@ class BillingService:
         Raises:
             ValidationError: If Stripe sync fails
         """
-        # Get subscription with plan eagerly loaded
-        result = await self.repository.session.execute(
-            select(Subscription)
-            .options(selectinload(Subscription.plan))
-            .where(Subscription.id == subscription_id)
-        )
-        subscription = result.scalar_one_or_none()
+        # Loaded once with its plan; the updates below modify this same instance
+        subscription = await self.repository.subscriptions.get_with_plan(subscription_id)
         if not subscription:
             return None
 
@@ -232,65 +324,48 @@ class BillingService:
             subscription.payment_provider != "stripe"
             or not subscription.payment_provider_subscription_id
         ):
-            logger.debug(f"Subscription {subscription_id} is not a Stripe subscription, skipping sync")
+            logger.debug(
+                "Subscription %s is not a Stripe subscription, skipping sync",
+                subscription_id,
+            )
             return self._subscription_to_response(subscription, include_plan=True)
 
         try:
-            stripe_service = get_stripe_service(self.repository.session)
+            stripe_service = self.stripe_service
             stripe_subscription = await stripe_service.get_subscription(
                 subscription.payment_provider_subscription_id
             )
 
             # Extract data from Stripe subscription
-            period_start = datetime.fromtimestamp(
-                stripe_subscription.get("current_period_start", 0), tz=None
-            )
-            period_end = datetime.fromtimestamp(
-                stripe_subscription.get("current_period_end", 0), tz=None
-            )
+            period_start = _stripe_timestamp(stripe_subscription, "current_period_start")
+            period_end = _stripe_timestamp(stripe_subscription, "current_period_end")
 
-            trial_start = None
-            trial_end = None
-            if stripe_subscription.get("trial_start"):
-                trial_start = datetime.fromtimestamp(
-                    stripe_subscription.get("trial_start", 0), tz=None
-                )
-            if stripe_subscription.get("trial_end"):
-                trial_end = datetime.fromtimestamp(
-                    stripe_subscription.get("trial_end", 0), tz=None
-                )
+            trial_start = _optional_stripe_timestamp(stripe_subscription, "trial_start")
+            trial_end = _optional_stripe_timestamp(stripe_subscription, "trial_end")
 
             # Extract plan_id from Stripe metadata if missing locally
             plan_id = subscription.plan_id
-            stripe_metadata = stripe_subscription.get("metadata", {})
-            if not plan_id and stripe_metadata.get("plan_id"):
-                plan_id = stripe_metadata.get("plan_id")
-                logger.info(f"Extracted plan_id {plan_id} from Stripe metadata for subscription {subscription_id}")
+            metadata_plan_id = stripe_subscription.get("metadata", {}).get("plan_id")
+            if not plan_id and metadata_plan_id:
+                plan_id = metadata_plan_id
+                logger.info(
+                    "Extracted plan_id %s from Stripe metadata for subscription %s",
+                    plan_id,
+                    subscription_id,
+                )
 
             # Map Stripe status
             stripe_status = stripe_subscription.get("status", "")
-            status_mapping = {
-                "trialing": "trialing",
-                "active": "active",
-                "canceled": "canceled",
-                "past_due": "past_due",
-                "unpaid": "past_due",
-            }
-            new_status = status_mapping.get(stripe_status, subscription.status)
+            new_status = _STRIPE_STATUS_MAP.get(stripe_status, subscription.status)
 
             # If trial is active, ensure status is trialing
             if trial_end and trial_end > datetime.utcnow():
                 new_status = "trialing"
 
-            # Determine billing cycle from Stripe subscription
-            items = stripe_subscription.get("items", {}).get("data", [])
-            billing_cycle = subscription.billing_cycle or "monthly"  # Default to existing or monthly
-            if items:
-                interval = items[0].get("price", {}).get("recurring", {}).get("interval", "month")
-                if interval == "year":
-                    billing_cycle = "yearly"
-                elif interval == "month":
-                    billing_cycle = "monthly"
+            # Determine billing cycle from Stripe subscription (default to existing or monthly)
+            billing_cycle = _stripe_billing_cycle(
+                stripe_subscription, default=subscription.billing_cycle or "monthly"
+            )
 
             # Update subscription with Stripe data
             updates = {
@@ -303,36 +378,29 @@ class BillingService:
                 "billing_cycle": billing_cycle,  # Always update billing_cycle from Stripe
             }
             
-            # Update plan_id if we extracted it from Stripe
+            # Update plan_id if we extracted it from Stripe, keeping the loaded plan
+            # relationship in step with it
             if plan_id and plan_id != subscription.plan_id:
-                updates["plan_id"] = plan_id
+                new_plan = await self.repository.plans.get_by_id(plan_id)
+                if new_plan:
+                    updates["plan"] = new_plan
+                else:
+                    updates["plan_id"] = plan_id
 
             # Update canceled_at if subscription is canceled
-            if new_status == "canceled" and stripe_subscription.get("canceled_at"):
-                updates["canceled_at"] = datetime.fromtimestamp(
-                    stripe_subscription.get("canceled_at", 0), tz=None
-                )
+            if new_status == "canceled":
+                canceled_at = _optional_stripe_timestamp(stripe_subscription, "canceled_at")
+                if canceled_at:
+                    updates["canceled_at"] = canceled_at
 
-            # Update subscription
+            # Update subscription (the identity map returns the instance loaded above)
             await self.repository.subscriptions.update(subscription_id, **updates)
 
-            # Reload with plan
-            result = await self.repository.session.execute(
-                select(Subscription)
-                .options(selectinload(Subscription.plan))
-                .where(Subscription.id == subscription_id)
-            )
-            updated_subscription = result.scalar_one_or_none()
-
-            logger.info(f"Synced subscription {subscription_id} from Stripe")
-            return (
-                self._subscription_to_response(updated_subscription, include_plan=True)
-                if updated_subscription
-                else None
-            )
+            logger.info("Synced subscription %s from Stripe", subscription_id)
+            return self._subscription_to_response(subscription, include_plan=True)
 
         except Exception as e:
-            logger.error(f"Error syncing subscription {subscription_id} from Stripe: {e}")
+            logger.error("Error syncing subscription %s from Stripe: %s", subscription_id, e)
             # Return current subscription even if sync fails
             return self._subscription_to_response(subscription, include_plan=True)
 
@@ -383,30 +451,28 @@ class BillingService:
             elif subscription.current_period_start and subscription.current_period_end:
                 period_delta = (subscription.current_period_end - subscription.current_period_start).days
                 # If period is exactly 30 days and subscription was created recently, might be default
-                if period_delta == 30 and (datetime.utcnow() - subscription.created_at).total_seconds() < 300:
+                # (the period check runs first, so the clock is only read for 30-day periods)
+                if (
+                    period_delta == 30
+                    and datetime.utcnow() - subscription.created_at < _DEFAULT_PERIOD_SYNC_WINDOW
+                ):
                     should_sync = True
                     reason = "period dates appear to be defaults"
             
             if should_sync:
                 logger.info(
-                    f"Auto-syncing subscription {subscription.id} from Stripe due to: {reason}"
+                    "Auto-syncing subscription %s from Stripe due to: %s",
+                    subscription.id,
+                    reason,
                 )
                 synced = await self.sync_subscription_from_stripe(subscription.id)
                 if synced:
                     return synced
                 # If sync failed, continue with original subscription (might be network issue)
-                logger.warning(f"Auto-sync failed for subscription {subscription.id}, returning original subscription")
-        
-        # If plan relationship is not loaded but plan_id exists, try to load it
-        if subscription.plan_id and not subscription.plan:
-            logger.warning(
-                f"Plan relationship not loaded for subscription {subscription.id}, "
-                f"attempting to load plan {subscription.plan_id}"
-            )
-            plan = await self.repository.plans.get_by_id(subscription.plan_id)
-            if plan:
-                # Manually set the plan on the subscription object (won't persist, but will work for this response)
-                subscription.plan = plan
+                logger.warning(
+                    "Auto-sync failed for subscription %s, returning original subscription",
+                    subscription.id,
+                )
 
         return self._subscription_to_response(subscription, include_plan=include_plan)
 
@@ -422,14 +488,15 @@ class BillingService:
             - can_make_calls: True if user can make calls, False otherwise
             - reason: Reason why calls are blocked (None if allowed)
         """
-        subscription = await self.repository.subscriptions.get_by_user_id(user_id)
+        # Only the status is needed, so skip loading the subscription row and its plan
+        status = await self.repository.subscriptions.get_status_by_user_id(user_id)
         
         # No subscription = blocked
-        if not subscription:
+        if not status:
             return False, "no_active_subscription"
         
         # Check subscription status
-        status = subscription.status.lower()
+        status = status.lower()
         
         # Active and trialing subscriptions allow calls
         if status in ["active", "trialing"]:
@@ -483,29 +550,22 @@ class BillingService:
         if billing_cycle not in ["monthly", "yearly"]:
             raise ValidationError("Billing cycle must be 'monthly' or 'yearly'")
 
-        # Check if plan exists
-        plan = await self.repository.plans.get_by_id(plan_id)
+        # Plan, user and any current subscription are checked in one query
+        plan, user, has_current = await self.repository.subscriptions.get_creation_context(
+            user_id, plan_id
+        )
         if not plan:
             raise NotFoundError(f"Plan with ID {plan_id} not found")
-
-        # Get user
-        from api_core.repositories.user_repository import UserRepository
-
-        user_repo = UserRepository(self.repository.session)
-        user = await user_repo.get_by_id(user_id)
         if not user:
             raise NotFoundError(f"User with ID {user_id} not found")
-
-        # Check if user already has active subscription
-        existing = await self.repository.subscriptions.get_by_user_id(user_id)
-        if existing:
+        if has_current:
             raise ConflictError("User already has an active subscription")
 
         # If using Stripe and payment method provided, create subscription in Stripe
         stripe_subscription_id = payment_provider_subscription_id
         if use_stripe and payment_method_id:
             try:
-                stripe_service = get_stripe_service(self.repository.session)
+                stripe_service = self.stripe_service
                 stripe_subscription = await stripe_service.create_subscription(
                     user=user,
                     plan=plan,
@@ -515,10 +575,12 @@ class BillingService:
                 stripe_subscription_id = stripe_subscription.get("id")
                 payment_provider = "stripe"
                 logger.info(
-                    f"Created Stripe subscription {stripe_subscription_id} for user {user_id}"
+                    "Created Stripe subscription %s for user %s",
+                    stripe_subscription_id,
+                    user_id,
                 )
             except Exception as e:
-                logger.error(f"Failed to create Stripe subscription: {e}")
+                logger.error("Failed to create Stripe subscription: %s", e)
                 raise ValidationError(f"Failed to create Stripe subscription: {str(e)}")
 
         # Calculate billing period (use provided dates if available, otherwise calculate)
@@ -558,7 +620,7 @@ class BillingService:
             payment_method_id=payment_method_id,  # Pass through kwargs
         )
 
-        logger.info(f"Created subscription {subscription.id} for user {user_id}")
+        logger.info("Created subscription %s for user %s", subscription.id, user_id)
         return self._subscription_to_response(subscription, include_plan=True)
 
     async def update_subscription(
@@ -578,13 +640,8 @@ class BillingService:
             NotFoundError: If subscription not found
             ValidationError: If updates are invalid
         """
-        # Get subscription with plan eagerly loaded
-        result = await self.repository.session.execute(
-            select(Subscription)
-            .options(selectinload(Subscription.plan))
-            .where(Subscription.id == subscription_id)
-        )
-        subscription = result.scalar_one_or_none()
+        # Loaded once with its plan; the updates below modify this same instance
+        subscription = await self.repository.subscriptions.get_with_plan(subscription_id)
         if not subscription:
             raise NotFoundError(f"Subscription with ID {subscription_id} not found")
 
@@ -604,16 +661,8 @@ class BillingService:
         updated = await self.repository.subscriptions.update(subscription_id, **updates)
         if not updated:
             raise NotFoundError(f"Subscription with ID {subscription_id} not found")
-        
-        # Reload with plan to ensure it's available
-        result = await self.repository.session.execute(
-            select(Subscription)
-            .options(selectinload(Subscription.plan))
-            .where(Subscription.id == subscription_id)
-        )
-        updated_with_plan = result.scalar_one_or_none()
 
-        return self._subscription_to_response(updated_with_plan, include_plan=True)
+        return self._subscription_to_response(updated, include_plan=True)
 
     async def cancel_subscription(
         self, subscription_id: str, cancel_at_period_end: bool = True
@@ -632,29 +681,25 @@ class BillingService:
             NotFoundError: If subscription not found
             ValidationError: If Stripe cancellation fails
         """
-        # Get subscription with plan eagerly loaded to avoid greenlet_spawn error
-        result = await self.repository.session.execute(
-            select(Subscription)
-            .options(selectinload(Subscription.plan))
-            .where(Subscription.id == subscription_id)
-        )
-        subscription = result.scalar_one_or_none()
+        # Loaded once with its plan; the updates below modify this same instance
+        subscription = await self.repository.subscriptions.get_with_plan(subscription_id)
         if not subscription:
             raise NotFoundError(f"Subscription with ID {subscription_id} not found")
 
         # Cancel in Stripe if subscription has Stripe ID
         if subscription.payment_provider == "stripe" and subscription.payment_provider_subscription_id:
             try:
-                stripe_service = get_stripe_service(self.repository.session)
+                stripe_service = self.stripe_service
                 await stripe_service.cancel_subscription(
                     stripe_subscription_id=subscription.payment_provider_subscription_id,
                     cancel_at_period_end=cancel_at_period_end,
                 )
                 logger.info(
-                    f"Canceled Stripe subscription {subscription.payment_provider_subscription_id}"
+                    "Canceled Stripe subscription %s",
+                    subscription.payment_provider_subscription_id,
                 )
             except Exception as e:
-                logger.error(f"Failed to cancel Stripe subscription: {e}")
+                logger.error("Failed to cancel Stripe subscription: %s", e)
                 # Continue with local cancellation even if Stripe fails
 
         # Cancel in database
@@ -665,13 +710,18 @@ class BillingService:
             raise NotFoundError(f"Subscription with ID {subscription_id} not found")
 
         logger.info(
-            f"Canceled subscription {subscription_id} (at_period_end={cancel_at_period_end}). "
-            f"Status: {canceled_subscription.status}, cancel_at_period_end: {canceled_subscription.cancel_at_period_end}"
+            "Canceled subscription %s (at_period_end=%s). Status: %s, cancel_at_period_end: %s",
+            subscription_id,
+            cancel_at_period_end,
+            canceled_subscription.status,
+            canceled_subscription.cancel_at_period_end,
         )
         response = self._subscription_to_response(canceled_subscription, include_plan=True)
         logger.debug(
-            f"Subscription response for {subscription_id}: "
-            f"status={response.status}, cancel_at_period_end={response.cancel_at_period_end}"
+            "Subscription response for %s: status=%s, cancel_at_period_end=%s",
+            subscription_id,
+            response.status,
+            response.cancelAtPeriodEnd,
         )
         return response
 
@@ -693,13 +743,8 @@ class BillingService:
             NotFoundError: If subscription or plan not found
             ValidationError: If upgrade is invalid or Stripe operation fails
         """
-        # Get subscription with plan eagerly loaded
-        result = await self.repository.session.execute(
-            select(Subscription)
-            .options(selectinload(Subscription.plan))
-            .where(Subscription.id == subscription_id)
-        )
-        subscription = result.scalar_one_or_none()
+        # Loaded once with its plan; the updates below modify this same instance
+        subscription = await self.repository.subscriptions.get_with_plan(subscription_id)
         if not subscription:
             raise NotFoundError(f"Subscription with ID {subscription_id} not found")
 
@@ -710,22 +755,23 @@ class BillingService:
         # Update in Stripe if subscription has Stripe ID
         if subscription.payment_provider == "stripe" and subscription.payment_provider_subscription_id:
             try:
-                stripe_service = get_stripe_service(self.repository.session)
+                stripe_service = self.stripe_service
                 await stripe_service.update_subscription_plan(
                     stripe_subscription_id=subscription.payment_provider_subscription_id,
                     new_plan=new_plan,
                     prorate=prorate,
                 )
                 logger.info(
-                    f"Updated Stripe subscription {subscription.payment_provider_subscription_id} "
-                    f"to plan {new_plan_id}"
+                    "Updated Stripe subscription %s to plan %s",
+                    subscription.payment_provider_subscription_id,
+                    new_plan_id,
                 )
             except Exception as e:
-                logger.error(f"Failed to update Stripe subscription: {e}")
+                logger.error("Failed to update Stripe subscription: %s", e)
                 raise ValidationError(f"Failed to update Stripe subscription: {str(e)}")
 
-        # Update plan in database
-        updates = {"plan_id": new_plan_id}
+        # Update plan in database (setting the relationship keeps the loaded plan current)
+        updates = {"plan": new_plan}
         if prorate:
             # Calculate prorated period end based on remaining time
             now = datetime.utcnow()
@@ -738,17 +784,9 @@ class BillingService:
                 )
 
         updated = await self.repository.subscriptions.update(subscription_id, **updates)
-        logger.info(f"Upgraded subscription {subscription_id} to plan {new_plan_id}")
-        
-        # Reload with plan to ensure it's available
-        result = await self.repository.session.execute(
-            select(Subscription)
-            .options(selectinload(Subscription.plan))
-            .where(Subscription.id == subscription_id)
-        )
-        updated_with_plan = result.scalar_one_or_none()
-        
-        return self._subscription_to_response(updated_with_plan, include_plan=True)
+        logger.info("Upgraded subscription %s to plan %s", subscription_id, new_plan_id)
+
+        return self._subscription_to_response(updated, include_plan=True)
 
     async def renew_subscription(self, subscription_id: str) -> SubscriptionResponse:
         """
@@ -763,13 +801,8 @@ class BillingService:
         Raises:
             NotFoundError: If subscription not found
         """
-        # Get subscription with plan eagerly loaded
-        result = await self.repository.session.execute(
-            select(Subscription)
-            .options(selectinload(Subscription.plan))
-            .where(Subscription.id == subscription_id)
-        )
-        subscription = result.scalar_one_or_none()
+        # Loaded once with its plan; the updates below modify this same instance
+        subscription = await self.repository.subscriptions.get_with_plan(subscription_id)
         if not subscription:
             raise NotFoundError(f"Subscription with ID {subscription_id} not found")
 
@@ -786,17 +819,9 @@ class BillingService:
         if not updated:
             raise NotFoundError(f"Subscription with ID {subscription_id} not found")
 
-        logger.info(f"Renewed subscription {subscription_id}")
-        
-        # Reload with plan to ensure it's available
-        result = await self.repository.session.execute(
-            select(Subscription)
-            .options(selectinload(Subscription.plan))
-            .where(Subscription.id == subscription_id)
-        )
-        updated_with_plan = result.scalar_one_or_none()
-        
-        return self._subscription_to_response(updated_with_plan, include_plan=True)
+        logger.info("Renewed subscription %s", subscription_id)
+
+        return self._subscription_to_response(updated, include_plan=True)
 
     # ==================== Invoice Methods ====================
 
@@ -815,11 +840,9 @@ class BillingService:
             try:
                 items_data = json.loads(invoice.items_json)
                 if isinstance(items_data, list):
-                    from api_core.models.billing import InvoiceItem
-
                     items = [InvoiceItem(**item) for item in items_data]
             except (json.JSONDecodeError, TypeError, ValueError):
-                logger.warning(f"Invalid JSON in invoice items for invoice {invoice.id}")
+                logger.warning("Invalid JSON in invoice items for invoice %s", invoice.id)
 
         return InvoiceResponse(
             id=invoice.id,
@@ -830,12 +853,12 @@ class BillingService:
             currency=invoice.currency,
             tax_amount=float(invoice.tax_amount) if invoice.tax_amount else None,
             status=invoice.status,
-            paid_at=invoice.paid_at.isoformat() if invoice.paid_at else None,
-            due_date=invoice.due_date.isoformat() if invoice.due_date else "",
+            paid_at=_iso_or_none(invoice.paid_at),
+            due_date=_iso(invoice.due_date),
             payment_provider=invoice.payment_provider,
             items=items,
-            created_at=invoice.created_at.isoformat() if invoice.created_at else "",
-            updated_at=invoice.updated_at.isoformat() if invoice.updated_at else "",
+            created_at=_iso(invoice.created_at),
+            updated_at=_iso(invoice.updated_at),
         )
 
     async def get_user_invoices(
@@ -892,9 +915,9 @@ class BillingService:
             feature=usage_record.feature,
             quantity=usage_record.quantity,
             unit=usage_record.unit,
-            period_start=usage_record.period_start.isoformat() if usage_record.period_start else "",
-            period_end=usage_record.period_end.isoformat() if usage_record.period_end else "",
-            created_at=usage_record.created_at.isoformat() if usage_record.created_at else "",
+            period_start=_iso(usage_record.period_start),
+            period_end=_iso(usage_record.period_end),
+            created_at=_iso(usage_record.created_at),
         )
 
     async def track_usage(
@@ -929,7 +952,7 @@ class BillingService:
             period_end=period_end,
         )
 
-        logger.debug(f"Tracked usage: {feature} ({quantity} {unit}) for user {user_id}")
+        logger.debug("Tracked usage: %s (%s %s) for user %s", feature, quantity, unit, user_id)
         return self._usage_record_to_response(usage_record)
 
     async def get_usage_summary(
@@ -1048,7 +1071,7 @@ class BillingService:
         """
         subscription = await self.repository.subscriptions.get_by_user_id(user_id)
         if not subscription:
-            return Decimal("0.00")
+            return _ZERO_AMOUNT
 
         plan = subscription.plan
         if not plan:
@@ -1064,7 +1087,7 @@ class BillingService:
         included_minutes, overage_rate = _get_plan_minutes_data(plan)
 
         if included_minutes == 0:  # Unlimited plan
-            return Decimal("0.00")
+            return _ZERO_AMOUNT
 
         overage_minutes = max(0, total_minutes - included_minutes)
         return Decimal(overage_minutes) * overage_rate
@@ -1095,12 +1118,7 @@ class BillingService:
             ValidationError: If invoice generation fails
         """
         # Get subscription with plan eagerly loaded
-        result = await self.repository.session.execute(
-            select(Subscription)
-            .options(selectinload(Subscription.plan))
-            .where(Subscription.id == subscription_id)
-        )
-        subscription = result.scalar_one_or_none()
+        subscription = await self.repository.subscriptions.get_with_plan(subscription_id)
         if not subscription:
             raise NotFoundError(f"Subscription with ID {subscription_id} not found")
 
@@ -1109,7 +1127,7 @@ class BillingService:
             plan = await self.repository.plans.get_by_id(subscription.plan_id)
 
         # Calculate base subscription amount
-        base_amount = Decimal("0.00")
+        base_amount = _ZERO_AMOUNT
         if subscription.billing_cycle == "monthly" and plan.price_monthly:
             base_amount = Decimal(str(plan.price_monthly))
         elif subscription.billing_cycle == "yearly" and plan.price_yearly:
@@ -1169,8 +1187,12 @@ class BillingService:
         )
 
         logger.info(
-            f"Generated invoice {invoice.id} for subscription {subscription_id}: "
-            f"${total_amount} (base: ${base_amount}, overage: ${overage_amount})"
+            "Generated invoice %s for subscription %s: $%s (base: $%s, overage: $%s)",
+            invoice.id,
+            subscription_id,
+            total_amount,
+            base_amount,
+            overage_amount,
         )
 
         return self._invoice_to_response(invoice)
@@ -1191,7 +1213,7 @@ class BillingService:
         subscription_id = session_data.get("subscription")
 
         if not user_id or not plan_id or not subscription_id:
-            logger.warning(f"Incomplete checkout session data: {session_data}")
+            logger.warning("Incomplete checkout session data: %s", session_data)
             return
 
         # Check if subscription already exists
@@ -1199,41 +1221,24 @@ class BillingService:
             "stripe", subscription_id
         )
         if existing:
-            logger.info(f"Subscription already exists for Stripe subscription {subscription_id}")
+            logger.info("Subscription already exists for Stripe subscription %s", subscription_id)
             return
 
         # Get subscription details from Stripe
         try:
-            stripe_service = get_stripe_service(self.repository.session)
+            stripe_service = self.stripe_service
             stripe_subscription = await stripe_service.get_subscription(subscription_id)
 
             # Extract billing period from Stripe subscription
-            period_start = datetime.fromtimestamp(
-                stripe_subscription.get("current_period_start", 0), tz=None
-            )
-            period_end = datetime.fromtimestamp(
-                stripe_subscription.get("current_period_end", 0), tz=None
-            )
+            period_start = _stripe_timestamp(stripe_subscription, "current_period_start")
+            period_end = _stripe_timestamp(stripe_subscription, "current_period_end")
             
             # Extract trial period from Stripe subscription
-            trial_start = None
-            trial_end = None
-            if stripe_subscription.get("trial_start"):
-                trial_start = datetime.fromtimestamp(
-                    stripe_subscription.get("trial_start", 0), tz=None
-                )
-            if stripe_subscription.get("trial_end"):
-                trial_end = datetime.fromtimestamp(
-                    stripe_subscription.get("trial_end", 0), tz=None
-                )
+            trial_start = _optional_stripe_timestamp(stripe_subscription, "trial_start")
+            trial_end = _optional_stripe_timestamp(stripe_subscription, "trial_end")
             
             # Determine billing cycle from Stripe subscription
-            items = stripe_subscription.get("items", {}).get("data", [])
-            billing_cycle = "monthly"  # Default
-            if items:
-                interval = items[0].get("price", {}).get("recurring", {}).get("interval", "month")
-                if interval == "year":
-                    billing_cycle = "yearly"
+            billing_cycle = _stripe_billing_cycle(stripe_subscription, default="monthly")
             
             # Determine subscription status from Stripe
             stripe_status = stripe_subscription.get("status", "active")
@@ -1272,11 +1277,12 @@ class BillingService:
                 )
 
             logger.info(
-                f"Created subscription from checkout session for user {user_id}, "
-                f"Stripe subscription {subscription_id}"
+                "Created subscription from checkout session for user %s, Stripe subscription %s",
+                user_id,
+                subscription_id,
             )
         except Exception as e:
-            logger.error(f"Error handling checkout completed: {e}", exc_info=True)
+            logger.error("Error handling checkout completed: %s", e, exc_info=True)
             raise
 
     async def handle_subscription_created(self, subscription_data: Dict[str, Any]) -> None:
@@ -1291,7 +1297,7 @@ class BillingService:
         plan_id = subscription_data.get("metadata", {}).get("plan_id")
 
         if not subscription_id:
-            logger.warning(f"Missing subscription ID in subscription.created event")
+            logger.warning("Missing subscription ID in subscription.created event")
             return
 
         # Check if subscription already exists
@@ -1299,37 +1305,20 @@ class BillingService:
             "stripe", subscription_id
         )
         if existing:
-            logger.info(f"Subscription already exists for Stripe subscription {subscription_id}")
+            logger.info("Subscription already exists for Stripe subscription %s", subscription_id)
             return
 
         if user_id and plan_id:
             # Extract billing period from Stripe subscription
-            period_start = datetime.fromtimestamp(
-                subscription_data.get("current_period_start", 0), tz=None
-            )
-            period_end = datetime.fromtimestamp(
-                subscription_data.get("current_period_end", 0), tz=None
-            )
+            period_start = _stripe_timestamp(subscription_data, "current_period_start")
+            period_end = _stripe_timestamp(subscription_data, "current_period_end")
             
             # Extract trial period
-            trial_start = None
-            trial_end = None
-            if subscription_data.get("trial_start"):
-                trial_start = datetime.fromtimestamp(
-                    subscription_data.get("trial_start", 0), tz=None
-                )
-            if subscription_data.get("trial_end"):
-                trial_end = datetime.fromtimestamp(
-                    subscription_data.get("trial_end", 0), tz=None
-                )
+            trial_start = _optional_stripe_timestamp(subscription_data, "trial_start")
+            trial_end = _optional_stripe_timestamp(subscription_data, "trial_end")
             
             # Determine billing cycle
-            items = subscription_data.get("items", {}).get("data", [])
-            billing_cycle = "monthly"
-            if items:
-                interval = items[0].get("price", {}).get("recurring", {}).get("interval", "month")
-                if interval == "year":
-                    billing_cycle = "yearly"
+            billing_cycle = _stripe_billing_cycle(subscription_data, default="monthly")
 
             await self.create_subscription(
                 user_id=user_id,
@@ -1344,7 +1333,7 @@ class BillingService:
                 trial_end=trial_end,
             )
 
-            logger.info(f"Created subscription from Stripe event for user {user_id}")
+            logger.info("Created subscription from Stripe event for user %s", user_id)
 
     async def handle_subscription_updated(self, subscription_data: Dict[str, Any]) -> None:
         """
@@ -1363,50 +1352,35 @@ class BillingService:
             "stripe", subscription_id
         )
         if not subscription:
-            logger.warning(f"Subscription not found for Stripe subscription {subscription_id}")
+            logger.warning("Subscription not found for Stripe subscription %s", subscription_id)
             return
 
         # Update subscription status
         stripe_status = subscription_data.get("status", "")
-        status_mapping = {
-            "trialing": "trialing",
-            "active": "active",
-            "canceled": "canceled",
-            "past_due": "past_due",
-            "unpaid": "past_due",
-        }
-        new_status = status_mapping.get(stripe_status, subscription.status)
+        new_status = _STRIPE_STATUS_MAP.get(stripe_status, subscription.status)
         
         # Also update trial dates if present
-        trial_start = None
-        trial_end = None
-        if subscription_data.get("trial_start"):
-            trial_start = datetime.fromtimestamp(
-                subscription_data.get("trial_start", 0), tz=None
-            )
-        if subscription_data.get("trial_end"):
-            trial_end = datetime.fromtimestamp(
-                subscription_data.get("trial_end", 0), tz=None
-            )
+        trial_start = _optional_stripe_timestamp(subscription_data, "trial_start")
+        trial_end = _optional_stripe_timestamp(subscription_data, "trial_end")
         
         # If trial is active, ensure status is trialing
         if trial_end and trial_end > datetime.utcnow():
             new_status = "trialing"
 
         # Update billing period
-        period_start = datetime.fromtimestamp(
-            subscription_data.get("current_period_start", 0), tz=None
-        )
-        period_end = datetime.fromtimestamp(
-            subscription_data.get("current_period_end", 0), tz=None
-        )
+        period_start = _stripe_timestamp(subscription_data, "current_period_start")
+        period_end = _stripe_timestamp(subscription_data, "current_period_end")
 
         # Extract plan_id from Stripe metadata if missing locally
         plan_id = subscription.plan_id
         stripe_metadata = subscription_data.get("metadata", {})
         if not plan_id and stripe_metadata.get("plan_id"):
             plan_id = stripe_metadata.get("plan_id")
-            logger.info(f"Extracted plan_id {plan_id} from Stripe metadata for subscription {subscription.id}")
+            logger.info(
+                "Extracted plan_id %s from Stripe metadata for subscription %s",
+                plan_id,
+                subscription.id,
+            )
 
         updates = {
             "status": new_status,
@@ -1435,7 +1409,7 @@ class BillingService:
             updates["cancel_at_period_end"] = cancel_at_period_end
 
         await self.repository.subscriptions.update(subscription.id, **updates)
-        logger.info(f"Updated subscription {subscription.id} from Stripe event")
+        logger.info("Updated subscription %s from Stripe event", subscription.id)
 
     async def handle_subscription_deleted(self, subscription_data: Dict[str, Any]) -> None:
         """
@@ -1454,12 +1428,12 @@ class BillingService:
             "stripe", subscription_id
         )
         if not subscription:
-            logger.warning(f"Subscription not found for Stripe subscription {subscription_id}")
+            logger.warning("Subscription not found for Stripe subscription %s", subscription_id)
             return
 
         # Cancel subscription
         await self.cancel_subscription(subscription.id, cancel_at_period_end=False)
-        logger.info(f"Canceled subscription {subscription.id} from Stripe deletion event")
+        logger.info("Canceled subscription %s from Stripe deletion event", subscription.id)
 
     async def handle_invoice_paid(self, invoice_data: Dict[str, Any]) -> None:
         """
@@ -1483,9 +1457,9 @@ class BillingService:
 
         if invoice:
             # Mark as paid
-            paid_at = datetime.fromtimestamp(invoice_data.get("paid", 0), tz=None)
+            paid_at = _stripe_timestamp(invoice_data, "paid")
             await self.repository.invoices.mark_as_paid(invoice.id, paid_at=paid_at)
-            logger.info(f"Marked invoice {invoice.id} as paid")
+            logger.info("Marked invoice %s as paid", invoice.id)
         else:
             # Invoice might not exist yet, create it if we have subscription
             if subscription_id:
@@ -1494,12 +1468,8 @@ class BillingService:
                 )
                 if subscription:
                     # Generate invoice for the period
-                    period_start = datetime.fromtimestamp(
-                        invoice_data.get("period_start", 0), tz=None
-                    )
-                    period_end = datetime.fromtimestamp(
-                        invoice_data.get("period_end", 0), tz=None
-                    )
+                    period_start = _stripe_timestamp(invoice_data, "period_start")
+                    period_end = _stripe_timestamp(invoice_data, "period_end")
                     await self.generate_billing_invoice(
                         subscription.id, period_start, period_end
                     )
@@ -1522,8 +1492,10 @@ class BillingService:
             )
             if invoice:
                 # Update invoice status
-                await self.repository.invoices.update(invoice.id, status="uncollectible")
-                logger.warning(f"Marked invoice {invoice.id} as uncollectible")
+                await self.repository.invoices.update(
+                    invoice.id, flush=False, status="uncollectible"
+                )
+                logger.warning("Marked invoice %s as uncollectible", invoice.id)
 
         # Optionally suspend subscription after multiple failures
         if subscription_id:
@@ -1535,7 +1507,7 @@ class BillingService:
                 await self.repository.subscriptions.update(
                     subscription.id, status="past_due"
                 )
-                logger.warning(f"Updated subscription {subscription.id} to past_due status")
+                logger.warning("Updated subscription %s to past_due status", subscription.id)
 
     async def handle_payment_webhook(
         self, provider: str, event_type: str, event_data: Dict[str, Any]
@@ -1551,10 +1523,10 @@ class BillingService:
         Note:
             This method routes webhook events to specific handlers.
         """
-        logger.info(f"Received {provider} webhook: {event_type}")
+        logger.info("Received %s webhook: %s", provider, event_type)
 
         if provider != "stripe":
-            logger.warning(f"Unsupported payment provider: {provider}")
+            logger.warning("Unsupported payment provider: %s", provider)
             return
 
         try:
@@ -1571,11 +1543,11 @@ class BillingService:
             elif event_type == "invoice.payment_failed":
                 await self.handle_invoice_payment_failed(event_data)
             else:
-                logger.debug(f"Unhandled webhook event type: {event_type}")
+                logger.debug("Unhandled webhook event type: %s", event_type)
 
-            logger.debug(f"Processed {provider} webhook: {event_type}")
+            logger.debug("Processed %s webhook: %s", provider, event_type)
         except Exception as e:
-            logger.error(f"Error processing webhook {event_type}: {e}", exc_info=True)
+            logger.error("Error processing webhook %s: %s", event_type, e, exc_info=True)
             raise
 
 
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
 import logging
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -21,6 +24,23 @@ from api_core.repositories.conversations_repository import (
 logger = logging.getLogger(__name__)
 
 
+def _encode_cursor(created_at: datetime, conversation_id: str) -> str:
+    """Encode a keyset pagination position as an opaque URL-safe string."""
+    raw = f"{created_at.isoformat()}|{conversation_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Decode a cursor produced by _encode_cursor."""
+    try:
+        created_at, conversation_id = (
+            base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        )
+        return datetime.fromisoformat(created_at), conversation_id
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValidationError("Invalid pagination cursor") from e
+
+
 class ConversationsService:
     """Service for conversation operations."""
 
@@ -83,12 +103,24 @@ class ConversationsService:
         firm_id: Optional[str] = None,
         skip: int = 0,
         limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> ConversationListResponse:
-        """List conversations for a user."""
+        """
+        List conversations for a user.
+
+        Pages can be fetched either by ``skip`` or, more cheaply for deep pages, by
+        passing the ``next_cursor`` returned with the previous page.
+        """
         if not user_id or not user_id.strip():
             raise ValidationError("user_id is required")
 
-        conversations = await self._repo.get_by_user_id(user_id, firm_id, skip, limit)
+        conversations = await self._repo.get_by_user_id(
+            user_id,
+            firm_id,
+            skip,
+            limit,
+            cursor=_decode_cursor(cursor) if cursor else None,
+        )
         total = await self._repo.count_by_user_id(user_id, firm_id)
 
         conversation_responses = [
@@ -109,7 +141,14 @@ class ConversationsService:
             for conv in conversations
         ]
 
-        return ConversationListResponse(conversations=conversation_responses, total=total)
+        next_cursor = None
+        if conversations and len(conversations) == limit:
+            last = conversations[-1]
+            next_cursor = _encode_cursor(last.created_at, last.id)
+
+        return ConversationListResponse(
+            conversations=conversation_responses, total=total, next_cursor=next_cursor
+        )
 
 
 def get_conversations_service(session: AsyncSession) -> ConversationsService:
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api_core.database.models import Lead
 from api_core.exceptions import ValidationError
 from api_core.models.leads import LeadCreateRequest, LeadResponse
 from api_core.repositories.leads_repository import LeadsRepository
@@ -27,21 +28,8 @@ class LeadsService:
         if not request.full_name.strip():
             raise ValidationError("full_name is required")
 
-        existing = await self._repo.get_by_idempotency_key(request.idempotency_key)
-        if existing:
-            return LeadResponse(
-                lead_id=existing.id,
-                firm_id=existing.firm_id,
-                full_name=existing.full_name,
-                email=existing.email,
-                phone=existing.phone,
-                matter_type=existing.matter_type,
-                summary=existing.summary,
-                status=existing.status,
-                created_at=existing.created_at,
-            )
-
-        created = await self._repo.create(
+        lead, _ = await self._repo.create_idempotent(
+            Lead.idempotency_key,
             firm_id=request.firm_id,
             full_name=request.full_name,
             email=request.email,
@@ -53,15 +41,15 @@ class LeadsService:
         )
 
         return LeadResponse(
-            lead_id=created.id,
-            firm_id=created.firm_id,
-            full_name=created.full_name,
-            email=created.email,
-            phone=created.phone,
-            matter_type=created.matter_type,
-            summary=created.summary,
-            status=created.status,
-            created_at=created.created_at,
+            lead_id=lead.id,
+            firm_id=lead.firm_id,
+            full_name=lead.full_name,
+            email=lead.email,
+            phone=lead.phone,
+            matter_type=lead.matter_type,
+            summary=lead.summary,
+            status=lead.status,
+            created_at=lead.created_at,
         )
 
 
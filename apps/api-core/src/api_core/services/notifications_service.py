@@ -9,6 +9,7 @@ from __future__ import annotations
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api_core.database.models import Notification
 from api_core.exceptions import ValidationError
 from api_core.models.notifications import NotificationCreateRequest, NotificationResponse
 from api_core.repositories.notifications_repository import NotificationsRepository
@@ -33,20 +34,8 @@ class NotificationsService:
             # Optional subject is allowed, but UX generally wants one; keep it permissive for MVP.
             pass
 
-        existing = await self._repo.get_by_idempotency_key(request.idempotency_key)
-        if existing:
-            return NotificationResponse(
-                notification_id=existing.id,
-                firm_id=existing.firm_id,
-                channel=existing.channel,  # literal coercion
-                to=existing.to,
-                subject=existing.subject,
-                message=existing.message,
-                status=existing.status,
-                created_at=existing.created_at,
-            )
-
-        created = await self._repo.create(
+        notification, _ = await self._repo.create_idempotent(
+            Notification.idempotency_key,
             firm_id=request.firm_id,
             channel=request.channel,
             to=request.to,
@@ -57,14 +46,14 @@ class NotificationsService:
         )
 
         return NotificationResponse(
-            notification_id=created.id,
-            firm_id=created.firm_id,
-            channel=created.channel,
-            to=created.to,
-            subject=created.subject,
-            message=created.message,
-            status=created.status,
-            created_at=created.created_at,
+            notification_id=notification.id,
+            firm_id=notification.firm_id,
+            channel=notification.channel,  # literal coercion
+            to=notification.to,
+            subject=notification.subject,
+            message=notification.message,
+            status=notification.status,
+            created_at=notification.created_at,
         )
 
 
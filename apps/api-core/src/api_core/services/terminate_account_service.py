@@ -27,6 +27,7 @@ from api_core.database.models import (
     Conversation,
     Firm,
     FirmPersona,
+    KnowledgeBaseFile,
     Lead,
     Notification,
     Subscription,
@@ -174,7 +175,15 @@ class TerminateAccountService:
 
     async def _delete_qdrant_and_blob_for_user(self, user_id: str) -> None:
         """Delete Qdrant points and Blob files for all knowledge base files of this user."""
-        kb_files = await self._knowledge_repo.get_by_user_id(user_id)
+        kb_files = await self._knowledge_repo.get_by_user_id(
+            user_id,
+            columns=(
+                KnowledgeBaseFile.id,
+                KnowledgeBaseFile.storage_path,
+                KnowledgeBaseFile.qdrant_collection,
+                KnowledgeBaseFile.qdrant_point_ids,
+            ),
+        )
         for kb in kb_files:
             # Qdrant: delete points for this file (before we lose metadata)
             if kb.qdrant_collection and kb.qdrant_point_ids:
@@ -2,7 +2,7 @@
 
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -10,6 +10,7 @@ from api_core.database.models import User
 from api_core.exceptions import ConflictError, NotFoundError, ValidationError
 from sqlalchemy.exc import IntegrityError
 from api_core.models.auth import UserProfile
+from api_core.models.user import UserResponse
 from api_core.repositories.user_repository import UserRepository
 
 logger = logging.getLogger(__name__)
@@ -37,8 +38,11 @@ class UserService:
 
         Returns:
             UserProfile Pydantic model
+
+        Values come from a persisted row that was validated on the way in, so the
+        model is constructed without re-running validation.
         """
-        return UserProfile(
+        return UserProfile.model_construct(
             id=user.id,
             email=user.email,
             name=user.name,
@@ -48,7 +52,7 @@ class UserService:
             updated_at=user.updated_at.isoformat() if user.updated_at else None,
         )
 
-    def _user_to_response(self, user: User):
+    def _user_to_response(self, user: User) -> UserResponse:
         """
         Convert SQLAlchemy User model to UserResponse.
 
@@ -57,10 +61,10 @@ class UserService:
 
         Returns:
             UserResponse Pydantic model
-        """
-        from api_core.models.user import UserResponse
 
-        return UserResponse(
+        Constructed without validation, like ``_user_to_profile``.
+        """
+        return UserResponse.model_construct(
             id=user.id,
             email=user.email,
             name=user.name,
@@ -115,17 +119,11 @@ class UserService:
         # Hash password if provided
         final_hashed_password = hashed_password
         if password:
-            # Reuse the shared pwd_context from auth_service to avoid creating multiple instances
-            # and to benefit from the warning suppression
-            # Always pre-hash with SHA256 to avoid bcrypt's 72-byte limit
-            # This ensures we can handle passwords of any length
-            from api_core.services.auth_service import pwd_context
-            import hashlib
-            
-            # Pre-hash with SHA256 to avoid bcrypt's 72-byte limit
-            # This is a common and secure pattern for handling long passwords
-            password_hash = hashlib.sha256(password.encode('utf-8')).hexdigest()
-            final_hashed_password = pwd_context.hash(password_hash)
+            # Same hashing (Argon2id) and thread pool as AuthService; imported here
+            # because auth_service imports this module
+            from api_core.services.auth_service import hash_password, run_password_hashing
+
+            final_hashed_password = await run_password_hashing(hash_password, password)
 
         # For email/password users, password is required
         if not azure_ad_object_id and not final_hashed_password:
@@ -367,7 +365,7 @@ class UserService:
         is_verified: Optional[bool] = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> List[UserProfile]:
+    ) -> Tuple[List[UserProfile], int]:
         """
         Search users with filters.
 
@@ -379,16 +377,46 @@ class UserService:
             limit: Maximum number of records to return
 
         Returns:
-            List of user profiles
+            Tuple of (list of user profiles, total number of matching users)
         """
-        users = await self.repository.search_users(
+        users, total = await self.repository.search_users(
             query=query,
             is_active=is_active,
             is_verified=is_verified,
             skip=skip,
             limit=limit,
         )
-        return [self._user_to_profile(user) for user in users]
+        return [self._user_to_profile(user) for user in users], total
+
+    async def iter_search_users(
+        self,
+        query: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        is_verified: Optional[bool] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> AsyncIterator[UserResponse]:
+        """
+        Stream users matching the search filters as they are read from the database.
+
+        Args:
+            query: Search query (searches name and email)
+            is_active: Filter by active status
+            is_verified: Filter by verified status
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Yields:
+            UserResponse for each matching user, newest first
+        """
+        async for user in self.repository.iter_search_users(
+            query=query,
+            is_active=is_active,
+            is_verified=is_verified,
+            skip=skip,
+            limit=limit,
+        ):
+            yield self._user_to_response(user)
 
     async def sync_user_from_azure_ad(
         self,
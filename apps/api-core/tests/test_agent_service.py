@@ -0,0 +1,75 @@
+"""Unit tests for AgentService configuration upserts."""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from api_core.database.models import AgentConfig, Firm
+from api_core.services.agent_service import AgentService
+from sqlalchemy import func, select
+
+
+async def _count_configs(session, user_id: str) -> int:
+    result = await session.execute(
+        select(func.count()).select_from(AgentConfig).where(AgentConfig.user_id == user_id)
+    )
+    return result.scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_get_config_creates_default_once(session):
+    """Test that the default config is created on first read and reused after."""
+    service = AgentService(session)
+    user_id = str(uuid4())
+
+    first = await service.get_config(user_id)
+    second = await service.get_config(user_id)
+
+    assert first.id == second.id
+    assert first.voice_id == "1"
+    assert await _count_configs(session, user_id) == 1
+
+
+@pytest.mark.asyncio
+async def test_update_config_upserts_per_user_and_firm(session):
+    """Test that updates write one row per (user, firm) and leave other rows alone."""
+    service = AgentService(session)
+    user_id = str(uuid4())
+    firm = Firm(name="Agent Firm")
+    session.add(firm)
+    await session.flush()
+
+    default = await service.update_config(user_id, voice_id="7")
+    updated = await service.update_config(user_id, record_calls=False)
+    assert updated.id == default.id
+    assert (updated.voice_id, updated.record_calls) == ("7", False)
+
+    firm_config = await service.update_config(user_id, firm_id=firm.id, voice_id="9")
+    assert firm_config.id != default.id
+    assert (await service.get_config(user_id, firm.id)).voice_id == "9"
+    assert (await service.get_config(user_id)).voice_id == "7"
+    assert await _count_configs(session, user_id) == 2
+
+
+@pytest.mark.asyncio
+async def test_partial_firm_update_keeps_default_settings(session):
+    """Test that a firm's first partial update starts from the user's default config."""
+    service = AgentService(session)
+    user_id = str(uuid4())
+    firm = Firm(name="Seeded Firm")
+    session.add(firm)
+    await session.flush()
+
+    default = await service.update_config(
+        user_id, greeting_script="Hello from Pat", record_calls=False
+    )
+    assert (await service.get_config(user_id, firm.id)).id == default.id
+
+    firm_config = await service.update_config(user_id, firm_id=firm.id, voice_id="9")
+
+    assert firm_config.id != default.id
+    assert firm_config.voice_id == "9"
+    assert firm_config.greeting_script == "Hello from Pat"
+    assert firm_config.record_calls is False
+    assert (await service.get_config(user_id)).voice_id == default.voice_id
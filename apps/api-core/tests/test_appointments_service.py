@@ -0,0 +1,200 @@
+"""Unit tests for AppointmentsService availability and booking."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+from api_core.database.models import Appointment
+from api_core.exceptions import AuthorizationError, NotFoundError
+from api_core.models.appointments import (
+    AppointmentContact,
+    AppointmentCreateRequest,
+    AvailabilityRequest,
+)
+from api_core.services.appointments_service import AppointmentsService, AvailabilityService
+
+TZ = "America/New_York"
+
+
+def _availability(start: datetime, end: datetime, duration_minutes: int = 30):
+    request = AvailabilityRequest(
+        firm_id="firm-1",
+        timezone=TZ,
+        window_start=start,
+        window_end=end,
+        duration_minutes=duration_minutes,
+    )
+    return AvailabilityService().get_availability(request).slots
+
+
+def test_availability_only_business_hours_on_weekdays():
+    """Test that slots fall on weekdays between 9am and 5pm local time."""
+    # Friday 2025-01-03 00:00 through Tuesday 2025-01-07 00:00
+    slots = _availability(datetime(2025, 1, 3), datetime(2025, 1, 7), duration_minutes=60)
+
+    assert {slot.start.date().isoformat() for slot in slots} == {"2025-01-03", "2025-01-06"}
+    assert all(slot.start.weekday() < 5 for slot in slots)
+    assert all(9 <= slot.start.hour and slot.end.hour <= 17 for slot in slots)
+    assert len(slots) == 16
+    assert slots[0].start == datetime(2025, 1, 3, 9, 0, tzinfo=ZoneInfo(TZ))
+
+
+def test_availability_keeps_window_start_alignment():
+    """Test that slots step from window_start rather than snapping to the hour."""
+    slots = _availability(datetime(2025, 1, 6, 8, 15), datetime(2025, 1, 6, 11, 0))
+
+    assert [slot.start.strftime("%H:%M") for slot in slots] == [
+        "09:15",
+        "09:45",
+        "10:15",
+    ]
+
+
+def test_availability_caps_results():
+    """Test that wide windows return at most 50 slots, earliest first."""
+    start = datetime(2025, 1, 6, 9, 0)
+    slots = _availability(start, start + timedelta(days=30))
+
+    assert len(slots) == 50
+    assert slots == sorted(slots, key=lambda slot: slot.start)
+
+
+def test_availability_weekend_window_is_empty():
+    """Test that a window covering only a weekend yields no slots."""
+    # Saturday 2025-01-04 00:00 through Monday 2025-01-06 08:00
+    assert _availability(datetime(2025, 1, 4), datetime(2025, 1, 6, 8, 0)) == []
+
+
+def test_availability_skips_busy_intervals():
+    """Test that slots overlapping a busy interval are left out."""
+    tz = ZoneInfo(TZ)
+    request = AvailabilityRequest(
+        firm_id="firm-1",
+        timezone=TZ,
+        window_start=datetime(2025, 1, 6, 9, 0),
+        window_end=datetime(2025, 1, 6, 12, 0),
+        duration_minutes=30,
+    )
+    busy = [
+        (datetime(2025, 1, 6, 9, 45, tzinfo=tz), datetime(2025, 1, 6, 10, 15, tzinfo=tz)),
+        (datetime(2025, 1, 6, 11, 0, tzinfo=tz), datetime(2025, 1, 6, 11, 30, tzinfo=tz)),
+    ]
+
+    slots = AvailabilityService().get_availability(request, busy=busy).slots
+
+    assert [slot.start.strftime("%H:%M") for slot in slots] == ["09:00", "10:30", "11:30"]
+
+
+@pytest.mark.asyncio
+async def test_open_availability_excludes_booked_slot(session):
+    """Test that a booked appointment is no longer offered as a slot."""
+    service = AppointmentsService(session)
+    await service.book_appointment(
+        AppointmentCreateRequest(
+            firm_id="firm-1",
+            timezone=TZ,
+            start=datetime(2025, 1, 6, 10, 0),
+            duration_minutes=30,
+            contact=AppointmentContact(full_name="Pat Client"),
+            idempotency_key="appt-key-busy",
+        )
+    )
+
+    response = await service.get_open_availability(
+        AvailabilityRequest(
+            firm_id="firm-1",
+            timezone=TZ,
+            window_start=datetime(2025, 1, 6, 9, 0),
+            window_end=datetime(2025, 1, 6, 11, 0),
+            duration_minutes=30,
+        )
+    )
+
+    assert [slot.start.strftime("%H:%M") for slot in response.slots] == [
+        "09:00",
+        "09:30",
+        "10:30",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_book_appointment_replayed_key_returns_original(session):
+    """Test that booking twice with one idempotency key creates a single appointment."""
+    service = AppointmentsService(session)
+    request = AppointmentCreateRequest(
+        firm_id="firm-1",
+        timezone=TZ,
+        start=datetime(2025, 1, 6, 10, 0),
+        duration_minutes=30,
+        contact=AppointmentContact(full_name="Pat Client"),
+        idempotency_key="appt-key-0001",
+    )
+
+    first = await service.book_appointment(request)
+    replay = await service.book_appointment(
+        request.model_copy(update={"notes": "retried", "start": datetime(2025, 1, 6, 11, 0)})
+    )
+
+    assert replay.appointment_id == first.appointment_id
+    assert replay.notes is None
+    assert replay.start == first.start
+
+
+@pytest.mark.asyncio
+async def test_update_appointment_enforces_access_in_one_update(session):
+    """Test that the creator can update, others get AuthorizationError or NotFoundError."""
+    tz = ZoneInfo(TZ)
+    appointment = Appointment(
+        firm_id=None,
+        created_by_user_id=None,
+        start_at=datetime(2025, 1, 6, 10, 0, tzinfo=tz),
+        end_at=datetime(2025, 1, 6, 10, 30, tzinfo=tz),
+        timezone=TZ,
+        duration_minutes=30,
+        contact_full_name="Pat Client",
+        idempotency_key="appt-key-update",
+    )
+    session.add(appointment)
+    await session.flush()
+    service = AppointmentsService(session)
+
+    with pytest.raises(AuthorizationError):
+        await service.cancel_appointment(appointment.id, user_id="someone-else")
+    with pytest.raises(NotFoundError):
+        await service.cancel_appointment("missing-appointment", user_id="someone-else")
+
+    appointment.firm_id = "firm-1"
+    await session.flush()
+    cancelled = await service.cancel_appointment(appointment.id, user_id="someone-else")
+    assert cancelled.status == "cancelled"
+
+
+@pytest.mark.asyncio
+async def test_iter_user_appointments_streams_in_start_order(session):
+    """Test that streamed user appointments match the listed ones, oldest first."""
+    tz = ZoneInfo(TZ)
+    for i, hour in enumerate((14, 9, 11)):
+        session.add(
+            Appointment(
+                firm_id="firm-1",
+                start_at=datetime(2025, 1, 6, hour, 0, tzinfo=tz),
+                end_at=datetime(2025, 1, 6, hour, 30, tzinfo=tz),
+                timezone=TZ,
+                duration_minutes=30,
+                contact_full_name=f"Client {i}",
+                idempotency_key=f"appt-key-stream-{i}",
+            )
+        )
+    await session.flush()
+    service = AppointmentsService(session)
+
+    streamed = [
+        appointment
+        async for appointment in service.iter_user_appointments("user-1", firm_id="firm-1")
+    ]
+    listed = await service.get_user_appointments("user-1", firm_id="firm-1")
+
+    assert [a.id for a in streamed] == [a.id for a in listed]
+    assert [a.start_at.hour for a in streamed] == [9, 11, 14]
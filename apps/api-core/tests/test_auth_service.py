@@ -3,12 +3,13 @@
 import pytest
 import uuid
 from datetime import datetime, timedelta
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api_core.services.auth_service import AuthService, get_auth_service
 from api_core.services.user_service import UserService, get_user_service
 from api_core.exceptions import AuthenticationError, ValidationError, NotFoundError
-from api_core.database.models import User, Firm
+from api_core.database.models import User, Firm, Notification, hash_token
 
 
 @pytest.fixture
@@ -111,12 +112,12 @@ class TestPasswordHashing:
         assert len(hashed) > 0
 
     def test_hash_password_deterministic(self, auth_service: AuthService):
-        """Test that same password produces different hashes (bcrypt salt)."""
+        """Test that same password produces different hashes (random salt)."""
         password = "TestPassword123!"
         hashed1 = auth_service.hash_password(password)
         hashed2 = auth_service.hash_password(password)
         
-        # Bcrypt uses random salt, so hashes should be different
+        # Each hash uses a random salt, so hashes should be different
         assert hashed1 != hashed2
 
     def test_verify_password_correct(self, auth_service: AuthService):
@@ -134,6 +135,20 @@ class TestPasswordHashing:
         
         assert auth_service.verify_password(wrong_password, hashed) is False
 
+    def test_verify_password_accepts_legacy_bcrypt_hash(self, auth_service: AuthService):
+        """Test that SHA256-pre-hashed bcrypt hashes from before Argon2id still verify."""
+        import hashlib
+
+        import bcrypt
+
+        password = "TestPassword123!"
+        legacy = bcrypt.hashpw(
+            hashlib.sha256(password.encode()).hexdigest().encode(), bcrypt.gensalt(4)
+        ).decode()
+
+        assert auth_service.verify_password(password, legacy) is True
+        assert auth_service.verify_password("WrongPassword123!", legacy) is False
+
     def test_verify_password_empty(self, auth_service: AuthService):
         """Test that empty password fails verification."""
         password = "TestPassword123!"
@@ -158,6 +173,39 @@ class TestUserAuthentication:
         assert user_profile.email == "test@example.com"
         assert user_profile.id == test_user.id
 
+    @pytest.mark.asyncio
+    async def test_authenticate_user_upgrades_legacy_hash(
+        self, session: AsyncSession, auth_service: AuthService, test_user: User
+    ):
+        """Test that a successful login rehashes a legacy bcrypt hash with Argon2id."""
+        import hashlib
+
+        import bcrypt
+
+        test_user.hashed_password = bcrypt.hashpw(
+            hashlib.sha256(b"TestPassword123!").hexdigest().encode(), bcrypt.gensalt(4)
+        ).decode()
+        await session.commit()
+
+        await auth_service.authenticate_user("test@example.com", "TestPassword123!")
+
+        await session.refresh(test_user)
+        assert test_user.hashed_password.startswith("$argon2id$")
+        assert auth_service.verify_password("TestPassword123!", test_user.hashed_password)
+
+    @pytest.mark.asyncio
+    async def test_authenticate_user_email_case_insensitive(
+        self, auth_service: AuthService, test_user: User
+    ):
+        """Test that login matches the stored email regardless of case and padding."""
+        assert test_user.normalized_email == "test@example.com"
+
+        user_profile = await auth_service.authenticate_user(
+            "  Test@Example.COM ", "TestPassword123!"
+        )
+
+        assert user_profile.id == test_user.id
+
     @pytest.mark.asyncio
     async def test_authenticate_user_wrong_password(
         self, auth_service: AuthService, test_user: User
@@ -176,6 +224,25 @@ class TestUserAuthentication:
                 "nonexistent@example.com", "TestPassword123!"
             )
 
+    @pytest.mark.asyncio
+    async def test_authenticate_user_not_found_still_verifies(
+        self, auth_service: AuthService, monkeypatch
+    ):
+        """Test that an unknown user still costs one password verification."""
+        checked = []
+        original = auth_service.verify_password
+
+        def spy(plain_password: str, hashed_password: str) -> bool:
+            checked.append(hashed_password)
+            return original(plain_password, hashed_password)
+
+        monkeypatch.setattr(auth_service, "verify_password", spy)
+        with pytest.raises(AuthenticationError, match="Invalid email or password"):
+            await auth_service.authenticate_user("ghost@example.com", "TestPassword123!")
+
+        assert len(checked) == 1
+        assert checked[0].startswith("$argon2id$")
+
     @pytest.mark.asyncio
     async def test_authenticate_user_no_password(
         self, session: AsyncSession, auth_service: AuthService, test_firm: Firm
@@ -269,6 +336,7 @@ class TestUserAuthentication:
         await session.refresh(test_user)
         assert test_user.failed_login_attempts == 0
         assert test_user.locked_until is None
+        assert test_user.last_login_at is not None
 
 
 class TestEmailVerification:
@@ -296,6 +364,12 @@ class TestEmailVerification:
         assert test_user.email_verification_token is not None
         assert test_user.is_verified is False
 
+        # Idempotency key is derived from the stored digest, not the raw token
+        notification = await session.scalar(select(Notification))
+        assert notification.idempotency_key == (
+            f"email_verification_{test_user.id}_{test_user.email_verification_token}"
+        )
+
     @pytest.mark.asyncio
     async def test_verify_email_token_success(
         self, session: AsyncSession, auth_service: AuthService, test_user: User
@@ -303,7 +377,7 @@ class TestEmailVerification:
         """Test successful email verification."""
         # Set verification token
         token = "test_verification_token"
-        test_user.email_verification_token = token
+        test_user.email_verification_token = hash_token(token)
         test_user.is_verified = False
         await session.commit()
         
@@ -357,6 +431,11 @@ class TestPasswordReset:
         assert test_user.password_reset_expires_at is not None
         assert test_user.password_reset_expires_at > datetime.utcnow()
 
+        notification = await session.scalar(select(Notification))
+        assert notification.idempotency_key == (
+            f"password_reset_{test_user.id}_{test_user.password_reset_token}"
+        )
+
     @pytest.mark.asyncio
     async def test_request_password_reset_nonexistent_user(
         self, auth_service: AuthService
@@ -401,7 +480,7 @@ class TestPasswordReset:
         """Test successful password reset."""
         # Set reset token
         token = "test_reset_token"
-        test_user.password_reset_token = token
+        test_user.password_reset_token = hash_token(token)
         test_user.password_reset_expires_at = datetime.utcnow() + timedelta(hours=24)
         old_password_hash = test_user.hashed_password
         await session.commit()
@@ -433,7 +512,7 @@ class TestPasswordReset:
         """Test password reset with expired token."""
         # Set expired token
         token = "expired_token"
-        test_user.password_reset_token = token
+        test_user.password_reset_token = hash_token(token)
         test_user.password_reset_expires_at = datetime.utcnow() - timedelta(hours=1)
         await session.commit()
         
@@ -447,7 +526,7 @@ class TestPasswordReset:
         """Test password reset with weak password."""
         # Set reset token
         token = "test_reset_token"
-        test_user.password_reset_token = token
+        test_user.password_reset_token = hash_token(token)
         test_user.password_reset_expires_at = datetime.utcnow() + timedelta(hours=24)
         await session.commit()
         
@@ -1,3 +1,201 @@
 """Billing tests."""
 
-# TODO: Implement billing tests
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from api_core.database.models import Plan, Subscription, User
+from api_core.exceptions import ConflictError, NotFoundError
+from api_core.models.billing import PlanResponse, SubscriptionResponse
+from api_core.services.billing_service import (
+    BillingService,
+    _get_plan_minutes_data,
+    _stripe_billing_cycle,
+)
+from sqlalchemy.exc import InvalidRequestError
+
+
+async def _add_plan(session, name: str) -> Plan:
+    plan = Plan(name=name, display_name=name.title(), price_monthly=10)
+    session.add(plan)
+    await session.flush()
+    return plan
+
+
+@pytest.fixture
+async def subscription(session) -> Subscription:
+    """Create a local (non-Stripe) monthly subscription on a basic plan."""
+    user = User(email="billing@example.com", name="Billing User")
+    session.add(user)
+    plan = await _add_plan(session, "basic")
+    now = datetime.utcnow()
+    subscription = Subscription(
+        user_id=user.id,
+        plan_id=plan.id,
+        status="active",
+        billing_cycle="monthly",
+        current_period_start=now,
+        current_period_end=now + timedelta(days=30),
+    )
+    session.add(subscription)
+    await session.flush()
+    return subscription
+
+
+@pytest.mark.asyncio
+async def test_update_subscription_returns_updated_fields_and_plan(session, subscription):
+    """Test that an update responds with the new values and the loaded plan."""
+    response = await BillingService(session).update_subscription(
+        subscription.id, {"billing_cycle": "yearly"}
+    )
+
+    assert response.billingCycle == "yearly"
+    assert response.plan is not None
+    assert response.plan.name == "basic"
+
+
+@pytest.mark.asyncio
+async def test_upgrade_subscription_responds_with_new_plan(session, subscription):
+    """Test that an upgrade switches both plan_id and the returned plan."""
+    pro = await _add_plan(session, "pro")
+
+    response = await BillingService(session).upgrade_subscription(
+        subscription.id, pro.id, prorate=False
+    )
+
+    assert response.planId == pro.id
+    assert response.plan.name == "pro"
+    assert subscription.plan_id == pro.id
+
+
+@pytest.mark.asyncio
+async def test_cancel_subscription_immediately(session, subscription):
+    """Test that immediate cancellation sets the status and cancellation time."""
+    response = await BillingService(session).cancel_subscription(
+        subscription.id, cancel_at_period_end=False
+    )
+
+    assert response.status == "canceled"
+    assert response.canceledAt is not None
+    assert response.plan.name == "basic"
+
+
+@pytest.mark.asyncio
+async def test_get_user_subscription_loads_plan_and_raises_on_other_relationships(
+    session, subscription
+):
+    """Test that the plan comes eagerly loaded and other relationships don't lazy-load."""
+    session.expunge_all()
+    loaded = await BillingService(session).repository.subscriptions.get_by_user_id(
+        subscription.user_id
+    )
+
+    assert loaded.plan.name == "basic"
+    with pytest.raises(InvalidRequestError):
+        _ = loaded.invoices
+
+
+@pytest.mark.asyncio
+async def test_can_user_make_calls_follows_subscription_status(session, subscription):
+    """Test that only users with an active or trialing subscription can make calls."""
+    service = BillingService(session)
+    assert await service.can_user_make_calls(subscription.user_id) == (True, None)
+
+    subscription.status = "canceled"
+    await session.flush()
+    assert await service.can_user_make_calls(subscription.user_id) == (
+        False,
+        "no_active_subscription",
+    )
+
+
+def test_plan_minutes_data_reads_current_plan_values():
+    """Test that minutes data reflects the plan's current columns, falling back to features."""
+    plan = Plan(
+        id="plan-minutes",
+        name="minutes",
+        display_name="Minutes",
+        included_minutes=500,
+        overage_rate_per_minute=Decimal("0.1800"),
+        features_json='{"included_minutes": 100, "overage_rate_per_minute": 0.5}',
+        updated_at=datetime(2025, 1, 1),
+    )
+    assert _get_plan_minutes_data(plan) == (500, Decimal("0.1800"))
+
+    # Out-of-band plan updates don't bump updated_at; the new values still apply
+    plan.included_minutes = 2000
+    assert _get_plan_minutes_data(plan) == (2000, Decimal("0.1800"))
+
+    plan.included_minutes = None
+    plan.overage_rate_per_minute = None
+    assert _get_plan_minutes_data(plan) == (100, Decimal("0.5"))
+
+
+@pytest.mark.asyncio
+async def test_subscription_response_matches_validated_model(session, subscription):
+    """Test that responses built without validation equal validated ones."""
+    plan = await session.get(Plan, subscription.plan_id)
+    plan.price_monthly = Decimal("29.90")
+    plan.features_json = '{"included_minutes": 500, "overage_rate_per_minute": 0.18}'
+    await session.flush()
+
+    response = await BillingService(session).update_subscription(
+        subscription.id, {"billing_cycle": "yearly"}
+    )
+
+    validated = SubscriptionResponse(
+        **response.model_dump(exclude={"plan"}),
+        plan=PlanResponse(**response.plan.model_dump()),
+    )
+    assert response.model_dump_json() == validated.model_dump_json()
+    assert str(response.plan.priceMonthly) == "29.9"
+
+
+@pytest.mark.asyncio
+async def test_plan_response_features_do_not_share_cached_values(session):
+    """Test that mutating a response's nested features leaves later responses intact."""
+    plan = await _add_plan(session, "nested")
+    plan.features_json = '{"integrations": ["clio"], "limits": {"seats": 3}}'
+    service = BillingService(session)
+
+    first = service._plan_to_response(plan)
+    first.features["integrations"].append("mycase")
+    first.features["limits"]["seats"] = 99
+
+    second = service._plan_to_response(plan)
+    assert second.features == {"integrations": ["clio"], "limits": {"seats": 3}}
+
+
+def test_stripe_billing_cycle_maps_price_interval():
+    """Test that the first item's interval picks the cycle, falling back to the default."""
+    def stripe_subscription(interval):
+        return {"items": {"data": [{"price": {"recurring": {"interval": interval}}}]}}
+
+    assert _stripe_billing_cycle(stripe_subscription("year"), default="monthly") == "yearly"
+    assert _stripe_billing_cycle(stripe_subscription("month"), default="yearly") == "monthly"
+    assert _stripe_billing_cycle(stripe_subscription("week"), default="yearly") == "yearly"
+    assert _stripe_billing_cycle({}, default="monthly") == "monthly"
+
+
+@pytest.mark.asyncio
+async def test_create_subscription_checks_plan_user_and_existing(session, subscription):
+    """Test that creation rejects unknown plans and users and a second current subscription."""
+    service = BillingService(session)
+    user = User(email="new-billing@example.com", name="New Billing User")
+    session.add(user)
+    await session.flush()
+
+    with pytest.raises(NotFoundError, match="Plan"):
+        await service.create_subscription(user.id, "missing-plan", use_stripe=False)
+    with pytest.raises(NotFoundError, match="User"):
+        await service.create_subscription("missing-user", subscription.plan_id, use_stripe=False)
+    with pytest.raises(ConflictError):
+        await service.create_subscription(
+            subscription.user_id, subscription.plan_id, use_stripe=False
+        )
+
+    response = await service.create_subscription(user.id, subscription.plan_id, use_stripe=False)
+    assert response.userId == user.id
+    assert response.status == "active"
@@ -0,0 +1,80 @@
+"""Unit tests for conversation listing and pagination."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from api_core.database.models import Conversation, ConversationMessage, User
+from api_core.exceptions import ValidationError
+from api_core.repositories.conversations_repository import ConversationMessagesRepository
+from api_core.services.conversations_service import ConversationsService
+
+
+@pytest.fixture
+async def user_with_conversations(session):
+    """Create a user with five conversations, two sharing a created_at."""
+    user = User(id=str(uuid4()), email=f"{uuid4()}@example.com", name="Paging User")
+    session.add(user)
+    base = datetime(2025, 1, 1, 12, 0, 0)
+    offsets = [0, 1, 2, 2, 3]
+    session.add_all(
+        Conversation(id=str(uuid4()), user_id=user.id, created_at=base + timedelta(minutes=m))
+        for m in offsets
+    )
+    await session.commit()
+    return user
+
+
+@pytest.mark.asyncio
+async def test_list_conversations_cursor_pages(session, user_with_conversations):
+    """Test that following next_cursor visits every conversation once, newest first."""
+    service = ConversationsService(session)
+    user_id = user_with_conversations.id
+
+    full = await service.list_conversations(user_id, limit=10)
+    assert full.next_cursor is None
+
+    seen = []
+    page = await service.list_conversations(user_id, limit=2)
+    seen.extend(page.conversations)
+    while page.next_cursor:
+        page = await service.list_conversations(user_id, limit=2, cursor=page.next_cursor)
+        seen.extend(page.conversations)
+
+    assert [c.id for c in seen] == [c.id for c in full.conversations]
+    assert page.total == 5
+
+
+@pytest.mark.asyncio
+async def test_list_conversations_invalid_cursor(session, user_with_conversations):
+    """Test that a malformed cursor is rejected as a validation error."""
+    service = ConversationsService(session)
+
+    with pytest.raises(ValidationError):
+        await service.list_conversations(user_with_conversations.id, cursor="not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_iter_messages_streams_in_order(session, user_with_conversations):
+    """Test that streamed messages match the list variant, oldest first."""
+    conversation = Conversation(id=str(uuid4()), user_id=user_with_conversations.id)
+    session.add(conversation)
+    base = datetime(2025, 1, 1, 12, 0, 0)
+    session.add_all(
+        ConversationMessage(
+            conversation_id=conversation.id,
+            role="user",
+            content=f"message {i}",
+            created_at=base + timedelta(seconds=i),
+        )
+        for i in reversed(range(5))
+    )
+    await session.commit()
+
+    repo = ConversationMessagesRepository(session)
+    streamed = [m async for m in repo.iter_by_conversation_id(conversation.id)]
+
+    assert [m.content for m in streamed] == [f"message {i}" for i in range(5)]
+    assert streamed == await repo.get_by_conversation_id(conversation.id)
@@ -1,9 +1,8 @@
 """Tests for database connection and session management."""
 
 import pytest
-from sqlalchemy import text
-
 from api_core.database import check_connection, get_session
+from sqlalchemy import text
 
 
 @pytest.mark.asyncio
@@ -46,3 +45,70 @@ async def test_session_commit_rollback():
         assert result.scalar() == 1
         # Session should auto-commit on exit
         break
+
+
+@pytest.mark.asyncio
+async def test_repository_statements_use_compiled_cache(engine, session):
+    """Repository lookups bind their parameters, so repeat calls reuse the compiled SQL."""
+    from api_core.repositories.firms_repository import FirmsRepository
+    from api_core.repositories.knowledge_repository import KnowledgeRepository
+    from api_core.repositories.user_repository import UserRepository
+    from sqlalchemy import event
+    from sqlalchemy.engine.default import CACHE_HIT
+
+    cache_stats = []
+
+    def record_cache_hit(conn, cursor, statement, parameters, context, executemany):
+        cache_stats.append(context.cache_hit)
+
+    event.listen(engine.sync_engine, "after_cursor_execute", record_cache_hit)
+    try:
+        firms = FirmsRepository(session)
+        await firms.get_by_id("firm-1")
+        cache_stats.clear()
+        await firms.get_by_id("firm-2")
+        assert cache_stats == [CACHE_HIT]
+
+        knowledge = KnowledgeRepository(session)
+        await knowledge.get_by_status("pending")
+        cache_stats.clear()
+        await knowledge.get_by_status("indexed")
+        assert cache_stats == [CACHE_HIT]
+
+        users = UserRepository(session)
+        await users.get_by_email("first@example.com")
+        cache_stats.clear()
+        await users.get_by_email("second@example.com")
+        assert cache_stats == [CACHE_HIT]
+    finally:
+        event.remove(engine.sync_engine, "after_cursor_execute", record_cache_hit)
+
+
+@pytest.mark.asyncio
+async def test_warm_up_db_primes_compiled_cache(engine, session, monkeypatch):
+    """Startup warm-up compiles the user lookups, so the first real lookup is a cache hit."""
+    from api_core.database import session as session_module
+    from api_core.database import warm_up_db
+    from api_core.repositories.user_repository import UserRepository
+    from sqlalchemy import event
+    from sqlalchemy.engine.default import CACHE_HIT
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    monkeypatch.setattr(
+        session_module,
+        "_session_factory",
+        async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False),
+    )
+    await warm_up_db()
+
+    cache_stats = []
+
+    def record_cache_hit(conn, cursor, statement, parameters, context, executemany):
+        cache_stats.append(context.cache_hit)
+
+    event.listen(engine.sync_engine, "after_cursor_execute", record_cache_hit)
+    try:
+        await UserRepository(session).get_by_email("first@example.com")
+        assert cache_stats == [CACHE_HIT]
+    finally:
+        event.remove(engine.sync_engine, "after_cursor_execute", record_cache_hit)
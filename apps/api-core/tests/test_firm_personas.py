@@ -0,0 +1,45 @@
+"""Unit tests for firm persona persistence."""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from api_core.database.models import Firm
+from api_core.repositories.firms_repository import FirmsRepository
+
+
+@pytest.fixture
+async def firm(session):
+    """Create a firm to attach personas to."""
+    firm = Firm(id=str(uuid4()), name="Persona Firm")
+    session.add(firm)
+    await session.commit()
+    return firm
+
+
+@pytest.mark.asyncio
+async def test_upsert_persona_creates(session, firm):
+    """Test that upsert inserts a persona when none exists."""
+    repo = FirmsRepository(session)
+
+    persona = await repo.upsert_persona(firm.id, "You are a helpful intake assistant.")
+
+    assert persona.firm_id == firm.id
+    assert persona.system_prompt == "You are a helpful intake assistant."
+    assert persona.updated_at is not None
+
+
+@pytest.mark.asyncio
+async def test_upsert_persona_updates_existing(session, firm):
+    """Test that upsert overwrites the prompt of an existing persona."""
+    repo = FirmsRepository(session)
+    created = await repo.upsert_persona(firm.id, "First prompt")
+    loaded = await repo.get_persona(firm.id)
+
+    updated = await repo.upsert_persona(firm.id, "Second prompt")
+
+    assert updated is loaded
+    assert updated.system_prompt == "Second prompt"
+    assert updated.created_at == created.created_at
+    assert (await repo.get_persona(firm.id)).system_prompt == "Second prompt"
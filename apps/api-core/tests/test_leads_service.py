@@ -0,0 +1,48 @@
+"""Unit tests for LeadsService."""
+
+from __future__ import annotations
+
+import pytest
+from api_core.database.models import Lead
+from api_core.models.leads import LeadCreateRequest
+from api_core.services.leads_service import LeadsService
+from sqlalchemy import func, select
+
+
+@pytest.mark.asyncio
+async def test_create_lead_inserts_new_key(session):
+    """Test that a new idempotency key creates the lead."""
+    response = await LeadsService(session).create_lead(
+        LeadCreateRequest(
+            firm_id="firm-1",
+            full_name="Pat Client",
+            email="pat@example.com",
+            idempotency_key="lead-key-new",
+        )
+    )
+
+    lead = await session.get(Lead, response.lead_id)
+    assert lead.full_name == "Pat Client"
+    assert lead.status == "new"
+    assert response.email == "pat@example.com"
+
+
+@pytest.mark.asyncio
+async def test_create_lead_replayed_key_returns_original(session):
+    """Test that creating twice with one idempotency key keeps a single, unchanged lead."""
+    service = LeadsService(session)
+    request = LeadCreateRequest(
+        firm_id="firm-1",
+        full_name="Pat Client",
+        idempotency_key="lead-key-replay",
+    )
+
+    first = await service.create_lead(request)
+    replay = await service.create_lead(
+        request.model_copy(update={"full_name": "Someone Else", "summary": "retried"})
+    )
+
+    assert replay.lead_id == first.lead_id
+    assert replay.full_name == "Pat Client"
+    assert replay.summary is None
+    assert await session.scalar(select(func.count()).select_from(Lead)) == 1
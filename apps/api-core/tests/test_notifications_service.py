@@ -0,0 +1,48 @@
+"""Unit tests for NotificationsService."""
+
+from __future__ import annotations
+
+import pytest
+from api_core.database.models import Notification
+from api_core.models.notifications import NotificationCreateRequest
+from api_core.services.notifications_service import NotificationsService
+from sqlalchemy import func, select
+
+
+def _request(**overrides) -> NotificationCreateRequest:
+    values = {
+        "firm_id": "firm-1",
+        "channel": "email",
+        "to": "pat@example.com",
+        "subject": "Hello",
+        "message": "First message",
+        "idempotency_key": "notification-key",
+    }
+    values.update(overrides)
+    return NotificationCreateRequest(**values)
+
+
+@pytest.mark.asyncio
+async def test_create_notification_queues_new_key(session):
+    """Test that a new idempotency key creates a queued outbox record."""
+    response = await NotificationsService(session).create_notification(_request())
+
+    notification = await session.get(Notification, response.notification_id)
+    assert notification.status == "queued"
+    assert notification.message == "First message"
+
+
+@pytest.mark.asyncio
+async def test_create_notification_replayed_key_returns_original(session):
+    """Test that creating twice with one idempotency key keeps a single, unchanged record."""
+    service = NotificationsService(session)
+
+    first = await service.create_notification(_request())
+    replay = await service.create_notification(
+        _request(to="other@example.com", message="Retried message")
+    )
+
+    assert replay.notification_id == first.notification_id
+    assert replay.to == "pat@example.com"
+    assert replay.message == "First message"
+    assert await session.scalar(select(func.count()).select_from(Notification)) == 1
@@ -0,0 +1,61 @@
+"""Unit tests for the Twilio phone number pool repository."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from api_core.exceptions import ConflictError, NotFoundError
+from api_core.repositories.phone_number_pool_repository import PhoneNumberPoolRepository
+
+
+@pytest.mark.asyncio
+async def test_add_to_pool_creates_available_row(session):
+    """Test adding a new number to the pool."""
+    repo = PhoneNumberPoolRepository(session)
+
+    row = await repo.add_to_pool("+15551230001", "PN001", "ACPOOL")
+
+    assert row.id is not None
+    assert row.status == "available"
+    assert row.created_at is not None
+
+
+@pytest.mark.asyncio
+async def test_mark_assigned_and_return_to_pool(session):
+    """Test assigning a pool number and returning it on terminate."""
+    repo = PhoneNumberPoolRepository(session)
+    row = await repo.add_to_pool("+15551230002", "PN002", "ACPOOL")
+    firm_id = str(uuid4())
+
+    assigned = await repo.mark_assigned(row.id, firm_id)
+    assert assigned.status == "assigned"
+    assert assigned.firm_id == firm_id
+    assert isinstance(assigned.assigned_at, datetime)
+
+    returned = await repo.add_to_pool("+15551230002", "PN002", "ACPOOL2")
+    assert returned.id == row.id
+    assert returned.status == "available"
+    assert returned.firm_id is None
+    assert returned.pool_account_sid == "ACPOOL2"
+
+
+@pytest.mark.asyncio
+async def test_mark_assigned_conflict_when_not_available(session):
+    """Test that an already-assigned number cannot be claimed again."""
+    repo = PhoneNumberPoolRepository(session)
+    row = await repo.add_to_pool("+15551230003", "PN003", "ACPOOL")
+    await repo.mark_assigned(row.id, str(uuid4()))
+
+    with pytest.raises(ConflictError):
+        await repo.mark_assigned(row.id, str(uuid4()))
+
+
+@pytest.mark.asyncio
+async def test_mark_assigned_not_found(session):
+    """Test assigning a pool row that does not exist."""
+    repo = PhoneNumberPoolRepository(session)
+
+    with pytest.raises(NotFoundError):
+        await repo.mark_assigned(str(uuid4()), str(uuid4()))
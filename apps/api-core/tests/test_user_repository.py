@@ -0,0 +1,153 @@
+"""Unit tests for UserRepository."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+from api_core.database.models import hash_token
+from api_core.exceptions import ConflictError
+from api_core.repositories.user_repository import UserRepository
+from sqlalchemy import event
+
+
+@pytest.mark.asyncio
+async def test_create_user_normalizes_email(session):
+    """Test that new users are stored and found by their normalized email."""
+    repo = UserRepository(session)
+
+    user = await repo.create_user(email=" New.User@Example.com", name="New User")
+
+    assert user.email == "new.user@example.com"
+    assert user.normalized_email == "new.user@example.com"
+    assert (await repo.get_by_email("NEW.USER@example.com")).id == user.id
+
+
+@pytest.mark.asyncio
+async def test_create_user_rejects_case_variant_email(session):
+    """Test that an email differing only in case conflicts with the existing user."""
+    repo = UserRepository(session)
+    await repo.create_user(email="dup@example.com", name="First")
+
+    with pytest.raises(ConflictError, match="email"):
+        await repo.create_user(email="DUP@example.com", name="Second")
+
+
+@pytest.mark.asyncio
+async def test_create_user_rejects_duplicate_google_id(session):
+    """Test that a Google ID already linked to another user conflicts."""
+    repo = UserRepository(session)
+    await repo.create_user(email="first@example.com", name="First", google_id="g-123")
+
+    with pytest.raises(ConflictError, match="Google ID"):
+        await repo.create_user(email="second@example.com", name="Second", google_id="g-123")
+
+
+@pytest.mark.asyncio
+async def test_search_users_returns_page_and_total(session):
+    """Test that search returns the requested page with the total match count."""
+    repo = UserRepository(session)
+    for i in range(5):
+        await repo.create_user(email=f"search{i}@example.com", name=f"Searcher {i}")
+    await repo.create_user(email="other@example.com", name="Other")
+
+    users, total = await repo.search_users(query="searcher", skip=1, limit=2)
+    assert len(users) == 2
+    assert total == 5
+
+    users, total = await repo.search_users(query="searcher", skip=10, limit=2)
+    assert users == []
+    assert total == 5
+
+
+@pytest.mark.asyncio
+async def test_identity_lookups_are_memoized_until_write(engine, session):
+    """Test that repeat lookups skip the database and a write invalidates them."""
+    repo = UserRepository(session)
+    statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "after_cursor_execute", record_statement)
+    try:
+        assert await repo.get_by_google_id("g-memo") is None
+        assert await repo.get_by_google_id("g-memo") is None
+        assert len(statements) == 1
+
+        user = await repo.create_user(email="memo@example.com", name="Memo", google_id="g-memo")
+        statements.clear()
+        assert (await repo.get_by_google_id("g-memo")).id == user.id
+        assert (await repo.get_by_google_id("g-memo")).id == user.id
+        assert len(statements) == 1
+    finally:
+        event.remove(engine.sync_engine, "after_cursor_execute", record_statement)
+
+
+@pytest.mark.asyncio
+async def test_fixed_field_setters_update_in_place(session):
+    """Test that setters return the updated row and refresh the loaded instance."""
+    repo = UserRepository(session)
+    user = await repo.create_user(email="setter@example.com", name="Setter")
+
+    updated = await repo.set_email_verification_token(user.id, "verify-token")
+    assert updated is user
+    assert user.email_verification_token == hash_token("verify-token")
+    assert (await repo.get_by_verification_token("verify-token")).id == user.id
+
+    assert (await repo.deactivate_user(user.id)).is_active is False
+    assert await repo.activate_user("missing-user-id") is None
+
+
+@pytest.mark.asyncio
+async def test_token_lookup_misses_are_cached_until_issued(engine, session):
+    """Test that a missed token lookup is remembered until that token is issued."""
+    repo = UserRepository(session)
+    user = await repo.create_user(email="reset@example.com", name="Reset")
+    statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "after_cursor_execute", record_statement)
+    try:
+        assert await repo.get_by_reset_token("reset-miss-token") is None
+        assert await repo.get_by_reset_token("reset-miss-token") is None
+        assert len(statements) == 1
+    finally:
+        event.remove(engine.sync_engine, "after_cursor_execute", record_statement)
+
+    await repo.set_password_reset_token(user.id, "reset-miss-token")
+    assert (await repo.get_by_reset_token("reset-miss-token")).id == user.id
+
+
+@pytest.mark.asyncio
+async def test_iter_search_users_streams_filtered_rows(session):
+    """Test that streamed search applies the filters and limit."""
+    repo = UserRepository(session)
+    created = [
+        await repo.create_user(email=f"stream{i}@example.com", name=f"Streamer {i}")
+        for i in range(4)
+    ]
+    await repo.create_user(email="quiet@example.com", name="Quiet")
+
+    streamed = [user async for user in repo.iter_search_users(query="streamer")]
+    assert {user.id for user in streamed} == {user.id for user in created}
+
+    assert len([user async for user in repo.iter_search_users(query="streamer", limit=3)]) == 3
+
+
+@pytest.mark.asyncio
+async def test_record_failed_login_locks_at_limit(session):
+    """Test that failed logins are counted in SQL and lock the account at the limit."""
+    repo = UserRepository(session)
+    user = await repo.create_user(email="failed@example.com", name="Failed")
+    locked_until = datetime(2030, 1, 1, tzinfo=UTC)
+
+    updated = await repo.record_failed_login(user.id, max_attempts=2, locked_until=locked_until)
+    assert updated.failed_login_attempts == 1
+    assert updated.locked_until is None
+
+    updated = await repo.record_failed_login(user.id, max_attempts=2, locked_until=locked_until)
+    assert updated.failed_login_attempts == 2
+    assert updated.locked_until is not None